@@ -0,0 +1,33 @@
+from netspresso import NetsPresso
+from netspresso.benchmarker import BenchmarkTarget
+from netspresso.enums import DeviceName
+
+###
+# The model is uploaded once and benchmarked on all devices at the same time.
+# Use BenchmarkTarget to set the software version or hardware type of a device,
+# e.g. BenchmarkTarget(device_name=DeviceName.JETSON_NANO, software_version=SoftwareVersion.JETPACK_4_6)
+#
+
+EMAIL = "YOUR_EMAIL"
+PASSWORD = "YOUR_PASSWORD"
+
+netspresso = NetsPresso(email=EMAIL, password=PASSWORD)
+
+# 1. Declare benchmarker
+benchmarker = netspresso.benchmarker_v2()
+
+# 2. Set variables for benchmark
+INPUT_MODEL_PATH = "./outputs/converted/TFLITE_RASPBERRY_PI_4B/TFLITE_RASPBERRY_PI_4B.tflite"
+TARGETS = [
+    DeviceName.RASPBERRY_PI_5,
+    DeviceName.RASPBERRY_PI_4B,
+    BenchmarkTarget(device_name=DeviceName.RASPBERRY_PI_3B_PLUS),
+]
+
+# 3. Run benchmark on all devices
+benchmark_tasks = benchmarker.benchmark_model_on_devices(
+    input_model_path=INPUT_MODEL_PATH,
+    targets=TARGETS,
+)
+for benchmark_task in benchmark_tasks:
+    print(f"{benchmark_task.benchmark_task_info.device_name}: {benchmark_task.benchmark_result.latency} ms")
@@ -0,0 +1,51 @@
+from concurrent.futures import as_completed
+
+from netspresso import NetsPresso
+from netspresso.enums import DeviceName, Framework
+
+###
+# With wait_until_done=False, tasks return a TaskFuture right after they start.
+# The converted model is downloaded in the background when its conversion ends,
+# so each benchmark can start as soon as its own conversion is done.
+#
+
+EMAIL = "YOUR_EMAIL"
+PASSWORD = "YOUR_PASSWORD"
+
+netspresso = NetsPresso(email=EMAIL, password=PASSWORD)
+
+# 1. Declare converter and benchmarker
+converter = netspresso.converter_v2()
+benchmarker = netspresso.benchmarker_v2()
+
+# 2. Start conversions without waiting
+INPUT_MODEL_PATH = "./examples/sample_models/yolo-fastest.onnx"
+DEVICES = [DeviceName.RASPBERRY_PI_4B, DeviceName.RASPBERRY_PI_5]
+conversion_futures = {
+    converter.convert_model(
+        input_model_path=INPUT_MODEL_PATH,
+        output_dir=f"./outputs/converted/async/{device_name}",
+        target_framework=Framework.TENSORFLOW_LITE,
+        target_device_name=device_name,
+        wait_until_done=False,
+    ): device_name
+    for device_name in DEVICES
+}
+
+# 3. Benchmark each converted model as soon as it is ready
+benchmark_futures = []
+for conversion_future in as_completed(conversion_futures):
+    conversion_task = conversion_future.result()
+    if conversion_task.status == "completed":
+        benchmark_futures.append(
+            benchmarker.benchmark_model(
+                input_model_path=conversion_task.converted_model_path,
+                target_device_name=conversion_futures[conversion_future],
+                wait_until_done=False,
+            )
+        )
+
+# A task that is no longer needed can be cancelled with future.cancel()
+for benchmark_future in benchmark_futures:
+    benchmark_task = benchmark_future.result()
+    print(benchmark_task.benchmark_task_info.device_name, benchmark_task.benchmark_result.latency)
@@ -0,0 +1,40 @@
+from netspresso import NetsPresso
+from netspresso.converter import ConvertTarget
+from netspresso.enums import DataType, DeviceName, Framework, SoftwareVersion
+
+###
+# The model is uploaded once and converted for every target at the same time.
+# Each target is saved in its own folder under OUTPUT_DIR, e.g. TENSORFLOW_LITE_RASPBERRY_PI_4B_FP16.
+#
+
+EMAIL = "YOUR_EMAIL"
+PASSWORD = "YOUR_PASSWORD"
+
+netspresso = NetsPresso(email=EMAIL, password=PASSWORD)
+
+# 1. Declare converter
+converter = netspresso.converter_v2()
+
+# 2. Set variables for convert
+INPUT_MODEL_PATH = "./examples/sample_models/yolo-fastest.onnx"
+OUTPUT_DIR = "./outputs/converted/matrix"
+TARGETS = [
+    ConvertTarget(framework=Framework.TENSORFLOW_LITE, device_name=DeviceName.RASPBERRY_PI_4B, data_type=DataType.FP16),
+    ConvertTarget(framework=Framework.TENSORFLOW_LITE, device_name=DeviceName.RASPBERRY_PI_5, data_type=DataType.FP16),
+    ConvertTarget(
+        framework=Framework.TENSORRT,
+        device_name=DeviceName.JETSON_NANO,
+        data_type=DataType.FP16,
+        software_version=SoftwareVersion.JETPACK_4_6,
+    ),
+]
+
+# 3. Run convert for all targets
+conversion_tasks = converter.convert_matrix(
+    input_model_path=INPUT_MODEL_PATH,
+    output_dir=OUTPUT_DIR,
+    targets=TARGETS,
+    max_workers=4,
+)
+for conversion_task in conversion_tasks:
+    print(conversion_task.status, conversion_task.converted_model_path)
@@ -0,0 +1,37 @@
+from netspresso import NetsPresso
+from netspresso.enums import DataType, DeviceName, Framework
+
+EMAIL = "YOUR_EMAIL"
+PASSWORD = "YOUR_PASSWORD"
+
+netspresso = NetsPresso(email=EMAIL, password=PASSWORD)
+
+# 1. Declare converter
+converter = netspresso.converter_v2()
+
+# 2. Convert the model to an INT8 TFLite model
+INPUT_MODEL_PATH = "./examples/sample_models/yolo-fastest.onnx"
+OUTPUT_DIR = "./outputs/converted/TFLITE_INT8_RASPBERRY_PI_4B"
+
+conversion_task = converter.convert_model(
+    input_model_path=INPUT_MODEL_PATH,
+    output_dir=OUTPUT_DIR,
+    target_framework=Framework.TENSORFLOW_LITE,
+    target_device_name=DeviceName.RASPBERRY_PI_4B,
+    target_data_type=DataType.INT8,
+)
+
+# 3. Declare local benchmarker
+benchmarker = netspresso.local_benchmarker()
+
+# 4. Compare the original and the converted model on the local CPU
+#    Each result is appended to the benchmark.json next to its model.
+benchmark_results = benchmarker.benchmark_models(
+    input_model_paths=[INPUT_MODEL_PATH, conversion_task.converted_model_path],
+    num_threads=[1, 4],
+    batch_sizes=[1],
+    iterations=100,
+    warmup=10,
+)
+for result in benchmark_results:
+    print(result.input_model_path, result.benchmark_result)
@@ -0,0 +1,33 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from urllib import request
+
+import numpy as np
+
+from netspresso.inferencer.server import InferenceServer
+
+# 1. Start a local server with warm sessions of the sample model
+server = InferenceServer(
+    models={"yolox": "./examples/sample_models/yolox_auto_compress_0.7.onnx"},
+    port=0,
+    num_sessions=2,
+    max_batch_size=8,
+).start()
+
+
+# 2. Send requests (input array saved with np.save, outputs returned as .npz)
+def infer(data):
+    buffer = io.BytesIO()
+    np.save(buffer, data)
+    req = request.Request(f"{server.url}/v1/models/yolox/infer", data=buffer.getvalue(), method="POST")
+    with request.urlopen(req) as response:
+        return dict(np.load(io.BytesIO(response.read())))
+
+
+inputs = [np.random.rand(1, 3, 512, 512).astype("float32") for _ in range(32)]
+with ThreadPoolExecutor(max_workers=16) as executor:
+    outputs = list(executor.map(infer, inputs))
+
+print({name: output.shape for name, output in outputs[0].items()})
+
+server.close()
@@ -0,0 +1,35 @@
+from netspresso import NetsPresso
+
+###
+# Stages run as soon as their dependencies are done, so both conversions and both benchmarks run in parallel.
+# Completed stages are recorded in WORK_DIR/pipeline.json. If a stage fails, run the script again:
+# the completed stages are skipped and the pipeline resumes from the failed one.
+#
+
+EMAIL = "YOUR_EMAIL"
+PASSWORD = "YOUR_PASSWORD"
+
+netspresso = NetsPresso(email=EMAIL, password=PASSWORD)
+
+# 1. Declare pipeline from a YAML file
+pipeline = netspresso.pipeline(yaml_path="./examples/pipeline/pipeline.yaml")
+
+# Or declare the same stages in Python
+# pipeline = netspresso.pipeline(work_dir="./outputs/pipeline")
+# pipeline.add_stage(
+#     name="convert_rpi4",
+#     task="convert",
+#     input_model_path="./examples/sample_models/yolo-fastest.onnx",
+#     params={"target_framework": "tensorflow_lite", "target_device_name": "RaspberryPi4B"},
+# )
+# pipeline.add_stage(
+#     name="benchmark_rpi4",
+#     task="benchmark",
+#     depends_on="convert_rpi4",
+#     params={"target_device_name": "RaspberryPi4B"},
+# )
+
+# 2. Run pipeline
+results = pipeline.run()
+for name, result in results.items():
+    print(name, result.status, "cached" if result.cached else "", result.output_model_path or result.error)
@@ -1,7 +1,16 @@
+from concurrent.futures import CancelledError
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Optional
+
 from loguru import logger
 
 from netspresso.clients.auth import TokenHandler, auth_client
-from netspresso.enums import ServiceCredit, ServiceTask, Status
+from netspresso.clients.launcher import launcher_client_v2
+from netspresso.clients.launcher.v2.schemas import ResponseModelItem
+from netspresso.clients.utils.task_waiter import DEFAULT_TASK_TIMEOUT, TaskFuture, TaskNotifier, TaskWaiter
+from netspresso.clients.utils.upload_cache import upload_cache
+from netspresso.enums import ServiceCredit, ServiceTask, Status, TaskStatusForDisplay
 from netspresso.exceptions.common import NotEnoughCreditException
 from netspresso.metadata.common import BaseMetadata
 
@@ -11,11 +20,11 @@ class NetsPressoBase:
         self.token_handler = token_handler
         self.auth_client = auth_client
 
-    def check_credit_balance(self, service_task: ServiceTask):
+    def check_credit_balance(self, service_task: ServiceTask, num_tasks: int = 1):
         current_credit = self.auth_client.get_credit(
             access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
         )
-        service_credit = ServiceCredit.get_credit(service_task)
+        service_credit = ServiceCredit.get_credit(service_task) * num_tasks
         service_task_name = service_task.name.replace("_", " ").lower()
         if current_credit < service_credit:
             logger.error(
@@ -32,9 +41,158 @@ class NetsPressoBase:
             )
             logger.info(f"{service_credit} credits have been consumed. Remaining Credit: {remaining_credit}")
 
-    def validate_token_and_check_credit(self, service_task: ServiceTask):
+    def validate_token_and_check_credit(self, service_task: ServiceTask, num_tasks: int = 1):
         self.token_handler.validate_token()
-        self.check_credit_balance(service_task=service_task)
+        self.check_credit_balance(service_task=service_task, num_tasks=num_tasks)
+
+    def upload_model_file(self, client, input_model_path: str) -> ResponseModelItem:
+        """Upload and validate a model with a launcher client (converter, benchmarker or quantizer).
+
+        If the same file was already uploaded for the same task, the cached ai_model_id is reused
+        and nothing is uploaded. See UploadCache.
+
+        Args:
+            client: launcher_client_v2.converter, launcher_client_v2.benchmarker or launcher_client_v2.quantizer.
+            input_model_path (str): The file path where the model is located.
+
+        Returns:
+            ResponseModelItem: Validated model.
+        """
+
+        cache_key = None
+        if upload_cache.enabled:
+            cache_key = upload_cache.make_key(
+                input_model_path,
+                launcher_client_v2.url,
+                self.token_handler.email,
+                client.task_type,
+                Path(input_model_path).name,
+            )
+            cached = upload_cache.get(cache_key)
+            if cached is not None:
+                return ResponseModelItem(**cached)
+
+        # Get presigned_model_upload_url
+        presigned_url_response = client.presigned_model_upload_url(
+            access_token=self.token_handler.tokens.access_token,
+            input_model_path=input_model_path,
+        )
+
+        # Upload model_file
+        client.upload_model_file(
+            access_token=self.token_handler.tokens.access_token,
+            input_model_path=input_model_path,
+            presigned_upload_url=presigned_url_response.data.presigned_upload_url,
+        )
+
+        # Validate model_file
+        validate_model_response = client.validate_model_file(
+            access_token=self.token_handler.tokens.access_token,
+            input_model_path=input_model_path,
+            ai_model_id=presigned_url_response.data.ai_model_id,
+        )
+
+        if cache_key is not None:
+            upload_cache.put(cache_key, validate_model_response.data.ai_model_id, asdict(validate_model_response))
+
+        return validate_model_response
+
+    def wait_for_task(
+        self,
+        client,
+        task_id: str,
+        sleep_interval: float = 30,
+        eta_key: Optional[str] = None,
+        timeout: Optional[float] = DEFAULT_TASK_TIMEOUT,
+        notifier: Optional[TaskNotifier] = None,
+    ):
+        """Read a launcher task until it is finished, failed or timed out. See TaskWaiter.
+
+        Args:
+            client: launcher_client_v2.converter, launcher_client_v2.benchmarker or launcher_client_v2.quantizer.
+            task_id (str): ID of the task.
+            sleep_interval (float): Longest interval between two reads in seconds. Default is 30.
+            eta_key (str, optional): Key of tasks expected to take the same time, e.g. the task type and device.
+            timeout (float, optional): Maximum seconds to wait. Default is no limit, or NP_TASK_TIMEOUT.
+            notifier (TaskNotifier, optional): Push channel reading the task as soon as the server announces a change.
+
+        Returns:
+            The last task response read.
+        """
+
+        def read_task():
+            self.token_handler.validate_token()
+            return client.read_task(access_token=self.token_handler.tokens.access_token, task_id=task_id)
+
+        def is_done(response) -> bool:
+            return response.data.status in [
+                TaskStatusForDisplay.FINISHED,
+                TaskStatusForDisplay.ERROR,
+                TaskStatusForDisplay.USER_CANCEL,
+                TaskStatusForDisplay.TIMEOUT,
+            ]
+
+        waiter = TaskWaiter(
+            read_task=read_task,
+            is_done=is_done,
+            max_interval=sleep_interval,
+            timeout=timeout,
+            eta_key=eta_key,
+            notifier=notifier,
+        )
+
+        return waiter.wait()
+
+    def submit_task(
+        self,
+        client,
+        task_id: str,
+        metadata: BaseMetadata,
+        service_task: ServiceTask,
+        finish: Callable[..., BaseMetadata],
+        save: Callable[[BaseMetadata], None],
+        cancel_task: Callable[[str], object],
+        sleep_interval: float = 30,
+        eta_key: Optional[str] = None,
+    ) -> TaskFuture:
+        """Wait for a started launcher task in the background, and return a TaskFuture of its metadata.
+
+        When the task ends, finish(response) downloads its result and updates the metadata as the blocking
+        call does. Errors end in Status.ERROR and cancellation in Status.STOPPED. The metadata is saved
+        with save(metadata) in every case.
+
+        Args:
+            client: launcher_client_v2.converter, launcher_client_v2.benchmarker or launcher_client_v2.quantizer.
+            task_id (str): ID of the task.
+            metadata (BaseMetadata): Metadata of the task.
+            service_task (ServiceTask): Service of the task, for logs.
+            finish (Callable[..., BaseMetadata]): Updates the metadata from the last task response read.
+            save (Callable[[BaseMetadata], None]): Saves the metadata.
+            cancel_task (Callable[[str], object]): Cancels the task on the server, e.g. cancel_conversion_task.
+            sleep_interval (float): Longest interval between two reads in seconds. Default is 30.
+            eta_key (str, optional): Key of tasks expected to take the same time, e.g. the task type and device.
+
+        Returns:
+            TaskFuture: Future of the metadata.
+        """
+
+        def run(notifier: TaskNotifier) -> BaseMetadata:
+            result = metadata
+            try:
+                response = self.wait_for_task(
+                    client, task_id=task_id, sleep_interval=sleep_interval, eta_key=eta_key, notifier=notifier
+                )
+                result = finish(response)
+            except CancelledError:
+                result = self.handle_stop(metadata, service_task)
+            except Exception as e:
+                result = self.handle_error(metadata, service_task, e.args[0])
+            finally:
+                save(result)
+
+            return result
+
+        return TaskFuture(run, task_id=task_id, cancel_task=cancel_task)
 
     def handle_error(self, metadata: BaseMetadata, task_name: ServiceTask, error_message: str):
         metadata.status = Status.ERROR
@@ -1,3 +1,5 @@
+from netspresso.benchmarker.local import LocalBenchmarker
+from netspresso.benchmarker.schema import BenchmarkTarget
 from netspresso.benchmarker.v2.benchmarker import BenchmarkerV2
 
-__all__ = ["BenchmarkerV2"]
+__all__ = ["BenchmarkerV2", "BenchmarkTarget", "LocalBenchmarker"]
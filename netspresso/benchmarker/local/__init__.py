@@ -0,0 +1,3 @@
+from netspresso.benchmarker.local.benchmarker import LocalBenchmarker
+
+__all__ = ["LocalBenchmarker"]
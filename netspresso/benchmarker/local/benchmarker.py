@@ -0,0 +1,234 @@
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+from netspresso.benchmarker.results import append_results
+from netspresso.enums import Runtime, Status
+from netspresso.enums.model import DataType, Framework
+from netspresso.inferencer.inferencer import CustomInferencer
+from netspresso.metadata.benchmarker import BenchmarkerMetadata, LocalBenchmarkResult
+from netspresso.utils import FileHandler
+from netspresso.utils.metadata import MetadataHandler
+
+RUNTIME_FRAMEWORKS = {
+    Runtime.ONNX: (Framework.ONNX, "ONNX"),
+    Runtime.TFLITE: (Framework.TENSORFLOW_LITE, "TensorFlow Lite"),
+}
+
+
+def reset_peak_rss():
+    """Reset the kernel's peak RSS counter of this process (Linux only), so that the next reading covers one run."""
+
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB, or 0 on Windows where it is not measured."""
+
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    if sys.platform == "win32":
+        return 0.0
+
+    # Unix only
+    import resource
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if platform.system() == "Darwin" else max_rss / 1024
+
+
+class LocalBenchmarker:
+    def __init__(self) -> None:
+        """Initialize the LocalBenchmarker.
+
+        Benchmarks ONNX and TFLite models on the CPU of this machine, e.g. the outputs of ConverterV2,
+        Quantizer or CompressorV2, as a quick estimate before running BenchmarkerV2 on real devices.
+        Results are appended to the benchmark.json next to the model, in the same format as BenchmarkerV2.
+        """
+
+        self.device_name = platform.processor() or platform.machine()
+
+    def get_data_type(self, input_model_path: str, inputs: Dict) -> DataType:
+        metadata_path = Path(input_model_path).parent / "metadata.json"
+        try:
+            if metadata_path.exists():
+                metadata = MetadataHandler.load_json(metadata_path)
+                data_type = metadata.get("convert_task_info", {}).get("data_type")
+                if data_type:
+                    return data_type
+        except (FileNotFoundError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Error loading metadata: {e}")
+
+        input_dtypes = [value.dtype for value in inputs.values()]
+        if any(dtype in [np.int8, np.uint8] for dtype in input_dtypes):
+            return DataType.INT8
+        if any(dtype == np.float16 for dtype in input_dtypes):
+            return DataType.FP16
+
+        return DataType.FP32
+
+    def create_inputs(
+        self, inferencer: CustomInferencer, batch_size: int, input_shape: Optional[Sequence[int]] = None
+    ) -> Dict:
+        inputs = {}
+        for key, (shape, dtype) in inferencer.get_input_specs(batch_size).items():
+            if input_shape is not None:
+                shape = (batch_size, *input_shape[1:])
+            if None in shape:
+                raise ValueError(f"Input '{key}' has dynamic dimensions {shape}. Please set input_shape.")
+
+            if np.issubdtype(dtype, np.integer):
+                dtype_info = np.iinfo(dtype)
+                inputs[key] = np.random.randint(dtype_info.min, dtype_info.max, size=shape, dtype=dtype)
+            else:
+                inputs[key] = np.random.rand(*shape).astype(dtype)
+
+        return inputs
+
+    def measure(self, inferencer: CustomInferencer, inputs: Dict, iterations: int, warmup: int) -> Tuple[np.ndarray, float]:
+        for _ in range(warmup):
+            inferencer._run_session(inputs)
+
+        reset_peak_rss()
+        latencies = np.empty(iterations)
+        for i in range(iterations):
+            start = time.perf_counter()
+            inferencer._run_session(inputs)
+            latencies[i] = (time.perf_counter() - start) * 1000
+
+        return latencies, get_peak_rss_mb()
+
+    def benchmark_model(
+        self,
+        input_model_path: str,
+        num_threads: int = 1,
+        batch_size: int = 1,
+        iterations: int = 100,
+        warmup: int = 10,
+        input_shape: Optional[Sequence[int]] = None,
+        save_result: bool = True,
+    ) -> BenchmarkerMetadata:
+        """Benchmark the model on the local CPU.
+
+        Args:
+            input_model_path (str): The file path where the ONNX or TFLite model is located.
+            num_threads (int): Number of intra-op threads of the runtime. Default is 1.
+            batch_size (int): Batch size of the random inputs. Models with a fixed batch size only support it. Default is 1.
+            iterations (int): Number of measured runs. Default is 100.
+            warmup (int): Number of runs before measuring. Default is 10.
+            input_shape (Sequence[int], optional): Input shape in the runtime's layout, required when the model
+                has dynamic dimensions other than the batch. The batch dimension is replaced with batch_size.
+            save_result (bool): Append the result to the benchmark.json next to the model. Default is True.
+
+        Returns:
+            BenchmarkerMetadata: Benchmark metadata. benchmark_result is a LocalBenchmarkResult with the mean
+                latency in ms, its p50/p95/p99, the throughput in samples/sec and the peak RSS in MB.
+        """
+
+        FileHandler.check_input_model_path(input_model_path)
+        metadata = BenchmarkerMetadata(input_model_path=Path(input_model_path).resolve().as_posix())
+
+        try:
+            inferencer = CustomInferencer(input_model_path=input_model_path, num_threads=num_threads)
+            if inferencer.runtime == Runtime.ONNX:
+                inferencer.set_num_threads(num_threads)
+            inputs = self.create_inputs(inferencer, batch_size, input_shape)
+            actual_batch_size = next(iter(inputs.values())).shape[0]
+            if actual_batch_size != batch_size:
+                logger.warning(f"The model has a fixed batch size. Benchmarking with batch size {actual_batch_size}.")
+                batch_size = actual_batch_size
+
+            framework, display_framework = RUNTIME_FRAMEWORKS[inferencer.runtime]
+            task_info = metadata.benchmark_task_info
+            task_info.framework = framework
+            task_info.display_framework = display_framework
+            task_info.display_device_name = f"Local CPU ({self.device_name})"
+            task_info.display_brand_name = platform.system()
+            task_info.data_type = self.get_data_type(input_model_path, inputs)
+
+            latencies, peak_rss = self.measure(inferencer, inputs, iterations, warmup)
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            metadata.benchmark_result = LocalBenchmarkResult(
+                memory_footprint_cpu=round(peak_rss, 2),
+                latency=round(float(latencies.mean()), 3),
+                file_size=round(Path(input_model_path).stat().st_size / (1024 * 1024), 2),
+                latency_p50=round(float(p50), 3),
+                latency_p95=round(float(p95), 3),
+                latency_p99=round(float(p99), 3),
+                throughput=round(batch_size * 1000 / float(latencies.mean()), 2),
+                batch_size=batch_size,
+                num_threads=num_threads,
+                iterations=iterations,
+            )
+            metadata.status = Status.COMPLETED
+            logger.info(
+                f"{Path(input_model_path).name} (threads={num_threads}, batch={batch_size}) "
+                f"mean: {metadata.benchmark_result.latency} ms, p95: {metadata.benchmark_result.latency_p95} ms, "
+                f"throughput: {metadata.benchmark_result.throughput} samples/sec, peak RSS: {metadata.benchmark_result.memory_footprint_cpu} MB"
+            )
+        except Exception as e:
+            logger.error(f"Local benchmark failed: {e}")
+            metadata.status = Status.ERROR
+            metadata.update_message(exception_detail=str(e))
+        except KeyboardInterrupt:
+            logger.warning("Local benchmark was interrupted by the user.")
+            metadata.status = Status.STOPPED
+
+        if save_result:
+            self.save_result(metadata)
+
+        return metadata
+
+    def benchmark_models(
+        self,
+        input_model_paths: List[str],
+        num_threads: Union[int, List[int]] = 1,
+        batch_sizes: Union[int, List[int]] = 1,
+        iterations: int = 100,
+        warmup: int = 10,
+        input_shape: Optional[Sequence[int]] = None,
+    ) -> List[BenchmarkerMetadata]:
+        """Benchmark several models, e.g. an original model and its converted or quantized versions, on every
+        combination of thread count and batch size.
+
+        Returns:
+            List[BenchmarkerMetadata]: Benchmark metadata per model, thread count and batch size.
+        """
+
+        num_threads = [num_threads] if isinstance(num_threads, int) else num_threads
+        batch_sizes = [batch_sizes] if isinstance(batch_sizes, int) else batch_sizes
+
+        metadatas = []
+        for input_model_path in input_model_paths:
+            for threads in num_threads:
+                for batch_size in batch_sizes:
+                    metadata = self.benchmark_model(
+                        input_model_path=input_model_path,
+                        num_threads=threads,
+                        batch_size=batch_size,
+                        iterations=iterations,
+                        warmup=warmup,
+                        input_shape=input_shape,
+                    )
+                    metadatas.append(metadata)
+
+        return metadatas
+
+    def save_result(self, metadata: BenchmarkerMetadata):
+        append_results([metadata], Path(metadata.input_model_path).parent)
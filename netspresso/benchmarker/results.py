@@ -0,0 +1,47 @@
+import threading
+from pathlib import Path
+from typing import List
+
+from netspresso.metadata.benchmarker import BenchmarkerMetadata
+from netspresso.utils import FileHandler
+from netspresso.utils.metadata import MetadataHandler
+
+# Serializes updates of benchmark.json within this process, for the cloud and local benchmarkers alike
+results_lock = threading.Lock()
+
+
+def _load_results(output_dir: Path) -> List:
+    file_path = output_dir / "benchmark.json"
+
+    return MetadataHandler.load_json(file_path) if FileHandler.check_exists(file_path) else []
+
+
+def append_results(metadatas: List[BenchmarkerMetadata], output_dir: Path) -> List[int]:
+    """Append metadatas to the benchmark.json of output_dir in one write.
+
+    Returns:
+        List[int]: Index of each entry in benchmark.json, for updating it with replace_result.
+    """
+
+    with results_lock:
+        results = _load_results(output_dir)
+        results.extend(metadatas)
+        MetadataHandler.save_benchmark_result(data=results, folder_path=output_dir)
+
+    return list(range(len(results) - len(metadatas), len(results)))
+
+
+def replace_result(metadata: BenchmarkerMetadata, output_dir: Path, index: int):
+    """Replace the entry at index in the benchmark.json of output_dir, as returned by append_results.
+
+    Other entries may have been added since, so the file is read again. Entries are only appended or
+    replaced, so the index of an entry does not change.
+    """
+
+    with results_lock:
+        results = _load_results(output_dir)
+        if index < len(results):
+            results[index] = metadata
+        else:
+            results.append(metadata)
+        MetadataHandler.save_benchmark_result(data=results, folder_path=output_dir)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion
+
+
+@dataclass
+class BenchmarkTarget:
+    device_name: Union[str, DeviceName]
+    software_version: Optional[Union[str, SoftwareVersion]] = None
+    hardware_type: Optional[Union[str, HardwareType]] = None
@@ -1,14 +1,18 @@
-import time
+from concurrent.futures import FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from loguru import logger
 
 from netspresso.base import NetsPressoBase
+from netspresso.benchmarker.results import append_results, replace_result
+from netspresso.benchmarker.schema import BenchmarkTarget
 from netspresso.clients.auth import TokenHandler
 from netspresso.clients.auth.response_body import UserResponse
 from netspresso.clients.launcher import launcher_client_v2
 from netspresso.clients.launcher.v2.schemas.task.benchmark.response_body import BenchmarkTask
+from netspresso.clients.utils.task_waiter import TaskFuture
+from netspresso.clients.utils.upload_cache import upload_cache
 from netspresso.enums import Status, TaskStatusForDisplay
 from netspresso.enums.credit import ServiceTask
 from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion
@@ -37,7 +41,7 @@ class BenchmarkerV2(NetsPressoBase):
 
         return DataType.FP32
 
-    def initialize_metadata(self, input_model_path: str):
+    def initialize_metadata(self, input_model_path: str) -> Tuple[BenchmarkerMetadata, int]:
         def create_metadata_with_status(status, error_message=None):
             metadata = BenchmarkerMetadata()
             metadata.status = status
@@ -54,18 +58,40 @@ class BenchmarkerV2(NetsPressoBase):
             warning_message = "Benchmark task was interrupted by the user."
             metadata = create_metadata_with_status(Status.STOPPED, warning_message)
         finally:
-            # Load existing metadata if available
-            metadatas = []
-            output_dir = Path(input_model_path).parent
-            file_path = output_dir / "benchmark.json"
-            if FileHandler.check_exists(file_path):
-                metadatas = MetadataHandler.load_json(file_path)
-
             metadata.input_model_path = Path(input_model_path).resolve().as_posix()
-            metadatas.append(metadata)
-            MetadataHandler.save_benchmark_result(data=metadatas, folder_path=output_dir)
+            (index,) = self.save_results([metadata], Path(input_model_path).parent)
 
-        return metadatas
+        return metadata, index
+
+    def _start_task(self, validate_model_response, target_device_name, target_software_version, target_hardware_type):
+        try:
+            return launcher_client_v2.benchmarker.start_task(
+                access_token=self.token_handler.tokens.access_token,
+                input_model_id=validate_model_response.data.ai_model_id,
+                data_type=validate_model_response.data.detail.data_type,
+                target_device_name=target_device_name,
+                hardware_type=target_hardware_type,
+                input_layer=validate_model_response.data.detail.input_layers[0],
+                software_version=target_software_version,
+            )
+        except Exception:
+            # A cached model may have been deleted on the server, so upload it again next time
+            upload_cache.evict(validate_model_response.data.ai_model_id)
+            raise
+
+    def _update_result(
+        self, metadata: BenchmarkerMetadata, benchmark_response, validate_model_response
+    ) -> BenchmarkerMetadata:
+        if benchmark_response.data.status == TaskStatusForDisplay.FINISHED:
+            metadata.status = Status.COMPLETED
+            metadata.benchmark_result = benchmark_response.data.benchmark_result.to(
+                file_size=validate_model_response.data.file_size_in_mb
+            )
+            logger.info(f"Benchmark task on {metadata.benchmark_task_info.device_name} was completed successfully.")
+        else:
+            metadata = self.handle_error(metadata, ServiceTask.MODEL_BENCHMARK, benchmark_response.data.error_log)
+
+        return metadata
 
     def benchmark_model(
         self,
@@ -75,7 +101,7 @@ class BenchmarkerV2(NetsPressoBase):
         target_hardware_type: Optional[Union[str, HardwareType]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> BenchmarkerMetadata:
+    ) -> Union[BenchmarkerMetadata, TaskFuture[BenchmarkerMetadata]]:
         """Benchmark the specified model on the specified device.
 
         Args:
@@ -84,97 +110,183 @@ class BenchmarkerV2(NetsPressoBase):
             target_software_version (Union[str, SoftwareVersion], optional): Target software version. Required if target_device_name is one of the Jetson devices.
             target_hardware_type (Union[str, HardwareType], optional): Hardware type. Acceleration options for processing the model inference.
             wait_until_done (bool): If True, wait for the benchmark result before returning the function.
-                                If False, request the benchmark and return the function immediately.
+                                If False, request the benchmark and return a TaskFuture immediately.
+                                The result is saved in the background when the benchmark ends.
+            sleep_interval (int): Longest interval in seconds between checks of the task. Default is 30.
 
         Raises:
             e: If an error occurs during the benchmarking of the model.
 
         Returns:
-            BenchmarkerMetadata: Benchmark metadata.
+            Union[BenchmarkerMetadata, TaskFuture[BenchmarkerMetadata]]: Benchmark metadata,
+                or a future of it if wait_until_done is False.
         """
 
         FileHandler.check_input_model_path(input_model_path)
-        metadatas = self.initialize_metadata(input_model_path=input_model_path)
+        metadata, index = self.initialize_metadata(input_model_path=input_model_path)
+        output_dir = Path(input_model_path).parent
 
+        future = None
         try:
-            metadata: BenchmarkerMetadata = metadatas[-1]
-            output_dir = Path(input_model_path).parent
             if metadata.status in [Status.ERROR, Status.STOPPED]:
-                return metadata
+                return metadata if wait_until_done else TaskFuture.from_result(metadata)
 
             self.validate_token_and_check_credit(service_task=ServiceTask.MODEL_BENCHMARK)
 
-            # Get presigned_model_upload_url
-            presigned_url_response = launcher_client_v2.benchmarker.presigned_model_upload_url(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_path=input_model_path,
-            )
-
-            # Upload model_file
-            launcher_client_v2.benchmarker.upload_model_file(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_path=input_model_path,
-                presigned_upload_url=presigned_url_response.data.presigned_upload_url,
-            )
-
-            # Validate model_file
-            validate_model_response = launcher_client_v2.benchmarker.validate_model_file(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_path=input_model_path,
-                ai_model_id=presigned_url_response.data.ai_model_id,
-            )
+            validate_model_response = self.upload_model_file(launcher_client_v2.benchmarker, input_model_path)
 
             # Start benchmark task
-            benchmark_response = launcher_client_v2.benchmarker.start_task(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_id=presigned_url_response.data.ai_model_id,
-                data_type=validate_model_response.data.detail.data_type,
-                target_device_name=target_device_name,
-                hardware_type=target_hardware_type,
-                input_layer=validate_model_response.data.detail.input_layers[0],
-                software_version=target_software_version,
+            benchmark_response = self._start_task(
+                validate_model_response, target_device_name, target_software_version, target_hardware_type
             )
 
             metadata.benchmark_task_info = benchmark_response.data.to()
             metadata.benchmark_task_info.data_type = self.get_data_type(output_dir)
-            MetadataHandler.save_benchmark_result(data=metadatas, folder_path=output_dir)
+            self.save_result(metadata, output_dir, index)
+
+            def finish(benchmark_response) -> BenchmarkerMetadata:
+                result = self._update_result(metadata, benchmark_response, validate_model_response)
+                if result.status == Status.COMPLETED:
+                    self.print_remaining_credit(service_task=ServiceTask.MODEL_BENCHMARK)
+                return result
 
+            task_id = benchmark_response.data.benchmark_task_id
+            eta_key = f"benchmark:{target_device_name}"
             if wait_until_done:
-                while True:
-                    self.token_handler.validate_token()
-                    benchmark_response = launcher_client_v2.benchmarker.read_task(
-                        access_token=self.token_handler.tokens.access_token,
-                        task_id=benchmark_response.data.benchmark_task_id,
-                    )
-                    if benchmark_response.data.status in [
-                        TaskStatusForDisplay.FINISHED,
-                        TaskStatusForDisplay.ERROR,
-                        TaskStatusForDisplay.TIMEOUT,
-                    ]:
-                        break
-
-                    time.sleep(sleep_interval)
-
-            if benchmark_response.data.status == TaskStatusForDisplay.FINISHED:
-                self.print_remaining_credit(service_task=ServiceTask.MODEL_BENCHMARK)
-                metadata.status = Status.COMPLETED
-                metadata.benchmark_result = benchmark_response.data.benchmark_result.to(
-                    file_size=validate_model_response.data.file_size_in_mb
+                benchmark_response = self.wait_for_task(
+                    launcher_client_v2.benchmarker, task_id=task_id, sleep_interval=sleep_interval, eta_key=eta_key
                 )
-                logger.info("Benchmark task was completed successfully.")
+                metadata = finish(benchmark_response)
             else:
-                metadata = self.handle_error(metadata, ServiceTask.MODEL_BENCHMARK, benchmark_response.data.error_log)
+                future = self.submit_task(
+                    launcher_client_v2.benchmarker,
+                    task_id=task_id,
+                    metadata=metadata,
+                    service_task=ServiceTask.MODEL_BENCHMARK,
+                    finish=finish,
+                    save=lambda result: self.save_result(result, output_dir, index),
+                    cancel_task=self.cancel_benchmark_task,
+                    sleep_interval=sleep_interval,
+                    eta_key=eta_key,
+                )
 
         except Exception as e:
             metadata = self.handle_error(metadata, ServiceTask.MODEL_BENCHMARK, e.args[0])
         except KeyboardInterrupt:
             metadata = self.handle_stop(metadata, ServiceTask.MODEL_BENCHMARK)
         finally:
-            metadatas[-1] = metadata
-            MetadataHandler.save_benchmark_result(data=metadatas, folder_path=output_dir)
+            # Once submitted, the result is saved by the future
+            if future is None:
+                self.save_result(metadata, output_dir, index)
+
+        if not wait_until_done:
+            return future if future is not None else TaskFuture.from_result(metadata)
 
         return metadata
 
+    def benchmark_model_on_devices(
+        self,
+        input_model_path: str,
+        targets: List[Union[str, DeviceName, BenchmarkTarget]],
+        max_workers: Optional[int] = None,
+        sleep_interval: int = 30,
+    ) -> List[BenchmarkerMetadata]:
+        """Benchmark the specified model on several devices at once.
+
+        The model is uploaded and validated once and the benchmark tasks run on all devices at the same time,
+        so the call takes about as long as the slowest device instead of the sum of all devices. The entries
+        are added to benchmark.json before the tasks start, and each one is updated when its task starts and
+        when it ends. On KeyboardInterrupt, the running tasks are cancelled on the server.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            targets (List[Union[str, DeviceName, BenchmarkTarget]]): Target devices. Use BenchmarkTarget to set
+                the software version (required for Jetson devices) or the hardware type of a device.
+            max_workers (int, optional): Maximum number of tasks run at the same time. Default is all of them.
+            sleep_interval (int): Longest interval in seconds between checks of each task. Default is 30.
+
+        Returns:
+            List[BenchmarkerMetadata]: Benchmark metadata per target, in the order of targets.
+                A failed target has Status.ERROR and does not stop the others.
+        """
+
+        FileHandler.check_input_model_path(input_model_path)
+        targets = [
+            target if isinstance(target, BenchmarkTarget) else BenchmarkTarget(device_name=target) for target in targets
+        ]
+        output_dir = Path(input_model_path).parent
+        input_model_path = Path(input_model_path).resolve().as_posix()
+        metadatas = [BenchmarkerMetadata(input_model_path=input_model_path) for _ in targets]
+        indexes = self.save_results(metadatas, output_dir)
+        futures: Dict[int, TaskFuture[BenchmarkerMetadata]] = {}
+
+        def start(metadata: BenchmarkerMetadata, target: BenchmarkTarget, index: int) -> TaskFuture:
+            benchmark_response = self._start_task(
+                validate_model_response, target.device_name, target.software_version, target.hardware_type
+            )
+            metadata.benchmark_task_info = benchmark_response.data.to()
+            metadata.benchmark_task_info.data_type = data_type
+            self.save_result(metadata, output_dir, index)
+
+            return self.submit_task(
+                launcher_client_v2.benchmarker,
+                task_id=benchmark_response.data.benchmark_task_id,
+                metadata=metadata,
+                service_task=ServiceTask.MODEL_BENCHMARK,
+                finish=lambda response: self._update_result(metadata, response, validate_model_response),
+                save=lambda result: self.save_result(result, output_dir, index),
+                cancel_task=self.cancel_benchmark_task,
+                sleep_interval=sleep_interval,
+                eta_key=f"benchmark:{target.device_name}",
+            )
+
+        try:
+            self.validate_token_and_check_credit(service_task=ServiceTask.MODEL_BENCHMARK, num_tasks=len(targets))
+
+            validate_model_response = self.upload_model_file(launcher_client_v2.benchmarker, input_model_path)
+            data_type = self.get_data_type(output_dir)
+
+            for i, target in enumerate(targets):
+                running = [future for future in futures.values() if not future.done()]
+                if max_workers and len(running) >= max_workers:
+                    wait(running, return_when=FIRST_COMPLETED)
+                try:
+                    futures[i] = start(metadatas[i], target, indexes[i])
+                except Exception as e:
+                    metadatas[i] = self.handle_error(metadatas[i], ServiceTask.MODEL_BENCHMARK, e.args[0])
+                    self.save_result(metadatas[i], output_dir, indexes[i])
+
+            for i, future in futures.items():
+                metadatas[i] = future.result()
+
+            if any(metadata.status == Status.COMPLETED for metadata in metadatas):
+                self.print_remaining_credit(service_task=ServiceTask.MODEL_BENCHMARK)
+
+        except Exception as e:
+            for i, metadata in enumerate(metadatas):
+                if i not in futures and metadata.status == Status.IN_PROGRESS:
+                    metadatas[i] = self.handle_error(metadata, ServiceTask.MODEL_BENCHMARK, e.args[0])
+                    self.save_result(metadatas[i], output_dir, indexes[i])
+        except KeyboardInterrupt:
+            for future in futures.values():
+                future.cancel()
+            for i, metadata in enumerate(metadatas):
+                if metadata.status == Status.IN_PROGRESS:
+                    metadatas[i] = self.handle_stop(metadata, ServiceTask.MODEL_BENCHMARK)
+                    self.save_result(metadatas[i], output_dir, indexes[i])
+
+        return metadatas
+
+    def save_results(self, metadatas: List[BenchmarkerMetadata], output_dir: Path) -> List[int]:
+        """Append metadatas to the benchmark.json of output_dir. See append_results."""
+
+        return append_results(metadatas, output_dir)
+
+    def save_result(self, metadata: BenchmarkerMetadata, output_dir: Path, index: int):
+        """Replace the entry at index in the benchmark.json of output_dir. See replace_result."""
+
+        replace_result(metadata, output_dir, index)
+
     def get_benchmark_task(self, benchmark_task_id: str) -> BenchmarkTask:
         """Get information about the specified benchmark task using the benchmark task UUID.
 
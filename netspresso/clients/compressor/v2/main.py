@@ -1,7 +1,5 @@
 from dataclasses import asdict
 
-import requests
-from requests_toolbelt import MultipartEncoderMonitor
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 from tqdm import tqdm
 
@@ -26,7 +24,7 @@ from netspresso.clients.compressor.v2.schemas.model import (
     ResponseModelUrl,
 )
 from netspresso.clients.config import Config, ServiceModule, ServiceName
-from netspresso.clients.utils.common import create_multipart_data, create_progress_func, get_headers, progress_callback
+from netspresso.clients.utils.common import get_headers, upload_multipart_file
 from netspresso.clients.utils.requester import Requester
 
 
@@ -57,18 +55,7 @@ class CompressorAPIClient:
 
         file_info = file.files[0][1]
 
-        multipart_data = create_multipart_data(request_data.url, file_info)
-        progress = create_progress_func(multipart_data)
-
-        # Wrap the encoder with MultipartEncoderMonitor
-        monitor = MultipartEncoderMonitor(multipart_data, lambda monitor: progress_callback(monitor, progress))
-
-        headers = get_headers(access_token)
-        headers["Content-Type"] = monitor.content_type
-
-        response = requests.post(url=url, data=monitor, headers=headers, verify=verify_ssl)
-
-        return response.text
+        return upload_multipart_file(url, request_data.url, file_info, get_headers(access_token), verify=verify_ssl)
 
     def validate_model(
         self, ai_model_id: str, request_data: RequestValidateModel, access_token: str, verify_ssl: bool = True
@@ -46,7 +46,6 @@ class Converter:
 
     def upload_model_file(self, access_token: str, input_model_path: str, presigned_upload_url: str) -> str:
         object_name = os.path.basename(input_model_path)
-        file_content = read_file_bytes(file_path=input_model_path)
 
         token_header = AuthorizationHeader(access_token=access_token)
         logger.info(
@@ -56,13 +55,15 @@ class Converter:
         )
 
         get_model_upload_request_body = RequestUploadModel(url=presigned_upload_url)
-        model_file_object = UploadFile(file_name=object_name, file_content=file_content)
-
-        upload_result = self.convert_model.upload(
-            request_body=get_model_upload_request_body,
-            file=model_file_object,
-            headers=token_header,
-        )
+        # Streamed from the open file instead of being read into memory
+        with open(input_model_path, "rb") as file_content:
+            model_file_object = UploadFile(file_name=object_name, file_content=file_content)
+
+            upload_result = self.convert_model.upload(
+                request_body=get_model_upload_request_body,
+                file=model_file_object,
+                headers=token_header,
+            )
         logger.info(f"Request Convert upload_model_file result: {upload_result}")
         return upload_result
 
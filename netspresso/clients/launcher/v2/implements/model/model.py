@@ -1,8 +1,5 @@
 from dataclasses import asdict
 
-import requests
-from requests_toolbelt import MultipartEncoderMonitor
-
 from netspresso.clients.launcher.v2.interfaces import ModelInterface
 from netspresso.clients.launcher.v2.schemas import (
     AuthorizationHeader,
@@ -17,7 +14,7 @@ from netspresso.clients.launcher.v2.schemas import (
     ResponseModelUploadUrl,
     UploadFile,
 )
-from netspresso.clients.utils.common import create_multipart_data, create_progress_func, progress_callback
+from netspresso.clients.utils.common import upload_multipart_file
 from netspresso.clients.utils.requester import Requester
 from netspresso.enums import LauncherTask
 
@@ -50,18 +47,7 @@ class ModelAPI(ModelInterface):
 
         file_info = file.files[0][1]
 
-        multipart_data = create_multipart_data(request_body.url, file_info)
-        progress = create_progress_func(multipart_data)
-
-        # Wrap the encoder with MultipartEncoderMonitor
-        monitor = MultipartEncoderMonitor(multipart_data, lambda monitor: progress_callback(monitor, progress))
-
-        headers = headers.to_dict()
-        headers["Content-Type"] = monitor.content_type
-
-        response = requests.post(url=url, data=monitor, headers=headers)
-
-        return response.text
+        return upload_multipart_file(url, request_body.url, file_info, headers.to_dict())
 
     def validate(self, request_body: RequestValidateModel, headers: AuthorizationHeader) -> ResponseModelItem:
         endpoint = f"{self.model_base_url}/validate"
@@ -1,9 +1,15 @@
+import time
 from pathlib import Path
+from typing import BinaryIO, Dict, Tuple, Union
 
+from loguru import logger
+from requests_toolbelt import MultipartEncoderMonitor
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 from tqdm import tqdm
 
+from netspresso.clients.utils.requester import Requester
 from netspresso.clients.utils.system import ENV_STR
+from netspresso.exceptions.common import GatewayTimeoutException, NetworkErrorException
 
 version = (Path(__file__).parent.parent.parent / "VERSION").read_text().strip()
 
@@ -37,7 +43,8 @@ def get_files(file_path):
 
 
 def create_multipart_data(url, file_info):
-    # Prepare the multipart form data
+    # Prepare the multipart form data. The file content can be bytes or an open binary file,
+    # which the encoder then reads chunk by chunk while sending instead of holding it in memory.
     file_name = file_info[0]
     file_content = file_info[1]
     multipart_data = MultipartEncoder(
@@ -66,3 +73,49 @@ def create_progress_func(multipart_data):
 
 def progress_callback(monitor, progress):
     progress.update(monitor.bytes_read - progress.n)
+
+
+def upload_multipart_file(
+    url: str, presigned_url: str, file_info: Tuple[str, Union[bytes, BinaryIO]], headers: Dict, **kwargs
+) -> str:
+    """Stream a file to an upload endpoint as the multipart form it expects, with a progress bar.
+
+    A streamed body cannot be resent as is, so on a network error or a gateway timeout the upload
+    is restarted from the beginning of the file, up to Requester.retry_policy.max_retries times.
+
+    Args:
+        url (str): Upload endpoint.
+        presigned_url (str): Presigned URL sent in the form's "url" field.
+        file_info (Tuple[str, Union[bytes, BinaryIO]]): File name and content, preferably an open binary file.
+        headers (Dict): Request headers. Content-Type is set here.
+
+    Returns:
+        str: Response body.
+    """
+
+    file_name, file_content = file_info
+    max_retries = Requester.retry_policy.max_retries
+    for attempt in range(max_retries + 1):
+        if hasattr(file_content, "seek"):
+            file_content.seek(0)
+        multipart_data = create_multipart_data(presigned_url, (file_name, file_content))
+        progress = create_progress_func(multipart_data)
+
+        # Wrap the encoder with MultipartEncoderMonitor
+        monitor = MultipartEncoderMonitor(
+            multipart_data, lambda monitor, progress=progress: progress_callback(monitor, progress)
+        )
+        headers = {**headers, "Content-Type": monitor.content_type}
+
+        try:
+            response = Requester.post_as_stream(url=url, data=monitor, headers=headers, **kwargs)
+            return response.text
+        except (NetworkErrorException, GatewayTimeoutException) as e:
+            if attempt == max_retries:
+                raise e
+            wait = Requester.retry_policy.get_backoff(attempt)
+            Requester._record_retry("POST", url, attempt + 1, f"upload of {file_name} failed", wait)
+            logger.warning(f"Restarting the upload of {file_name}.")
+            time.sleep(wait)
+        finally:
+            progress.close()
@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import requests
+from loguru import logger
+from tqdm import tqdm
+
+from netspresso.clients.utils.requester import Requester
+from netspresso.exceptions.common import FailedDownloadException, NetworkErrorException
+
+DEFAULT_NUM_CONNECTIONS = int(os.environ.get("NP_DOWNLOAD_CONNECTIONS", 4))
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+READ_SIZE = 1024 * 1024
+# A single-part S3 ETag is the MD5 of the object
+MD5_ETAG = re.compile(r'^"?([0-9a-fA-F]{32})"?$')
+
+
+def write_at(file, offset: int, data: bytes, lock: threading.Lock):
+    if hasattr(os, "pwrite"):
+        os.pwrite(file.fileno(), data, offset)
+        return
+
+    # No positional write on this platform (e.g. Windows), so seek and write under a lock
+    with lock:
+        file.seek(offset)
+        file.write(data)
+
+
+def compute_hash(file_path: Union[str, Path], algorithm: str = "sha256") -> str:
+    file_hash = hashlib.new(algorithm)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_SIZE), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+class ParallelDownloader:
+    def __init__(
+        self, num_connections: int = DEFAULT_NUM_CONNECTIONS, part_size: int = DEFAULT_PART_SIZE, verify_etag: bool = False
+    ) -> None:
+        """Download files with HTTP Range requests over several connections.
+
+        The file is preallocated and every part is written at its offset, so parts can arrive in any order.
+        Completed parts are recorded next to the partial file, so an interrupted download resumes where it
+        stopped, as long as the remote file (size and ETag) did not change. Servers without Range support
+        are downloaded over a single connection.
+
+        Args:
+            num_connections (int): Number of parallel connections. Default is 4, or NP_DOWNLOAD_CONNECTIONS.
+            part_size (int): Size of each ranged request in bytes. Default is 16 MB.
+            verify_etag (bool): Check the file against an MD5-shaped ETag when no SHA-256 is given.
+                Only valid for objects stored unencrypted in a single part. Default is False.
+        """
+
+        self.num_connections = max(1, num_connections)
+        self.part_size = part_size
+        self.verify_etag = verify_etag
+
+    def probe(self, url: str) -> Tuple[Optional[int], bool, str]:
+        """Return the size of the remote file, whether it supports Range requests, and its ETag.
+
+        A one-byte ranged GET is used instead of HEAD, because presigned URLs are only signed for GET.
+        """
+
+        with Requester.get(url, headers={"Range": "bytes=0-0"}, stream=True, retry=False) as response:
+            etag = response.headers.get("ETag", "")
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code == 206 and "/" in content_range and not content_range.endswith("/*"):
+                return int(content_range.rsplit("/", 1)[1]), True, etag
+
+            content_length = response.headers.get("Content-Length")
+            return (int(content_length) if content_length else None), False, etag
+
+    def get_parts(self, size: int) -> List[Tuple[int, int]]:
+        return [(start, min(start + self.part_size, size) - 1) for start in range(0, size, self.part_size)]
+
+    def download(
+        self,
+        url: str,
+        save_path: Union[str, Path],
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> str:
+        """Download url to save_path.
+
+        Args:
+            url (str): URL of the file, e.g. a presigned download URL.
+            save_path (Union[str, Path]): Path where the file is saved.
+            expected_size (int, optional): Expected size in bytes. Checked in addition to the server's size.
+            expected_sha256 (str, optional): Expected SHA-256 hex digest.
+
+        Raises:
+            FailedDownloadException: If the download keeps failing or the downloaded file does not match.
+
+        Returns:
+            str: The path of the downloaded file.
+        """
+
+        save_path = Path(save_path)
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = save_path.with_name(save_path.name + ".part")
+        state_path = save_path.with_name(save_path.name + ".part.json")
+
+        size, ranged, etag = self._retry(lambda: self.probe(url), save_path.name)
+        if expected_size is not None and size is not None and size != expected_size:
+            raise FailedDownloadException(error_log=f"Remote file is {size} bytes, expected {expected_size} bytes.")
+
+        if ranged and size:
+            self._download_ranges(url, part_path, state_path, size, etag)
+        else:
+            self._download_stream(url, part_path)
+
+        self.verify(part_path, size if size is not None else expected_size, etag, expected_sha256)
+        os.replace(part_path, save_path)
+        if state_path.exists():
+            state_path.unlink()
+
+        logger.info(f"File downloaded at {save_path}")
+
+        return save_path.as_posix()
+
+    def _load_completed_parts(self, state_path: Path, part_path: Path, size: int, etag: str) -> set:
+        if not (state_path.exists() and part_path.exists()):
+            return set()
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except ValueError:
+            return set()
+        if state.get("size") != size or state.get("etag") != etag or state.get("part_size") != self.part_size:
+            return set()
+        if part_path.stat().st_size != size:
+            return set()
+
+        return set(state.get("completed", []))
+
+    def _download_ranges(self, url: str, part_path: Path, state_path: Path, size: int, etag: str):
+        parts = self.get_parts(size)
+        completed = self._load_completed_parts(state_path, part_path, size, etag)
+        if completed:
+            logger.info(f"Resuming the download of {part_path.stem}: {len(completed)}/{len(parts)} parts already done.")
+
+        if not part_path.exists() or not completed:
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+
+        state_lock = threading.Lock()
+        write_lock = threading.Lock()
+        done_bytes = sum(end - start + 1 for i, (start, end) in enumerate(parts) if i in completed)
+        progress = tqdm(
+            total=size,
+            initial=done_bytes,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            colour="#1BBFD6",
+            desc="Downloading",
+        )
+
+        def save_state():
+            with open(state_path, "w") as f:
+                json.dump({"size": size, "etag": etag, "part_size": self.part_size, "completed": sorted(completed)}, f)
+
+        def download_part(index: int):
+            start, end = parts[index]
+            with open(part_path, "r+b") as f:
+                self._retry(lambda: self._fetch_range(url, f, start, end, write_lock, progress), f"part {index}")
+            with state_lock:
+                completed.add(index)
+                save_state()
+
+        try:
+            pending = [i for i in range(len(parts)) if i not in completed]
+            with ThreadPoolExecutor(max_workers=min(self.num_connections, len(pending) or 1)) as executor:
+                # list() re-raises the first failed part
+                list(executor.map(download_part, pending))
+        finally:
+            progress.close()
+
+    def _fetch_range(self, url: str, file, start: int, end: int, write_lock: threading.Lock, progress: tqdm):
+        offset = start
+        try:
+            with Requester.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, retry=False) as response:
+                if response.status_code != 206:
+                    raise FailedDownloadException(error_log=f"Expected a partial response, got {response.status_code}.")
+                for chunk in response.iter_content(chunk_size=READ_SIZE):
+                    write_at(file, offset, chunk, write_lock)
+                    offset += len(chunk)
+                    progress.update(len(chunk))
+        except Exception:
+            # The part is fetched again from its start
+            progress.update(start - offset)
+            raise
+
+        if offset != end + 1:
+            progress.update(start - offset)
+            raise NetworkErrorException(error_log=f"Range {start}-{end} ended after {offset - start} bytes.")
+
+    def _download_stream(self, url: str, part_path: Path):
+        def fetch():
+            with Requester.get(url, stream=True, retry=False) as response, open(part_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=READ_SIZE):
+                    f.write(chunk)
+
+        self._retry(fetch, part_path.stem)
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        if isinstance(error, (NetworkErrorException, requests.RequestException)):
+            return True
+        # Requests are sent with retry=False, so retryable status codes are handled here
+        return getattr(error, "status_code", None) in Requester.retry_policy.retry_status_codes
+
+    def _retry(self, func, name: str):
+        """Call func, retrying transient failures following Requester.retry_policy.
+
+        This is the only retry layer: the requests themselves are sent with retry=False, otherwise each attempt
+        here would be retried again by Requester.
+        """
+
+        policy = Requester.retry_policy
+        for attempt in range(policy.max_retries + 1):
+            try:
+                return func()
+            except Exception as e:
+                if not self._is_transient(e):
+                    raise
+                if attempt == policy.max_retries:
+                    raise FailedDownloadException(error_log=f"Download of {name} failed: {e}") from e
+                wait = policy.get_backoff(attempt)
+                Requester._record_retry("GET", name, attempt + 1, type(e).__name__, wait)
+                time.sleep(wait)
+
+    def verify(self, file_path: Path, size: Optional[int], etag: str, expected_sha256: Optional[str]):
+        actual_size = file_path.stat().st_size
+        if size is not None and actual_size != size:
+            raise FailedDownloadException(error_log=f"Downloaded {actual_size} bytes, expected {size} bytes.")
+
+        if expected_sha256:
+            actual = compute_hash(file_path, "sha256")
+            if actual != expected_sha256.lower():
+                raise FailedDownloadException(error_log=f"SHA-256 mismatch: got {actual}, expected {expected_sha256}.")
+            return
+
+        md5_etag = MD5_ETAG.match(etag) if self.verify_etag else None
+        if md5_etag:
+            actual = compute_hash(file_path, "md5")
+            if actual != md5_etag.group(1).lower():
+                raise FailedDownloadException(error_log=f"MD5 mismatch with ETag: got {actual}, expected {etag}.")
+
+
+def download_file(
+    url: str,
+    save_path: Union[str, Path],
+    num_connections: int = DEFAULT_NUM_CONNECTIONS,
+    expected_size: Optional[int] = None,
+    expected_sha256: Optional[str] = None,
+) -> str:
+    return ParallelDownloader(num_connections=num_connections).download(
+        url, save_path, expected_size=expected_size, expected_sha256=expected_sha256
+    )
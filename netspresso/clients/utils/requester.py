@@ -1,12 +1,159 @@
-from typing import Optional
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Optional, Tuple, Union
 
 import requests
+from loguru import logger
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 
-from netspresso.exceptions.common import GatewayTimeoutException, InternalServerErrorException, UnexpetedException
+from netspresso.exceptions.common import (
+    GatewayTimeoutException,
+    InternalServerErrorException,
+    NetworkErrorException,
+    UnexpetedException,
+)
+
+# (connect, read) timeouts in seconds. The read timeout bounds the wait for each chunk of the response.
+DEFAULT_TIMEOUT = (
+    float(os.environ.get("NP_CONNECT_TIMEOUT", 10)),
+    float(os.environ.get("NP_READ_TIMEOUT", 300)),
+)
+DEFAULT_POOL_CONNECTIONS = int(os.environ.get("NP_POOL_CONNECTIONS", 4))
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("NP_POOL_MAXSIZE", 16))
+
+
+def is_connect_error(error: requests.RequestException) -> bool:
+    """Whether the request failed while connecting (refused, unresolvable host, connect timeout), so nothing was sent."""
+
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    cause = error.args[0] if error.args else None
+    # urllib3 wraps the connection error in a MaxRetryError
+    reason = getattr(cause, "reason", cause)
+
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long Requester waits before sending a failed call again.
+
+    Attributes:
+        max_retries (int): Maximum number of retries per call. 0 disables retrying.
+        backoff_factor (float): Base of the exponential backoff in seconds. Retry n waits a random
+            time between 0 and backoff_factor * 2 ** n ("full jitter"), capped at max_backoff.
+        max_backoff (float): Maximum wait between two attempts in seconds.
+        budget (float): Maximum seconds spent on one call, waits included. No retry is started past it.
+        retry_status_codes (Tuple[int, ...]): Status codes worth retrying.
+        retry_methods (Tuple[str, ...]): Methods retried on those status codes and on transport errors.
+            Calls that could not connect at all are retried whatever the method, since nothing was sent.
+    """
+
+    max_retries: int = int(os.environ.get("NP_MAX_RETRIES", 3))
+    backoff_factor: float = 1.0
+    max_backoff: float = 30.0
+    budget: float = 120.0
+    retry_status_codes: Tuple[int, ...] = (429, 502, 503, 504)
+    retry_methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def get_backoff(self, retry: int, response: Optional[Response] = None) -> float:
+        retry_after = self.get_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**retry))
+
+    @staticmethod
+    def get_retry_after(response: Response) -> Optional[float]:
+        """Seconds requested by a Retry-After header, given as seconds or as an HTTP date."""
+
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass
+class RetryEvent:
+    method: str
+    url: str
+    retry: int
+    reason: str
+    wait: float
 
 
 class Requester:
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT
+    retry_policy: RetryPolicy = RetryPolicy()
+    # Most recent retries, for checking how much latency retrying adds
+    retry_events: Deque[RetryEvent] = deque(maxlen=1000)
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def configure(
+        cls,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Change the default timeout, connection pool sizes and retry policy of every NetsPresso API call.
+
+        Args:
+            timeout (Union[float, Tuple[float, float]], optional): Seconds, or (connect, read) seconds.
+                Calls passing their own timeout keep it.
+            pool_connections (int, optional): Number of hosts to keep connection pools for.
+            pool_maxsize (int, optional): Maximum number of kept-alive connections per host.
+            retry_policy (RetryPolicy, optional): Retry policy. RetryPolicy(max_retries=0) disables retrying.
+        """
+
+        if timeout is not None:
+            cls.timeout = timeout
+        if retry_policy is not None:
+            cls.retry_policy = retry_policy
+        if pool_connections is not None or pool_maxsize is not None:
+            with cls._session_lock:
+                cls.pool_connections = pool_connections or cls.pool_connections
+                cls.pool_maxsize = pool_maxsize or cls.pool_maxsize
+                # Rebuilt with the new pool sizes on next use
+                session, cls._session = cls._session, None
+            if session is not None:
+                session.close()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Shared session of all API clients, so that connections are kept alive and reused across calls and threads."""
+
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=cls.pool_connections, pool_maxsize=cls.pool_maxsize)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+
+        return cls._session
+
     @staticmethod
     def __make_response(response: Response) -> Response:
         if response.ok:
@@ -26,38 +173,95 @@ class Requester:
 
         raise exception_class(error_log=error_message, status_code=response.status_code) from None
 
-    @staticmethod
-    def get(url: str, params: Optional[dict] = None, headers=None, **kwargs) -> Response:
-        response = requests.get(url, headers=headers, params=params, **kwargs)
+    @classmethod
+    def get_retry_stats(cls) -> Dict[str, float]:
+        """Number of recorded retries and the total time spent waiting for them."""
+
+        events = list(cls.retry_events)
+
+        return {"retries": len(events), "total_wait": sum(event.wait for event in events)}
+
+    @classmethod
+    def _record_retry(cls, method: str, url: str, retry: int, reason: str, wait: float):
+        cls.retry_events.append(RetryEvent(method=method, url=url, retry=retry, reason=reason, wait=wait))
+        logger.warning(f"{method} {url} failed ({reason}). Retry {retry} in {wait:.1f}s.")
+
+    @classmethod
+    def request(cls, method: str, url: str, retry: bool = True, **kwargs) -> Response:
+        """Send a request through the shared session, retrying transient failures following cls.retry_policy.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL.
+            retry (bool): Allow retries. Disable it for bodies that cannot be sent twice, such as streams.
+            **kwargs: Passed to requests.Session.request.
+        """
+
+        kwargs.setdefault("timeout", cls.timeout)
+        policy = cls.retry_policy
+        max_retries = policy.max_retries if retry else 0
+        idempotent = method.upper() in policy.retry_methods
+        deadline = time.monotonic() + policy.budget
+
+        for attempt in range(max_retries + 1):
+            response = None
+            try:
+                response = cls.get_session().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A failed connect sent nothing, so it is safe to retry for any method
+                retryable = idempotent or is_connect_error(e)
+                if not retryable or attempt == max_retries:
+                    raise NetworkErrorException(error_log=str(e)) from e
+                reason = type(e).__name__
+            else:
+                # 429 means the request was refused before being processed, so any method can be resent
+                retryable = response.status_code in policy.retry_status_codes and (
+                    idempotent or response.status_code == 429
+                )
+                if response.ok or not retryable or attempt == max_retries:
+                    break
+                reason = f"status code {response.status_code}"
+
+            wait = policy.get_backoff(attempt, response)
+            if time.monotonic() + wait > deadline:
+                if response is None:
+                    raise NetworkErrorException(error_log=f"Retry budget of {policy.budget}s exceeded: {reason}")
+                break
+
+            cls._record_retry(method, url, attempt + 1, reason, wait)
+            time.sleep(wait)
 
         return Requester.__make_response(response=response)
 
+    @staticmethod
+    def get(url: str, params: Optional[dict] = None, headers=None, **kwargs) -> Response:
+        return Requester.request("GET", url, headers=headers, params=params, **kwargs)
+
     @staticmethod
     def post_as_form(url: str, request_body: Optional[dict] = None, binary=None, headers=None, **kwargs) -> Response:
-        response = requests.post(url, headers=headers, data=request_body, files=binary, **kwargs)
+        # Open files in binary would be sent empty on a retry
+        kwargs.setdefault("retry", binary is None)
 
-        return Requester.__make_response(response=response)
+        return Requester.request("POST", url, headers=headers, data=request_body, files=binary, **kwargs)
 
     @staticmethod
     def post_as_json(url: str, request_body: dict = None, headers=None, **kwargs) -> Response:
-        response = requests.post(url, headers=headers, json=request_body, **kwargs)
+        return Requester.request("POST", url, headers=headers, json=request_body, **kwargs)
 
-        return Requester.__make_response(response=response)
+    @staticmethod
+    def post_as_stream(url: str, data, headers=None, **kwargs) -> Response:
+        """POST a body that is read while sending, such as a MultipartEncoder(Monitor)."""
+
+        return Requester.request("POST", url, retry=False, headers=headers, data=data, **kwargs)
 
     @staticmethod
     def put(url: str, request_body: dict, headers=None, **kwargs) -> Response:
-        response = requests.put(url, headers=headers, json=request_body, **kwargs)
-
-        return Requester.__make_response(response=response)
+        return Requester.request("PUT", url, headers=headers, json=request_body, **kwargs)
 
     @staticmethod
     def patch(url: str, request_body: dict, headers=None, **kwargs) -> Response:
-        response = requests.patch(url, headers=headers, json=request_body, **kwargs)
-
-        return Requester.__make_response(response=response)
+        return Requester.request("PATCH", url, headers=headers, json=request_body, **kwargs)
 
     @staticmethod
     def delete(url: str, headers=None, **kwargs) -> Response:
-        response = requests.delete(url, headers=headers, **kwargs)
-
-        return Requester.__make_response(response=response)
+        return Requester.request("DELETE", url, headers=headers, **kwargs)
@@ -0,0 +1,247 @@
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Deque, Dict, Generic, Optional, TypeVar
+
+from loguru import logger
+
+from netspresso.exceptions.common import TaskTimeoutException
+
+T = TypeVar("T")
+DEFAULT_TASK_TIMEOUT = float(os.environ["NP_TASK_TIMEOUT"]) if os.environ.get("NP_TASK_TIMEOUT") else None
+
+
+class TaskNotifier:
+    def __init__(self) -> None:
+        """Push channel telling a TaskWaiter that a task may have changed, so that it reads the task right away.
+
+        Subclasses call notify() whenever the server sends an update. The task is still read with read_task,
+        so a notification only has to say "look now", and a missed one only delays the next read.
+        """
+
+        self._event = threading.Event()
+        self.cancelled = False
+
+    def start(self):
+        pass
+
+    def notify(self):
+        self._event.set()
+
+    def cancel(self):
+        """Stop the waiter: it raises CancelledError instead of reading the task again."""
+
+        self.cancelled = True
+        self.notify()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until notified or for timeout seconds. Returns whether a notification arrived."""
+
+        notified = self._event.wait(timeout)
+        self._event.clear()
+
+        return notified
+
+    def close(self):
+        pass
+
+
+class TaskWaiter(Generic[T]):
+    # Durations of finished tasks per eta_key, for estimating when the next one ends
+    durations: Dict[str, Deque[float]] = {}
+
+    def __init__(
+        self,
+        read_task: Callable[[], T],
+        is_done: Callable[[T], bool],
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        multiplier: float = 1.5,
+        timeout: Optional[float] = None,
+        eta_key: Optional[str] = None,
+        notifier: Optional[TaskNotifier] = None,
+    ) -> None:
+        """Wait for a launcher task, reading it often at first and less and less often after.
+
+        The interval starts at initial_interval and is multiplied by multiplier after each read, up to
+        max_interval. Tasks with the same eta_key, e.g. benchmarks on one device, are expected to take
+        about as long as the previous ones, so the interval is shortened to wake up when the task is
+        expected to end, and restarts from initial_interval once it is overdue.
+
+        Args:
+            read_task (Callable[[], T]): Reads the task from the server.
+            is_done (Callable[[T], bool]): Whether the task read is finished.
+            initial_interval (float): First interval in seconds. Default is 1.
+            max_interval (float): Longest interval in seconds. Default is 30.
+            multiplier (float): Growth of the interval after each read. Default is 1.5.
+            timeout (float, optional): Maximum seconds to wait. Default is no limit.
+            eta_key (str, optional): Key of tasks expected to take the same time.
+            notifier (TaskNotifier, optional): Push channel waking the waiter before the interval ends.
+        """
+
+        self.read_task = read_task
+        self.is_done = is_done
+        self.initial_interval = initial_interval
+        self.max_interval = max(max_interval, initial_interval)
+        self.multiplier = multiplier
+        self.timeout = timeout
+        self.eta_key = eta_key
+        self.notifier = notifier
+        self.reads = 0
+
+    def get_expected_duration(self) -> Optional[float]:
+        durations = TaskWaiter.durations.get(self.eta_key)
+        if not durations:
+            return None
+
+        return statistics.median(durations)
+
+    def get_interval(self, retry: int, remaining: Optional[float]) -> float:
+        """Seconds until the next read, remaining being the seconds until the task is expected to end."""
+
+        interval = min(self.max_interval, self.initial_interval * self.multiplier**retry)
+        if remaining is not None and remaining > 0:
+            interval = max(self.initial_interval, min(interval, remaining))
+
+        return interval
+
+    def record_duration(self, duration: float):
+        if self.eta_key is not None:
+            TaskWaiter.durations.setdefault(self.eta_key, deque(maxlen=20)).append(duration)
+
+    def wait(self) -> T:
+        """Read the task until is_done returns True.
+
+        Raises:
+            TaskTimeoutException: If the task is not done after timeout seconds.
+            CancelledError: If the notifier was cancelled.
+
+        Returns:
+            T: The last task read.
+        """
+
+        start = time.monotonic()
+        expected_duration = self.get_expected_duration()
+        if self.notifier is not None:
+            self.notifier.start()
+
+        try:
+            retry, overdue, previous_read = 0, False, 0.0
+            while True:
+                if self.notifier is not None and self.notifier.cancelled:
+                    raise CancelledError()
+                task = self.read_task()
+                self.reads += 1
+                elapsed = time.monotonic() - start
+                if self.is_done(task):
+                    # The task ended between the last two reads
+                    self.record_duration((previous_read + elapsed) / 2)
+                    logger.info(f"Task done after {elapsed:.1f}s and {self.reads} reads.")
+                    return task
+
+                if self.timeout is not None and elapsed >= self.timeout:
+                    raise TaskTimeoutException(error_log=f"Task not done after {elapsed:.0f}s.", timeout=self.timeout)
+
+                remaining = expected_duration - elapsed if expected_duration is not None else None
+                if remaining is not None and remaining <= 0 and not overdue:
+                    # Back off again from the expected end
+                    retry, overdue = 0, True
+
+                previous_read = elapsed
+                interval = self.get_interval(retry, remaining)
+                if self.timeout is not None:
+                    interval = min(interval, self.timeout - elapsed)
+                retry += 1
+
+                if self.notifier is not None:
+                    self.notifier.wait(interval)
+                else:
+                    time.sleep(interval)
+        finally:
+            if self.notifier is not None:
+                self.notifier.close()
+
+
+class TaskFuture(Future, Generic[T]):
+    def __init__(
+        self,
+        run: Optional[Callable[[TaskNotifier], T]] = None,
+        task_id: Optional[str] = None,
+        cancel_task: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """Result of a task running in the background, usually the metadata of a launcher task.
+
+        run is called in a daemon thread with the notifier of the future and its return value is the result,
+        e.g. the metadata once the model is downloaded. As a concurrent.futures.Future, it works with
+        concurrent.futures.wait and as_completed. Get the result before the program exits, or the
+        background work stops with it.
+
+        Args:
+            run (Callable[[TaskNotifier], T], optional): Waits for the task and returns its result.
+                Without it, the result is set with set_result.
+            task_id (str, optional): ID of the task on the server.
+            cancel_task (Callable[[str], Any], optional): Cancels the task on the server, given task_id.
+                Without it, a running task cannot be cancelled.
+        """
+
+        super().__init__()
+        self.task_id = task_id
+        self.notifier = TaskNotifier()
+        self._cancel_task = cancel_task
+        self._lock = threading.Lock()
+        if run is not None:
+            threading.Thread(target=self._run, args=(run,), daemon=True).start()
+
+    @classmethod
+    def from_result(cls, result: T) -> "TaskFuture[T]":
+        """Future that is already done, e.g. for a task that failed before starting."""
+
+        future = cls()
+        future.set_result(result)
+
+        return future
+
+    def _run(self, run: Callable[[TaskNotifier], T]):
+        try:
+            result = run(self.notifier)
+        except BaseException as e:
+            with self._lock:
+                if not self.done():
+                    self.set_exception(e)
+            return
+
+        with self._lock:
+            # Dropped if the future was cancelled meanwhile
+            if not self.done():
+                self.set_result(result)
+
+    def cancel(self) -> bool:
+        """Cancel the task on the server and stop waiting for it.
+
+        Returns:
+            bool: False if the task is already done or cannot be cancelled, True otherwise.
+        """
+
+        if self.done():
+            return self.cancelled()
+        if self._cancel_task is None:
+            return False
+
+        try:
+            self._cancel_task(self.task_id)
+        except Exception as e:
+            logger.warning(f"Failed to cancel task {self.task_id}: {e}")
+            return False
+
+        with self._lock:
+            if not super().cancel():
+                return False
+            # Wakes up concurrent.futures.wait and as_completed
+            self.set_running_or_notify_cancel()
+        self.notifier.cancel()
+        logger.info(f"Task {self.task_id} was cancelled.")
+
+        return True
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from loguru import logger
+
+from netspresso.clients.utils.downloader import compute_hash
+
+DEFAULT_TTL = float(os.environ.get("NP_UPLOAD_CACHE_TTL", 7 * 24 * 60 * 60))
+DEFAULT_MAX_ENTRIES = int(os.environ.get("NP_UPLOAD_CACHE_MAX_ENTRIES", 256))
+CACHE_VERSION = 1
+
+
+def get_cache_dir() -> Path:
+    """NP_CACHE_DIR, or netspresso under XDG_CACHE_HOME (~/.cache by default)."""
+
+    if os.environ.get("NP_CACHE_DIR"):
+        return Path(os.environ["NP_CACHE_DIR"])
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "netspresso"
+
+
+class UploadCache:
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Uploaded and validated models, keyed by the SHA-256 of the model file.
+
+        Uploading the same file again, e.g. to benchmark one model on several devices, reuses the
+        ai_model_id and validation result of the first upload instead of uploading it again.
+        Entries expire after ttl seconds, and the least recently used ones are evicted above max_entries.
+
+        Args:
+            cache_dir (Union[str, Path], optional): Folder of upload_cache.json. Default is get_cache_dir().
+            ttl (float): Seconds an entry stays valid. Default is 7 days, or NP_UPLOAD_CACHE_TTL.
+            max_entries (int): Maximum number of entries. Default is 256, or NP_UPLOAD_CACHE_MAX_ENTRIES.
+            enabled (bool, optional): Use the cache. Default is True unless NP_UPLOAD_CACHE is set to 0.
+        """
+
+        self.cache_path = Path(cache_dir or get_cache_dir()) / "upload_cache.json"
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled if enabled is not None else os.environ.get("NP_UPLOAD_CACHE", "1") != "0"
+        self._lock = threading.Lock()
+        # (path, size, mtime) -> SHA-256, so a file is hashed once per process unless it changes
+        self._file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def get_file_hash(self, file_path: Union[str, Path]) -> str:
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        memo_key = (file_path.as_posix(), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._file_hashes:
+            self._file_hashes[memo_key] = compute_hash(file_path, "sha256")
+
+        return self._file_hashes[memo_key]
+
+    def make_key(self, file_path: Union[str, Path], *scope) -> str:
+        """Key of a file uploaded in a scope, e.g. (server, user, task type).
+
+        The same file uploaded by another user, to another server or for another task is a different entry.
+        """
+
+        scope_hash = hashlib.sha256(json.dumps([str(item) for item in scope]).encode()).hexdigest()[:16]
+
+        return f"{self.get_file_hash(file_path)}:{scope_hash}"
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+            return {}
+
+        return cache.get("entries", {})
+
+    def _save(self, entries: Dict[str, Dict]):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "w") as f:
+                json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+            # Atomic, so other processes never read a partly written file
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to save the upload cache at {self.cache_path}: {e}")
+
+    def _prune(self, entries: Dict[str, Dict]) -> Dict[str, Dict]:
+        now = time.time()
+        entries = {key: entry for key, entry in entries.items() if entry.get("expires_at", 0) > now}
+        if len(entries) > self.max_entries:
+            recent = sorted(entries.items(), key=lambda item: item[1].get("last_used", 0), reverse=True)
+            entries = dict(recent[: self.max_entries])
+
+        return entries
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached data of key, or None if it is missing, expired or the cache is disabled."""
+
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None or entry.get("expires_at", 0) <= time.time():
+                return None
+
+            entry["last_used"] = time.time()
+            self._save(self._prune(entries))
+
+        logger.info(f"Reusing uploaded model {entry['ai_model_id']} from the upload cache.")
+
+        return entry["data"]
+
+    def put(self, key: str, ai_model_id: str, data: Dict):
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                "ai_model_id": ai_model_id,
+                "data": data,
+                "created_at": now,
+                "expires_at": now + self.ttl,
+                "last_used": now,
+            }
+            self._save(self._prune(entries))
+
+    def evict(self, ai_model_id: str):
+        """Remove the entries of ai_model_id, e.g. when the server no longer accepts it."""
+
+        with self._lock:
+            entries = self._load()
+            remaining = {key: entry for key, entry in entries.items() if entry.get("ai_model_id") != ai_model_id}
+            if len(remaining) != len(entries):
+                logger.info(f"Removed model {ai_model_id} from the upload cache.")
+                self._save(remaining)
+
+    def clear(self):
+        with self._lock:
+            self._save({})
+
+
+upload_cache = UploadCache()
@@ -1,6 +1,6 @@
+from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List, Optional
-from urllib import request
+from typing import Dict, List, Optional, Union
 
 from loguru import logger
 
@@ -24,6 +24,8 @@ from netspresso.clients.compressor.v2.schemas import (
     UploadFile,
 )
 from netspresso.clients.launcher import launcher_client_v2
+from netspresso.clients.utils.task_waiter import TaskFuture
+from netspresso.clients.utils.upload_cache import upload_cache
 from netspresso.compressor.utils.onnx import export_onnx
 from netspresso.enums import CompressionMethod, Framework, RecommendationMethod, ServiceTask, Status
 from netspresso.exceptions.compressor import FailedUploadModelException
@@ -169,6 +171,20 @@ class CompressorV2(NetsPressoBase):
 
             FileHandler.check_input_model_path(input_model_path)
 
+            cache_key = None
+            if upload_cache.enabled:
+                cache_key = upload_cache.make_key(
+                    input_model_path,
+                    compressor_client_v2.url,
+                    self.token_handler.email,
+                    Path(input_model_path).name,
+                    framework,
+                    input_shapes,
+                )
+                cached = upload_cache.get(cache_key)
+                if cached is not None:
+                    return ModelBase(**cached)
+
             object_name = Path(input_model_path).name
 
             create_model_request = RequestCreateModel(object_name=object_name)
@@ -178,15 +194,16 @@ class CompressorV2(NetsPressoBase):
                 verify_ssl=self.token_handler.verify_ssl,
             )
 
-            file_content = FileHandler.read_file_bytes(file_path=input_model_path)
             upload_model_request = RequestUploadModel(url=create_model_response.data.presigned_url)
-            file = UploadFile(file_name=object_name, file_content=file_content)
-            upload_model_response = compressor_client_v2.upload_model(
-                request_data=upload_model_request,
-                file=file,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
+            # Streamed from the open file instead of being read into memory
+            with open(input_model_path, "rb") as file_content:
+                file = UploadFile(file_name=object_name, file_content=file_content)
+                upload_model_response = compressor_client_v2.upload_model(
+                    request_data=upload_model_request,
+                    file=file,
+                    access_token=self.token_handler.tokens.access_token,
+                    verify_ssl=self.token_handler.verify_ssl,
+                )
 
             if not upload_model_response:
                 # TODO: Confirm upload success
@@ -201,6 +218,8 @@ class CompressorV2(NetsPressoBase):
             )
 
             model_info = validate_model_response.data
+            if cache_key is not None:
+                upload_cache.put(cache_key, model_info.ai_model_id, asdict(model_info))
 
             logger.info(f"Upload model successfully. Model ID: {model_info.ai_model_id}")
 
@@ -240,7 +259,7 @@ class CompressorV2(NetsPressoBase):
                 access_token=self.token_handler.tokens.access_token,
                 verify_ssl=self.token_handler.verify_ssl,
             )
-            request.urlretrieve(download_link.data.presigned_url, local_path)
+            FileHandler.download_file(url=download_link.data.presigned_url, save_path=local_path)
             logger.info(f"Model downloaded at {Path(local_path)}")
 
         except Exception as e:
@@ -339,21 +358,29 @@ class CompressorV2(NetsPressoBase):
         compression: ResponseSelectMethod,
         output_dir: str,
         dataset_path: Optional[str] = None,
-    ) -> CompressorMetadata:
+        wait_until_done: bool = True,
+    ) -> Union[CompressorMetadata, TaskFuture[CompressorMetadata]]:
         """Compress a model using the provided compression information.
 
         Args:
             compression (CompressionInfo): The information about the compression.
             output_dir (str): The local path to save the compressed model.
             dataset_path (str, optional): The path of the dataset used for nuclear norm compression method. Default is None.
+            wait_until_done (bool): If True, wait for the compression result before returning the function.
+                If False, run the compression in the background and return a TaskFuture immediately.
+                The compression runs in a single request, so the future cannot be cancelled once started.
 
         Raises:
             e: If an error occurs while compressing the model.
 
         Returns:
-            CompressorMetadata: Compress metadata.
+            Union[CompressorMetadata, TaskFuture[CompressorMetadata]]: Compress metadata,
+                or a future of it if wait_until_done is False.
         """
 
+        if not wait_until_done:
+            return TaskFuture(lambda _: self.compress_model(compression, output_dir, dataset_path))
+
         output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
         metadata: CompressorMetadata = self.initialize_metadata(
             output_dir=output_dir,
@@ -376,11 +403,16 @@ class CompressorV2(NetsPressoBase):
                 compression_method=compression.compression_method,
                 options=compression.options,
             )
-            create_compression_response = compressor_client_v2.create_compression(
-                request_data=create_compression_request,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
+            try:
+                create_compression_response = compressor_client_v2.create_compression(
+                    request_data=create_compression_request,
+                    access_token=self.token_handler.tokens.access_token,
+                    verify_ssl=self.token_handler.verify_ssl,
+                )
+            except Exception:
+                # A cached model may have been deleted on the server, so upload it again next time
+                upload_cache.evict(compression.input_model_id)
+                raise
 
             for available_layers in compression.available_layers:
                 if available_layers.values:
@@ -415,6 +447,8 @@ class CompressorV2(NetsPressoBase):
         finally:
             MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
 
+        return metadata
+
     def recommendation_compression(
         self,
         compression_method: CompressionMethod,
@@ -426,7 +460,8 @@ class CompressorV2(NetsPressoBase):
         framework: Framework = Framework.PYTORCH,
         options: RecommendationOptions = RecommendationOptions(),
         dataset_path: Optional[str] = None,
-    ) -> CompressorMetadata:
+        wait_until_done: bool = True,
+    ) -> Union[CompressorMetadata, TaskFuture[CompressorMetadata]]:
         """Compress a recommendation-based model using the given compression and recommendation methods.
 
         Args:
@@ -439,14 +474,33 @@ class CompressorV2(NetsPressoBase):
             framework (Framework, optional): The framework of the model.
             options(Options, optional): The options for pruning method.
             dataset_path (str, optional): The path of the dataset used for nuclear norm compression method. Default is None.
+            wait_until_done (bool): If True, wait for the compression result before returning the function.
+                If False, run the compression in the background and return a TaskFuture immediately.
+                The compression runs in a single request, so the future cannot be cancelled once started.
 
         Raises:
             e: If an error occurs while performing recommendation compression.
 
         Returns:
-            CompressorMetadata: Compress metadata.
+            Union[CompressorMetadata, TaskFuture[CompressorMetadata]]: Compress metadata,
+                or a future of it if wait_until_done is False.
         """
 
+        if not wait_until_done:
+            return TaskFuture(
+                lambda _: self.recommendation_compression(
+                    compression_method,
+                    recommendation_method,
+                    recommendation_ratio,
+                    input_model_path,
+                    output_dir,
+                    input_shapes,
+                    framework,
+                    options,
+                    dataset_path,
+                )
+            )
+
         output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
         metadata = self.initialize_metadata(
             output_dir=output_dir,
@@ -471,11 +525,16 @@ class CompressorV2(NetsPressoBase):
                 compression_method=compression_method,
                 options=options,
             )
-            create_compression_response = compressor_client_v2.create_compression(
-                request_data=create_compression_request,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
+            try:
+                create_compression_response = compressor_client_v2.create_compression(
+                    request_data=create_compression_request,
+                    access_token=self.token_handler.tokens.access_token,
+                    verify_ssl=self.token_handler.verify_ssl,
+                )
+            except Exception:
+                # A cached model may have been deleted on the server, so upload it again next time
+                upload_cache.evict(model_info.ai_model_id)
+                raise
 
             if dataset_path and compression_method in [CompressionMethod.PR_NN, CompressionMethod.PR_SNP]:
                 self.upload_dataset(create_compression_response.data.compression_id, dataset_path)
@@ -529,7 +588,8 @@ class CompressorV2(NetsPressoBase):
         input_shapes: List[Dict[str, int]],
         framework: Framework = Framework.PYTORCH,
         compression_ratio: float = 0.5,
-    ) -> CompressorMetadata:
+        wait_until_done: bool = True,
+    ) -> Union[CompressorMetadata, TaskFuture[CompressorMetadata]]:
         """Compress a model automatically based on the given compression ratio.
 
         Args:
@@ -538,13 +598,24 @@ class CompressorV2(NetsPressoBase):
             input_shapes (List[Dict[str, int]]): Input shapes of the model.
             framework (Framework, optional): The framework of the model.
             compression_ratio (float, optional): The compression ratio for automatic compression. Defaults to 0.5.
+            wait_until_done (bool): If True, wait for the compression result before returning the function.
+                If False, run the compression in the background and return a TaskFuture immediately.
+                The compression runs in a single request, so the future cannot be cancelled once started.
 
         Raises:
             e: If an error occurs while performing automatic compression.
 
         Returns:
-            CompressorMetadata: Compress metadata.
+            Union[CompressorMetadata, TaskFuture[CompressorMetadata]]: Compress metadata,
+                or a future of it if wait_until_done is False.
         """
+        if not wait_until_done:
+            return TaskFuture(
+                lambda _: self.automatic_compression(
+                    input_model_path, output_dir, input_shapes, framework, compression_ratio
+                )
+            )
+
         output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
         metadata = self.initialize_metadata(
             output_dir=output_dir,
@@ -566,12 +637,17 @@ class CompressorV2(NetsPressoBase):
 
             logger.info("Compressing model...")
             automatic_compression_request = RequestAutomaticCompressionParams(compression_ratio=compression_ratio)
-            automatic_compression_response = compressor_client_v2.compress_model_with_automatic(
-                ai_model_id=model_info.ai_model_id,
-                request_data=automatic_compression_request,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
+            try:
+                automatic_compression_response = compressor_client_v2.compress_model_with_automatic(
+                    ai_model_id=model_info.ai_model_id,
+                    request_data=automatic_compression_request,
+                    access_token=self.token_handler.tokens.access_token,
+                    verify_ssl=self.token_handler.verify_ssl,
+                )
+            except Exception:
+                # A cached model may have been deleted on the server, so upload it again next time
+                upload_cache.evict(model_info.ai_model_id)
+                raise
             compression_info = automatic_compression_response.data
             metadata = self.finalize_compression_process(metadata, model_info, compression_info, output_dir)
 
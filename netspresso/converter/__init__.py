@@ -1,3 +1,4 @@
+from netspresso.converter.schema import ConvertTarget
 from netspresso.converter.v2.converter import ConverterV2
 
-__all__ = ["ConverterV2"]
+__all__ = ["ConverterV2", "ConvertTarget"]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Union
+
+from netspresso.clients.launcher.v2.schemas import InputLayer
+from netspresso.enums import DataType, DeviceName, Framework, SoftwareVersion
+
+
+@dataclass
+class ConvertTarget:
+    framework: Union[str, Framework]
+    device_name: Union[str, DeviceName]
+    data_type: Union[str, DataType] = DataType.FP16
+    software_version: Optional[Union[str, SoftwareVersion]] = None
+    input_layer: Optional[InputLayer] = None
+    dataset_path: Optional[str] = None
+
+    def get_name(self) -> str:
+        """Folder name of the target, e.g. TENSORFLOW_LITE_RASPBERRY_PI_4B_FP16."""
+
+        parts = [self.framework, self.device_name, self.data_type, self.software_version]
+
+        return "_".join(part.name if isinstance(part, Enum) else str(part) for part in parts if part)
@@ -1,7 +1,7 @@
-import time
+import copy
+from concurrent.futures import FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import Optional, Union
-from urllib import request
+from typing import Dict, List, Optional, Union
 
 from loguru import logger
 
@@ -12,7 +12,20 @@ from netspresso.clients.launcher import launcher_client_v2
 from netspresso.clients.launcher.v2.schemas import InputLayer
 from netspresso.clients.launcher.v2.schemas.common import DeviceInfo
 from netspresso.clients.launcher.v2.schemas.task.convert.response_body import ConvertTask
-from netspresso.enums import DataType, DeviceName, Framework, ServiceTask, SoftwareVersion, Status, TaskStatusForDisplay
+from netspresso.clients.utils.task_waiter import TaskFuture
+from netspresso.clients.utils.upload_cache import upload_cache
+from netspresso.converter.schema import ConvertTarget
+from netspresso.enums import (
+    DataType,
+    DeviceName,
+    Framework,
+    ServiceCredit,
+    ServiceTask,
+    SoftwareVersion,
+    Status,
+    TaskStatusForDisplay,
+)
+from netspresso.exceptions.common import NotEnoughCreditException
 from netspresso.metadata.converter import ConverterMetadata
 from netspresso.utils import FileHandler
 from netspresso.utils.metadata import MetadataHandler
@@ -25,7 +38,9 @@ class ConverterV2(NetsPressoBase):
         super().__init__(token_handler)
         self.user_info = user_info
 
-    def create_available_options(self, target_framework, target_device, target_software_version):
+    def create_available_options(
+        self, target_framework, target_device, target_software_version, framework_options=None
+    ):
         def filter_device(device: DeviceInfo, target_software_version: SoftwareVersion):
             filtered_versions = [
                 version for version in device.software_versions if version.software_version == target_software_version
@@ -36,12 +51,16 @@ class ConverterV2(NetsPressoBase):
                 return device
             return None
 
-        self.token_handler.validate_token()
+        if framework_options is None:
+            self.token_handler.validate_token()
 
-        available_options = launcher_client_v2.benchmarker.read_framework_options(
-            access_token=self.token_handler.tokens.access_token,
-            framework=target_framework,
-        )
+            available_options = launcher_client_v2.benchmarker.read_framework_options(
+                access_token=self.token_handler.tokens.access_token,
+                framework=target_framework,
+            )
+        else:
+            # Filtered in place below, so a shared response is copied first
+            available_options = copy.deepcopy(framework_options)
 
         if target_framework in [Framework.TENSORRT, Framework.DRPAI]:
             for available_option in available_options.data:
@@ -56,7 +75,13 @@ class ConverterV2(NetsPressoBase):
         return available_options
 
     def initialize_metadata(
-        self, output_dir, input_model_path, target_framework, target_device, target_software_version
+        self,
+        output_dir,
+        input_model_path,
+        target_framework,
+        target_device,
+        target_software_version,
+        framework_options=None,
     ):
         def create_metadata_with_status(status, error_message=None):
             metadata = ConverterMetadata()
@@ -75,7 +100,9 @@ class ConverterV2(NetsPressoBase):
             metadata = create_metadata_with_status(Status.STOPPED, warning_message)
         finally:
             metadata.input_model_path = Path(input_model_path).resolve().as_posix()
-            available_options = self.create_available_options(target_framework, target_device, target_software_version)
+            available_options = self.create_available_options(
+                target_framework, target_device, target_software_version, framework_options
+            )
             metadata.available_options.extend(option.to() for option in available_options.data)
             MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
 
@@ -99,13 +126,57 @@ class ConverterV2(NetsPressoBase):
                 access_token=self.token_handler.tokens.access_token,
             ).data.presigned_download_url
 
-            request.urlretrieve(download_url, local_path)
+            FileHandler.download_file(url=download_url, save_path=local_path)
             logger.info(f"Model downloaded at {Path(local_path)}")
 
         except Exception as e:
             logger.error(f"Download converted model failed. Error: {e}")
             raise e
 
+    def _start_task(
+        self,
+        validate_model_response,
+        target_framework,
+        target_device_name,
+        target_data_type,
+        target_software_version,
+        input_layer,
+        dataset_path,
+    ):
+        try:
+            return launcher_client_v2.converter.start_task(
+                access_token=self.token_handler.tokens.access_token,
+                input_model_id=validate_model_response.data.ai_model_id,
+                target_device_name=target_device_name,
+                target_framework=target_framework,
+                data_type=target_data_type,
+                input_layer=input_layer if input_layer else validate_model_response.data.detail.input_layers[0],
+                software_version=target_software_version,
+                dataset_path=dataset_path,
+            )
+        except Exception:
+            # A cached model may have been deleted on the server, so upload it again next time
+            upload_cache.evict(validate_model_response.data.ai_model_id)
+            raise
+
+    def _update_result(
+        self, metadata: ConverterMetadata, convert_response, output_dir: Path, target_framework
+    ) -> ConverterMetadata:
+        if convert_response.data.status == TaskStatusForDisplay.FINISHED:
+            default_model_path = FileHandler.get_default_model_path(folder_path=output_dir)
+            extension = FileHandler.get_extension(framework=target_framework)
+            self._download_converted_model(
+                convert_task=convert_response.data,
+                local_path=str(default_model_path.with_suffix(extension)),
+            )
+            metadata.status = Status.COMPLETED
+            metadata.converted_model_path = default_model_path.with_suffix(extension).as_posix()
+            logger.info(f"Conversion task for {output_dir.name} was completed successfully.")
+        else:
+            metadata = self.handle_error(metadata, ServiceTask.MODEL_CONVERT, convert_response.data.error_log)
+
+        return metadata
+
     def convert_model(
         self,
         input_model_path: str,
@@ -118,7 +189,7 @@ class ConverterV2(NetsPressoBase):
         dataset_path: Optional[str] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> ConverterMetadata:
+    ) -> Union[ConverterMetadata, TaskFuture[ConverterMetadata]]:
         """Convert a model to the specified framework.
 
         Args:
@@ -132,13 +203,16 @@ class ConverterV2(NetsPressoBase):
             input_layer (InputShape, optional): Target input shape for conversion (e.g., dynamic batch to static batch).
             dataset_path (str, optional): Path to the dataset. Useful for certain conversions.
             wait_until_done (bool): If True, wait for the conversion result before returning the function.
-                                If False, request the conversion and return  the function immediately.
+                                If False, request the conversion and return a TaskFuture immediately.
+                                The model is downloaded in the background when the conversion ends.
+            sleep_interval (int): Longest interval in seconds between checks of the task. Default is 30.
 
         Raises:
             e: If an error occurs during the model conversion.
 
         Returns:
-            ConverterMetadata: Convert metadata.
+            Union[ConverterMetadata, TaskFuture[ConverterMetadata]]: Convert metadata,
+                or a future of it if wait_until_done is False.
         """
 
         FileHandler.check_input_model_path(input_model_path)
@@ -151,41 +225,23 @@ class ConverterV2(NetsPressoBase):
             target_software_version=target_software_version,
         )
 
+        future = None
         try:
             if metadata.status in [Status.ERROR, Status.STOPPED]:
-                return metadata
+                return metadata if wait_until_done else TaskFuture.from_result(metadata)
 
             self.validate_token_and_check_credit(service_task=ServiceTask.MODEL_CONVERT)
 
-            # Get presigned_model_upload_url
-            presigned_url_response = launcher_client_v2.converter.presigned_model_upload_url(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_path=input_model_path,
-            )
-
-            # Upload model_file
-            launcher_client_v2.converter.upload_model_file(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_path=input_model_path,
-                presigned_upload_url=presigned_url_response.data.presigned_upload_url,
-            )
-
-            # Validate model_file
-            validate_model_response = launcher_client_v2.converter.validate_model_file(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_path=input_model_path,
-                ai_model_id=presigned_url_response.data.ai_model_id,
-            )
+            validate_model_response = self.upload_model_file(launcher_client_v2.converter, input_model_path)
 
             # Start convert task
-            convert_response = launcher_client_v2.converter.start_task(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_id=presigned_url_response.data.ai_model_id,
-                target_device_name=target_device_name,
+            convert_response = self._start_task(
+                validate_model_response,
                 target_framework=target_framework,
-                data_type=target_data_type,
-                input_layer=input_layer if input_layer else validate_model_response.data.detail.input_layers[0],
-                software_version=target_software_version,
+                target_device_name=target_device_name,
+                target_data_type=target_data_type,
+                target_software_version=target_software_version,
+                input_layer=input_layer,
                 dataset_path=dataset_path,
             )
 
@@ -193,45 +249,174 @@ class ConverterV2(NetsPressoBase):
             metadata.convert_task_info = convert_response.data.to(validate_model_response.data.uploaded_file_name)
             MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
 
+            def finish(convert_response) -> ConverterMetadata:
+                result = self._update_result(metadata, convert_response, output_dir, target_framework)
+                if result.status == Status.COMPLETED:
+                    self.print_remaining_credit(service_task=ServiceTask.MODEL_CONVERT)
+                return result
+
+            task_id = convert_response.data.convert_task_id
+            eta_key = f"convert:{target_framework}:{target_device_name}"
             if wait_until_done:
-                while True:
-                    self.token_handler.validate_token()
-                    convert_response = launcher_client_v2.converter.read_task(
-                        access_token=self.token_handler.tokens.access_token,
-                        task_id=convert_response.data.convert_task_id,
-                    )
-                    if convert_response.data.status in [
-                        TaskStatusForDisplay.FINISHED,
-                        TaskStatusForDisplay.ERROR,
-                        TaskStatusForDisplay.TIMEOUT,
-                    ]:
-                        break
-
-                    time.sleep(sleep_interval)
-
-            if convert_response.data.status == TaskStatusForDisplay.FINISHED:
-                default_model_path = FileHandler.get_default_model_path(folder_path=output_dir)
-                extension = FileHandler.get_extension(framework=target_framework)
-                self._download_converted_model(
-                    convert_task=convert_response.data,
-                    local_path=str(default_model_path.with_suffix(extension)),
+                convert_response = self.wait_for_task(
+                    launcher_client_v2.converter, task_id=task_id, sleep_interval=sleep_interval, eta_key=eta_key
                 )
-                self.print_remaining_credit(service_task=ServiceTask.MODEL_CONVERT)
-                metadata.status = Status.COMPLETED
-                metadata.converted_model_path = default_model_path.with_suffix(extension).as_posix()
-                logger.info("Conversion task was completed successfully.")
+                metadata = finish(convert_response)
             else:
-                metadata = self.handle_error(metadata, ServiceTask.MODEL_CONVERT, convert_response.data.error_log)
+                future = self.submit_task(
+                    launcher_client_v2.converter,
+                    task_id=task_id,
+                    metadata=metadata,
+                    service_task=ServiceTask.MODEL_CONVERT,
+                    finish=finish,
+                    save=lambda result: MetadataHandler.save_metadata(data=result, folder_path=output_dir),
+                    cancel_task=self.cancel_conversion_task,
+                    sleep_interval=sleep_interval,
+                    eta_key=eta_key,
+                )
 
         except Exception as e:
             metadata = self.handle_error(metadata, ServiceTask.MODEL_CONVERT, e.args[0])
         except KeyboardInterrupt:
             metadata = self.handle_stop(metadata, ServiceTask.MODEL_CONVERT)
         finally:
-            MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
+            # Once submitted, the metadata is saved by the future
+            if future is None:
+                MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
+
+        if not wait_until_done:
+            return future if future is not None else TaskFuture.from_result(metadata)
 
         return metadata
 
+    def convert_matrix(
+        self,
+        input_model_path: str,
+        output_dir: str,
+        targets: List[ConvertTarget],
+        max_workers: int = 4,
+        sleep_interval: int = 30,
+    ) -> List[ConverterMetadata]:
+        """Convert a model for several frameworks, devices, data types or software versions at once.
+
+        The model is uploaded and validated once, and the available options are read once per framework.
+        Up to max_workers conversions run at the same time, each downloading its model as soon as it ends.
+        If the credit balance does not cover all targets, only the first ones that fit are converted and
+        the others fail with a credit error. On KeyboardInterrupt, the running tasks are cancelled on the server.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            output_dir (str): The local folder path under which each target gets its own folder,
+                named by ConvertTarget.get_name().
+            targets (List[ConvertTarget]): Conversion targets.
+            max_workers (int): Maximum number of conversions run at the same time. Default is 4.
+            sleep_interval (int): Longest interval in seconds between checks of each task. Default is 30.
+
+        Returns:
+            List[ConverterMetadata]: Convert metadata per target, in the order of targets.
+                A failed target has Status.ERROR and does not stop the others.
+        """
+
+        FileHandler.check_input_model_path(input_model_path)
+        self.token_handler.validate_token()
+
+        framework_options = {}
+        target_dirs, metadatas = [], []
+        for target in targets:
+            if target.framework not in framework_options:
+                framework_options[target.framework] = launcher_client_v2.benchmarker.read_framework_options(
+                    access_token=self.token_handler.tokens.access_token,
+                    framework=target.framework,
+                )
+            target_dir = FileHandler.create_unique_folder(folder_path=Path(output_dir) / target.get_name())
+            metadata = self.initialize_metadata(
+                output_dir=target_dir,
+                input_model_path=input_model_path,
+                target_framework=target.framework,
+                target_device=target.device_name,
+                target_software_version=target.software_version,
+                framework_options=framework_options[target.framework],
+            )
+            target_dirs.append(target_dir)
+            metadatas.append(metadata)
+
+        futures: Dict[int, TaskFuture[ConverterMetadata]] = {}
+
+        def start(metadata: ConverterMetadata, target: ConvertTarget, target_dir: Path) -> TaskFuture:
+            convert_response = self._start_task(
+                validate_model_response,
+                target_framework=target.framework,
+                target_device_name=target.device_name,
+                target_data_type=target.data_type,
+                target_software_version=target.software_version,
+                input_layer=target.input_layer,
+                dataset_path=target.dataset_path,
+            )
+            metadata.model_info = validate_model_response.data.to()
+            metadata.convert_task_info = convert_response.data.to(validate_model_response.data.uploaded_file_name)
+            MetadataHandler.save_metadata(data=metadata, folder_path=target_dir)
+
+            return self.submit_task(
+                launcher_client_v2.converter,
+                task_id=convert_response.data.convert_task_id,
+                metadata=metadata,
+                service_task=ServiceTask.MODEL_CONVERT,
+                finish=lambda response: self._update_result(metadata, response, target_dir, target.framework),
+                save=lambda result: MetadataHandler.save_metadata(data=result, folder_path=target_dir),
+                cancel_task=self.cancel_conversion_task,
+                sleep_interval=sleep_interval,
+                eta_key=f"convert:{target.framework}:{target.device_name}",
+            )
+
+        try:
+            # Credit-aware throttling: only submit the conversions the balance can pay for
+            current_credit = self.auth_client.get_credit(
+                access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+            service_credit = ServiceCredit.get_credit(ServiceTask.MODEL_CONVERT)
+            num_affordable = int(current_credit // service_credit)
+            if num_affordable < len(targets):
+                logger.warning(f"Credits cover {num_affordable} of {len(targets)} conversions.")
+                credit_error = NotEnoughCreditException(current_credit, service_credit, "conversion")
+                for metadata, target_dir in zip(metadatas[num_affordable:], target_dirs[num_affordable:]):
+                    self.handle_error(metadata, ServiceTask.MODEL_CONVERT, credit_error.args[0])
+                    MetadataHandler.save_metadata(data=metadata, folder_path=target_dir)
+
+            jobs = [i for i, metadata in enumerate(metadatas) if metadata.status not in [Status.ERROR, Status.STOPPED]]
+            if jobs:
+                validate_model_response = self.upload_model_file(launcher_client_v2.converter, input_model_path)
+
+                for i in jobs:
+                    running = [future for future in futures.values() if not future.done()]
+                    if len(running) >= max(1, max_workers):
+                        wait(running, return_when=FIRST_COMPLETED)
+                    try:
+                        futures[i] = start(metadatas[i], targets[i], target_dirs[i])
+                    except Exception as e:
+                        self.handle_error(metadatas[i], ServiceTask.MODEL_CONVERT, e.args[0])
+                        MetadataHandler.save_metadata(data=metadatas[i], folder_path=target_dirs[i])
+
+                # Metadata objects are updated in place
+                wait(futures.values())
+
+                if any(metadata.status == Status.COMPLETED for metadata in metadatas):
+                    self.print_remaining_credit(service_task=ServiceTask.MODEL_CONVERT)
+
+        except Exception as e:
+            for metadata, target_dir in zip(metadatas, target_dirs):
+                if metadata.status not in [Status.COMPLETED, Status.ERROR]:
+                    self.handle_error(metadata, ServiceTask.MODEL_CONVERT, e.args[0])
+                    MetadataHandler.save_metadata(data=metadata, folder_path=target_dir)
+        except KeyboardInterrupt:
+            for future in futures.values():
+                future.cancel()
+            for metadata, target_dir in zip(metadatas, target_dirs):
+                if metadata.status not in [Status.COMPLETED, Status.ERROR]:
+                    self.handle_stop(metadata, ServiceTask.MODEL_CONVERT)
+                    MetadataHandler.save_metadata(data=metadata, folder_path=target_dir)
+
+        return metadatas
+
     def get_conversion_task(self, conversion_task_id: str) -> ConvertTask:
         """Get the conversion task information with given conversion task uuid.
 
@@ -90,14 +90,15 @@ class NotValidInputModelPath(PyNPException):
 
 
 class GatewayTimeoutException(PyNPException):
-    def __init__(self, error_log):
-        message = "504 Gateway Timeout: The server did not receive a timely response."
+    def __init__(self, error_log, status_code: int = 504):
+        message = f"{status_code} Gateway Timeout: The server did not receive a timely response."
         super().__init__(
             data=AdditionalData(origin="pynp", error_log=error_log),
             error_code="",
             name=self.__class__.__name__,
             message=message,
         )
+        self.status_code = status_code
 
 
 class UnexpetedException(PyNPException):
@@ -109,6 +110,7 @@ class UnexpetedException(PyNPException):
             name=self.__class__.__name__,
             message=message,
         )
+        self.status_code = status_code
 
 
 class InternalServerErrorException(PyNPException):
@@ -120,3 +122,37 @@ class InternalServerErrorException(PyNPException):
             name=self.__class__.__name__,
             message=message,
         )
+        self.status_code = status_code
+
+
+class NetworkErrorException(PyNPException):
+    def __init__(self, error_log):
+        message = "Could not get a response from the server. Please check your network connection and try again."
+        super().__init__(
+            data=AdditionalData(origin="pynp", error_log=error_log),
+            error_code="",
+            name=self.__class__.__name__,
+            message=message,
+        )
+
+
+class FailedDownloadException(PyNPException):
+    def __init__(self, error_log: str):
+        message = "Failed to download the file. Please try again."
+        super().__init__(
+            data=AdditionalData(origin="pynp", error_log=error_log),
+            error_code="",
+            name=self.__class__.__name__,
+            message=message,
+        )
+
+
+class TaskTimeoutException(PyNPException):
+    def __init__(self, error_log: str, timeout: float):
+        message = f"The task did not finish within {timeout} seconds."
+        super().__init__(
+            data=AdditionalData(origin="pynp", error_log=error_log),
+            error_code="",
+            name=self.__class__.__name__,
+            message=message,
+        )
@@ -1,10 +1,16 @@
+import asyncio
+import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
+import onnxruntime
 from loguru import logger
 from netspresso_inference_package.inference.inference_service import InferenceService
 from omegaconf import OmegaConf
@@ -14,44 +20,196 @@ from netspresso.inferencer.postprocessors.classification import ClassificationPo
 from netspresso.inferencer.postprocessors.detection import DetectionPostprocessor
 from netspresso.inferencer.postprocessors.segmentation import SegmentationPostprocessor
 from netspresso.inferencer.preprocessors.base import Preprocessor
+from netspresso.inferencer.profiler import StageProfiler
+from netspresso.inferencer.stream import get_video_fps, is_video_file, iter_source, stream_pipeline
 from netspresso.inferencer.visualizers.classification import ClassificationVisualizer
 from netspresso.inferencer.visualizers.detection import DetectionVisualizer
 from netspresso.inferencer.visualizers.segmentation import SegmentationVisualizer
 
+ONNX_TENSOR_TYPES = {
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+    "tensor(double)": np.float64,
+    "tensor(uint8)": np.uint8,
+    "tensor(int8)": np.int8,
+    "tensor(int32)": np.int32,
+    "tensor(int64)": np.int64,
+    "tensor(bool)": np.bool_,
+}
+
+
+@dataclass
+class QuantizationParams:
+    scale: Union[np.float32, np.ndarray]
+    zero_point: Union[np.float32, np.ndarray]
+    dtype: type
+    qmin: int
+    qmax: int
+
+    def __post_init__(self):
+        self.inv_scale = np.float32(1) / self.scale
+
+    @classmethod
+    def from_tensor_detail(cls, tensor_detail: Dict) -> "QuantizationParams":
+        params = tensor_detail["quantization_parameters"]
+        scale = params["scales"].astype(np.float32)
+        zero_point = params["zero_points"].astype(np.float32)
+        if scale.size == 0:
+            scale, zero_point = (np.float32(value) for value in tensor_detail["quantization"])
+        elif scale.size == 1:
+            scale, zero_point = scale[0], zero_point[0]
+
+        dtype_info = np.iinfo(tensor_detail["dtype"])
+
+        return cls(scale, zero_point, tensor_detail["dtype"], dtype_info.min, dtype_info.max)
+
 
 class BaseInferencer:
-    def __init__(self, input_model_path) -> None:
+    def __init__(self, input_model_path, num_threads: int = 1) -> None:
         self.input_model_path = input_model_path
+        self.num_threads = num_threads
         self.inferencer = self._create_inferencer(input_model_path)
 
         self.suffix = Path(input_model_path).suffix
         self.runtime = Runtime.get_runtime_by_suffix(self.suffix)
 
-    def _inference(self, dataset_path: str):
-        inference_results = self.inferencer.inference(dataset_path)
+        self._session_lock = threading.Lock()
+        self._async_executor = None
+        self.profiler = StageProfiler(enabled=False)
+
+    def _inference(self, inputs: Union[str, np.ndarray]):
+        if isinstance(inputs, np.ndarray):
+            inference_results = self._run_session(self.create_input_dict(inputs))
+        else:
+            with self._session_lock:
+                inference_results = self.inferencer.inference(inputs)
 
         return inference_results
 
+    def _run_session(self, input_dict: Dict) -> Dict:
+        if self.runtime == Runtime.ONNX:
+            # InferenceSession.run is thread-safe, but the wrapping model object writes results into a shared dict
+            session = self.inferencer.model_obj.model_obj
+            output_names = list(self.inferencer.outputs)
+            return dict(zip(output_names, session.run(output_names, input_dict)))
+
+        # TFLite interpreters must not be invoked concurrently
+        with self._session_lock:
+            return self.inferencer.model_obj.inference(input_dict)
+
+    async def _ainference(self, func: Callable, *args, **kwargs):
+        """Run func on the inferencer's bounded thread pool without blocking the event loop."""
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.get_async_executor(), partial(func, *args, **kwargs))
+
+    def get_intra_op_threads(self) -> int:
+        if self.runtime == Runtime.ONNX:
+            session_options = self.inferencer.model_obj.model_obj.get_session_options()
+            return session_options.intra_op_num_threads or os.cpu_count() or 1
+
+        return self.num_threads
+
+    def get_async_executor(self) -> ThreadPoolExecutor:
+        """Thread pool used by the async API, sized so that concurrent runs do not oversubscribe the CPU cores."""
+
+        if self._async_executor is None:
+            max_workers = max(1, (os.cpu_count() or 1) // self.get_intra_op_threads())
+            self._async_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="np-async")
+
+        return self._async_executor
+
+    def enable_profiling(self, max_samples: int = 10000):
+        """Start recording per-stage latencies. They are available from profiler.summary() and export_profile()."""
+
+        self.profiler.max_samples = max_samples
+        self.profiler.enable()
+
+    def export_profile(self, file_path: str) -> str:
+        """Save p50/p95/p99 latencies per stage as .json or .csv."""
+
+        return self.profiler.export(file_path)
+
+    def create_input_dict(self, data: np.ndarray) -> Dict:
+        # Same mapping as NumpyDataLoader for a single .npy file, without the disk round trip
+        data = np.ascontiguousarray(data)
+
+        return dict.fromkeys(self.inferencer.inputs, data)
+
     def _create_inferencer(self, input_model_path: str):
-        inferencer = InferenceService(model_file_path=input_model_path)
+        inferencer = InferenceService(model_file_path=input_model_path, num_threads=self.num_threads)
 
         return inferencer
 
-    def transpose_input(self, input):
-        if self.runtime == Runtime.ONNX:
-            input = input.transpose(0, 3, 1, 2)
-        elif self.runtime == Runtime.TFLITE:
-            pass
+    @property
+    def layout(self) -> str:
+        """Native tensor layout of the runtime."""
+
+        return "nchw" if self.runtime == Runtime.ONNX else "nhwc"
 
-        return input
+    def has_dynamic_batch(self) -> bool:
+        """Whether inputs with a batch size other than the model's can be fed to the session."""
 
-    def transpose_outputs(self, outputs):
         if self.runtime == Runtime.ONNX:
-            pass
-        elif self.runtime == Runtime.TFLITE:
-            outputs = [np.transpose(index, (0, 3, 1, 2)) for index in outputs]  # (b, h, w, c) -> (b, c, h, w)
+            session = self.inferencer.model_obj.model_obj
+            return all(node.shape and not isinstance(node.shape[0], int) for node in session.get_inputs())
+
+        # TFLite inputs are resized on demand by set_batch_size
+        return True
+
+    def set_batch_size(self, batch_size: int):
+        if self.runtime == Runtime.TFLITE:
+            interpreter = self.inferencer.model_obj.interpreter_obj
+            resized = False
+            for input_detail in interpreter.get_input_details():
+                shape = input_detail["shape"]
+                if shape[0] != batch_size:
+                    interpreter.resize_tensor_input(input_detail["index"], [batch_size, *shape[1:]])
+                    resized = True
+            if resized:
+                interpreter.allocate_tensors()
+
+    def set_num_threads(self, num_threads: int):
+        """Reload the session with num_threads intra-op threads.
+
+        The ONNX session created by InferenceService ignores num_threads and uses every core, so it is
+        rebuilt with explicit session options here.
+        """
+
+        self.num_threads = num_threads
+        if self.runtime == Runtime.ONNX:
+            session_options = onnxruntime.SessionOptions()
+            session_options.intra_op_num_threads = num_threads
+            self.inferencer.model_obj.model_obj = onnxruntime.InferenceSession(
+                self.input_model_path, sess_options=session_options, providers=["CPUExecutionProvider"]
+            )
+        else:
+            self.inferencer = self._create_inferencer(self.input_model_path)
 
-        return outputs
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=True)
+            self._async_executor = None
+
+    def get_input_specs(self, batch_size: int = 1) -> Dict[Union[str, int], Tuple[Tuple, np.dtype]]:
+        """Shape and dtype of every model input, keyed like the input dict of the session.
+
+        A dynamic batch dimension is replaced with batch_size. Other dynamic dimensions are returned as None.
+        """
+
+        specs = {}
+        if self.runtime == Runtime.ONNX:
+            for node in self.inferencer.model_obj.model_obj.get_inputs():
+                shape = [dim if isinstance(dim, int) else None for dim in node.shape]
+                if shape and shape[0] is None:
+                    shape[0] = batch_size
+                specs[node.name] = (tuple(shape), np.dtype(ONNX_TENSOR_TYPES[node.type]))
+        else:
+            self.set_batch_size(batch_size)
+            for input_detail in self.inferencer.model_obj.interpreter_obj.get_input_details():
+                specs[input_detail["index"]] = (tuple(input_detail["shape"]), np.dtype(input_detail["dtype"]))
+
+        return specs
 
     def save_numpy_data(self, data):
         with tempfile.NamedTemporaryFile(suffix=".npy", delete=False) as temp_file:
@@ -67,33 +225,35 @@ class BaseInferencer:
             save_path.parent.mkdir(parents=True, exist_ok=True)
             logger.info(f"The folder has been created. Local Path: {save_path.parent}")
 
-        cv2.imwrite(save_path.as_posix(), cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+        with self.profiler.stage("save"):
+            cv2.imwrite(save_path.as_posix(), cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
         logger.info(f"Result image saved at {save_path}.")
 
         return save_path.as_posix()
 
 
 class NPInferencer(BaseInferencer):
-    def __init__(self, config_path: str, input_model_path: str) -> None:
-        super().__init__(input_model_path)
+    def __init__(self, config_path: str, input_model_path: str, num_threads: int = 1) -> None:
+        super().__init__(input_model_path, num_threads)
         self.config_path = config_path
         self.runtime_config = OmegaConf.load(config_path).runtime
+        self._buffers = threading.local()
+        self.build_quantization_table()
         self.build_preprocessor()
         self.build_postprocessor()
         self.build_visualizer()
 
     def build_preprocessor(self):
-        self.preprocessor = Preprocessor(self.runtime_config.preprocess)
+        self.preprocessor = Preprocessor(self.runtime_config.preprocess, layout=self.layout)
 
     def build_postprocessor(self):
         if self.runtime_config.task == Task.IMAGE_CLASSIFICATION:
             self.postprocessor = ClassificationPostprocessor()
         elif self.runtime_config.task == Task.OBJECT_DETECTION:
             params = self.runtime_config.postprocess.params
-            del params.class_agnostic
-            self.postprocessor = DetectionPostprocessor(**params)
+            self.postprocessor = DetectionPostprocessor(**params, layout=self.layout)
         elif self.runtime_config.task == Task.SEMANTIC_SEGMENTATION:
-            self.postprocessor = SegmentationPostprocessor()
+            self.postprocessor = SegmentationPostprocessor(layout=self.layout)
 
     def build_visualizer(self):
         params = self.runtime_config.visualize.params
@@ -104,93 +264,261 @@ class NPInferencer(BaseInferencer):
         if self.runtime_config.task == Task.SEMANTIC_SEGMENTATION:
             self.visualizer = SegmentationVisualizer(**params)
 
-    def quantize_input(self, input):
-        input_details = self.inferencer.model_obj.interpreter_obj.get_input_details()
-        self.is_int8 = False
+    def build_quantization_table(self):
+        """Resolve the scale/zero point of quantized TFLite inputs and outputs once, at load time."""
+
+        self.input_quantization = None
+        self.output_quantization = {}
+        if self.runtime != Runtime.TFLITE:
+            return
 
-        for input_detail in input_details:
+        interpreter = self.inferencer.model_obj.interpreter_obj
+        for input_detail in interpreter.get_input_details():
             if input_detail["dtype"] in [np.uint8, np.int8]:
-                scale, zero_point = input_detail["quantization"]
-                input = (input / scale + zero_point).astype("int8")
-                input = input.astype("int8")
-                self.is_int8 = True
+                self.input_quantization = QuantizationParams.from_tensor_detail(input_detail)
+                break
 
-        return input
+        for output_detail in interpreter.get_output_details():
+            if output_detail["dtype"] in [np.uint8, np.int8]:
+                self.output_quantization[output_detail["index"]] = QuantizationParams.from_tensor_detail(output_detail)
 
-    def dequantize_outputs(self, results):
-        if not self.is_int8:
-            return results
+    def _get_buffer(self, name: str, shape, dtype) -> np.ndarray:
+        # One reusable buffer per name and thread, reallocated only when the shape changes
+        buffers = self._buffers.__dict__
+        buffer = buffers.get(name)
+        if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+            buffer = buffers[name] = np.empty(shape, dtype=dtype)
+
+        return buffer
+
+    def quantize_input(self, input):
+        quantization = self.input_quantization
+        if quantization is None:
+            return input
 
-        output_details = self.inferencer.model_obj.interpreter_obj.get_output_details()
-        for output_detail in output_details:
-            index = output_detail["index"]
-            scale = output_detail["quantization_parameters"]["scales"]
-            zero_point = output_detail["quantization_parameters"]["zero_points"]
-            results[index] = (results[index].astype("float32") - zero_point.astype("float32")) * scale.astype("float32")
+        buffer = self._get_buffer("quantize", input.shape, np.float32)
+        np.multiply(input, quantization.inv_scale, out=buffer)
+        np.add(buffer, quantization.zero_point, out=buffer)
+        np.rint(buffer, out=buffer)
+        np.clip(buffer, quantization.qmin, quantization.qmax, out=buffer)
+
+        quantized = self._get_buffer("quantized", input.shape, quantization.dtype)
+        np.copyto(quantized, buffer, casting="unsafe")
+
+        return quantized
+
+    def dequantize_outputs(self, results):
+        for index, quantization in self.output_quantization.items():
+            output = np.subtract(results[index], quantization.zero_point, dtype=np.float32)
+            output *= quantization.scale
+            results[index] = output
 
         return results
 
     def preprocess_input(self, inputs):
-        if self.runtime == Runtime.ONNX:
-            input_data = self.transpose_input(input=inputs)
-        elif self.runtime == Runtime.TFLITE:
-            input_data = self.quantize_input(inputs)
+        # The preprocessor already emits the runtime's native layout
+        if self.runtime == Runtime.TFLITE:
+            inputs = self.quantize_input(inputs)
 
-        return input_data
+        return inputs
 
     def postprocess_output(self, outputs):
-        if self.runtime == Runtime.ONNX:
-            pass
-        elif self.runtime == Runtime.TFLITE:
+        # Outputs stay in the runtime's native layout, the postprocessors are built for it
+        if self.runtime == Runtime.TFLITE:
             outputs = self.dequantize_outputs(outputs)
 
         outputs = list(outputs.values())
-        outputs = self.transpose_outputs(outputs)
 
         return outputs
 
+    def load_image(self, image_path: str):
+        with self.profiler.stage("load"):
+            img = cv2.imread(image_path)
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+        return img
+
+    def preprocess(self, image, out: Optional[np.ndarray] = None):
+        with self.profiler.stage("preprocess"):
+            return self.preprocessor(image, out=out)
+
+    def run_model(self, img):
+        with self.profiler.stage("inference"):
+            input_data = self.preprocess_input(inputs=img)
+            inference_results = self._inference(input_data)
+            outputs = self.postprocess_output(outputs=inference_results)
+
+        return outputs
+
+    def draw(self, image, pred, model_input_shape):
+        with self.profiler.stage("visualize"):
+            return self.visualizer.draw(image=image, pred=pred, model_input_shape=model_input_shape)
+
+    def predict(self, outputs, model_input_shape):
+        """Run the task postprocessor and split its result into one prediction per image."""
+
+        with self.profiler.stage("postprocess"):
+            if self.runtime_config.task == Task.IMAGE_CLASSIFICATION:
+                preds = list(self.postprocessor({"pred": outputs[0]}, k=1))
+            elif self.runtime_config.task == Task.OBJECT_DETECTION:
+                preds = self.postprocessor({"pred": outputs}, model_input_shape)
+            elif self.runtime_config.task == Task.SEMANTIC_SEGMENTATION:
+                pred = self.postprocessor({"pred": outputs[0]}, model_input_shape)
+                preds = [pred[i : i + 1] for i in range(pred.shape[0])]
+
+        return preds
+
     def inference(self, image_path: str, save_path: str):
         # Load image
-        img = cv2.imread(image_path)
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        img = self.load_image(image_path)
         img_draw = img.copy()
 
         # Preprocess image
-        img = self.preprocessor(img)
-        input_data = self.preprocess_input(inputs=img)
-        dataset_path = self.save_numpy_data(data=input_data)
+        img = self.preprocess(img)
 
         # Inference data
-        inference_results = self._inference(dataset_path)
-        Path(dataset_path).unlink()
+        outputs = self.run_model(img)
 
         # Postprocess outputs
-        outputs = self.postprocess_output(outputs=inference_results)
-
-        model_input_shape = None
-
-        if self.runtime_config.task == Task.IMAGE_CLASSIFICATION:
-            pred = self.postprocessor({"pred": outputs[0]}, k=1)[0]
-        elif self.runtime_config.task == Task.OBJECT_DETECTION:
-            model_input_shape = img.shape[1:3]
-            pred = self.postprocessor({"pred": outputs}, model_input_shape)[0]
-        elif self.runtime_config.task == Task.SEMANTIC_SEGMENTATION:
-            model_input_shape = img.shape[1:3]
-            pred = self.postprocessor({"pred": outputs[0]}, model_input_shape)
+        model_input_shape = self.preprocessor.spatial_shape(img)
+        pred = self.predict(outputs, model_input_shape)[0]
 
         # Draw outputs
-        img_draw = self.visualizer.draw(image=img_draw, pred=pred, model_input_shape=model_input_shape)
+        img_draw = self.draw(image=img_draw, pred=pred, model_input_shape=model_input_shape)
 
         self.save_image(image=img_draw, save_path=save_path)
 
         return img_draw
 
+    async def ainference(self, image_path: str, save_path: str):
+        """Async version of inference. Many calls can be awaited together with asyncio.gather."""
+
+        return await self._ainference(self.inference, image_path, save_path)
+
+    def inference_batch(self, image_paths: List[str], batch_size: int = 8, save_dir: Optional[str] = None) -> List:
+        """Run inference on multiple images, executing the model once per batch.
+
+        Args:
+            image_paths (List[str]): Paths of the images to run inference on.
+            batch_size (int): Number of images stacked into a single model input. Default is 8.
+                Models with a fixed batch dimension run one image at a time.
+            save_dir (str, optional): Folder to save the visualized results to, one file per input image.
+
+        Returns:
+            List: Predictions in the same order as image_paths.
+        """
+
+        if not self.has_dynamic_batch():
+            batch_size = 1
+
+        preds = []
+        for start in range(0, len(image_paths), batch_size):
+            batch_paths = image_paths[start : start + batch_size]
+            images = [self.load_image(image_path) for image_path in batch_paths]
+
+            # Preprocess and stack images into one (b, h, w, c) input
+            img = self.preprocessor.allocate(batch_size=len(images))
+            if img is None:
+                img = np.concatenate([self.preprocess(image) for image in images], axis=0)
+            else:
+                for i, image in enumerate(images):
+                    self.preprocess(image, out=img[i : i + 1])
+
+            # Inference data
+            self.set_batch_size(batch_size=img.shape[0])
+            outputs = self.run_model(img)
+
+            # Postprocess outputs
+            model_input_shape = self.preprocessor.spatial_shape(img)
+            batch_preds = self.predict(outputs, model_input_shape)
+
+            if save_dir:
+                for image_path, image, pred in zip(batch_paths, images, batch_preds):
+                    img_draw = self.draw(image=image, pred=pred, model_input_shape=model_input_shape)
+                    self.save_image(image=img_draw, save_path=Path(save_dir) / Path(image_path).name)
+
+            preds.extend(batch_preds)
+
+        return preds
+
+    def inference_stream(
+        self,
+        source: str,
+        save_path: Optional[str] = None,
+        num_workers: int = 4,
+        queue_size: int = 8,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Run inference over an image folder, glob pattern or video file as a stream.
+
+        Image decoding and preprocessing, model execution, and postprocessing with visualization
+        and encoding run as overlapping stages, so the model is not left idle during file I/O.
+
+        Args:
+            source (str): Image folder, glob pattern (e.g. "images/*.jpg"), single image or video file.
+            save_path (str, optional): Where to save the visualized results. A folder for image sources,
+                a video file path (e.g. "result.mp4") for video sources. Nothing is drawn if not given.
+            num_workers (int): Number of threads for the decode and postprocess stages. Default is 4.
+            queue_size (int): Maximum number of frames buffered between stages. Default is 8.
+
+        Yields:
+            Tuple[str, Any]: Image file name (or "<video stem>_<frame index>") and its prediction.
+        """
+
+        is_video = is_video_file(source)
+        video_writer = None
+
+        def decode(item):
+            name, image = item
+            image = self.load_image(image) if isinstance(image, str) else cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+            return name, image, self.preprocess(image)
+
+        def run(data):
+            return self.run_model(data[2])
+
+        def encode(data, outputs):
+            name, image, img = data
+            model_input_shape = self.preprocessor.spatial_shape(img)
+            pred = self.predict(outputs, model_input_shape)[0]
+
+            img_draw = None
+            if save_path:
+                img_draw = self.draw(image=image, pred=pred, model_input_shape=model_input_shape)
+                if not is_video:
+                    self.save_image(image=img_draw, save_path=Path(save_path) / name)
+
+            return name, pred, img_draw
+
+        try:
+            for name, pred, img_draw in stream_pipeline(
+                iter_source(source), decode, run, encode, num_workers=num_workers, queue_size=queue_size
+            ):
+                if is_video and save_path:
+                    if video_writer is None:
+                        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+                        height, width = img_draw.shape[:2]
+                        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+                        video_writer = cv2.VideoWriter(save_path, fourcc, get_video_fps(source), (width, height))
+                    video_writer.write(cv2.cvtColor(img_draw, cv2.COLOR_RGB2BGR))
+
+                yield name, pred
+        finally:
+            if video_writer is not None:
+                video_writer.release()
+                logger.info(f"Result video saved at {save_path}.")
+
 
 class CustomInferencer(BaseInferencer):
-    def __init__(self, input_model_path: str) -> None:
-        super().__init__(input_model_path)
+    def __init__(self, input_model_path: str, num_threads: int = 1) -> None:
+        super().__init__(input_model_path, num_threads)
 
-    def inference(self, dataset_path: str):
-        inference_results = self._inference(dataset_path)
+    def inference(self, dataset_path: Union[str, np.ndarray]):
+        with self.profiler.stage("inference"):
+            inference_results = self._inference(dataset_path)
 
         return inference_results
+
+    async def ainference(self, dataset_path: Union[str, np.ndarray]):
+        """Async version of inference. Many calls can be awaited together with asyncio.gather."""
+
+        return await self._ainference(self.inference, dataset_path)
@@ -1,53 +1,65 @@
 from functools import partial
 
+import cv2
 import numpy as np
 
 
-def anchor_free_decoupled_head_decode(pred, original_shape, score_thresh=0.7):
-    pred = pred["pred"]
-    stage_strides = [original_shape[-1] // o.shape[-1] for o in pred]
-
-    hw = [x.shape[-2:] for x in pred]
-    dim_len = pred[0].shape[1]
-
-    pred = np.concatenate([x.reshape(1, dim_len, -1) for x in pred], axis=2).transpose(0, 2, 1)
-    pred[..., 4:] = 1 / (1 + (np.exp(-pred[..., 4:])))
+def make_grids(hw, stage_strides):
+    """Build the (h * w, 2) xy grid and the stride of every feature level."""
 
     grids = []
-    strides = []
     for (hsize, wsize), stride in zip(hw, stage_strides):
         yv, xv = np.meshgrid(np.arange(hsize, dtype="float32"), np.arange(wsize, dtype="float32"), indexing="ij")
-        grid = np.stack((xv, yv), 2).reshape(1, -1, 2)
-        grids.append(grid)
-        shape = grid.shape[:2]
-        strides.append(np.full((*shape, 1), stride, dtype="float32"))
-
-    grids = np.concatenate(grids, axis=1)
-    strides = np.concatenate(strides, axis=1)
-
-    pred = np.concatenate(
-        [(pred[..., 0:2] + grids) * strides, np.exp(pred[..., 2:4]) * strides, pred[..., 4:]], axis=-1
-    )
-
-    box_corner = np.empty(pred.shape)
-    box_corner[:, :, 0] = pred[:, :, 0] - pred[:, :, 2] / 2
-    box_corner[:, :, 1] = pred[:, :, 1] - pred[:, :, 3] / 2
-    box_corner[:, :, 2] = pred[:, :, 0] + pred[:, :, 2] / 2
-    box_corner[:, :, 3] = pred[:, :, 1] + pred[:, :, 3] / 2
-    pred[:, :, :4] = box_corner[:, :, :4]
-
-    # Discard boxes with low score
-    detections = []
-    for p in pred:
-        class_pred = np.argmax(p[:, 5:], 1, keepdims=True)
-        class_conf = p[np.arange(p.shape[0]), 5 + class_pred.squeeze()][:, np.newaxis]
+        grid = np.stack((xv, yv), 2).reshape(-1, 2)
+        grids.append((grid, np.float32(stride)))
 
-        conf_mask = (p[:, 4] * class_conf.squeeze() >= score_thresh).squeeze()
+    return grids
 
-        # x1, y1, x2, y2, obj_conf, pred_score, pred_label
-        detections.append(np.concatenate((p[:, :5], class_conf, class_pred), axis=1)[conf_mask])
 
-    return detections
+def anchor_free_decoupled_head_decode(pred, original_shape, score_thresh=0.7, grid_cache=None, layout="nchw"):
+    pred = pred["pred"]
+    if layout == "nhwc":
+        hw = [tuple(x.shape[1:3]) for x in pred]
+        dim_len = pred[0].shape[-1]
+    else:
+        hw = [tuple(x.shape[-2:]) for x in pred]
+        dim_len = pred[0].shape[1]
+    stage_strides = [original_shape[-1] // w for _, w in hw]
+    batch_size = pred[0].shape[0]
+
+    # Grids and strides only depend on the input and feature map shapes
+    key = (original_shape[-1], tuple(hw))
+    grids = grid_cache.get(key) if grid_cache is not None else None
+    if grids is None:
+        grids = make_grids(hw, stage_strides)
+        if grid_cache is not None:
+            grid_cache[key] = grids
+
+    # sigmoid is monotonic, so obj_conf * class_conf can be thresholded from the raw logits of the best class
+    # and only the surviving candidates are decoded.
+    detections = [[] for _ in range(batch_size)]
+    for x, (grid, stride) in zip(pred, grids):
+        if layout == "nhwc":
+            x = x.reshape(batch_size, -1, dim_len).transpose(0, 2, 1)  # strided (b, dim_len, h * w) view, no copy
+        else:
+            x = x.reshape(batch_size, dim_len, -1)
+        class_logit = x[:, 5:].max(axis=1)
+        score = 1 / (1 + np.exp(-x[:, 4])) * (1 / (1 + np.exp(-class_logit)))
+
+        for i in range(batch_size):
+            index = np.flatnonzero(score[i] >= score_thresh)
+            p = x[i][:, index].T.astype("float32")  # (k, dim_len)
+
+            xy = (p[:, 0:2] + grid[index]) * stride
+            wh = np.exp(p[:, 2:4]) * stride
+            obj_conf = 1 / (1 + np.exp(-p[:, 4:5]))
+            class_pred = np.argmax(p[:, 5:], axis=1)[:, np.newaxis]
+            class_conf = 1 / (1 + np.exp(-class_logit[i, index][:, np.newaxis]))
+
+            # x1, y1, x2, y2, obj_conf, pred_score, pred_label
+            detections[i].append(np.concatenate((xy - wh / 2, xy + wh / 2, obj_conf, class_conf, class_pred), axis=1))
+
+    return [np.concatenate(detection, axis=0) for detection in detections]
 
 
 def nms_fast_rcnn(dets, scores, thresh):
@@ -55,46 +67,68 @@ def nms_fast_rcnn(dets, scores, thresh):
     dets is a numpy array : num_dets, 4
     scores ia  nump array : num_dets,
     """
-    x1 = dets[:, 0]
-    y1 = dets[:, 1]
-    x2 = dets[:, 2]
-    y2 = dets[:, 3]
-
-    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
     order = scores.argsort()[::-1]  # get boxes with more ious first
+    x1, y1, x2, y2 = (dets[order, i].astype("float32") for i in range(4))
+    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
 
+    # Greedy suppression over the sorted boxes: each kept box suppresses the lower scored boxes it overlaps,
+    # computed against fixed coordinate arrays instead of re-slicing them on every iteration.
+    suppressed = np.zeros(len(order), dtype=bool)
     keep = []
-    while order.size > 0:
-        i = order[0]  # pick maxmum iou box
-        keep.append(i)
-        xx1 = np.maximum(x1[i], x1[order[1:]])
-        yy1 = np.maximum(y1[i], y1[order[1:]])
-        xx2 = np.minimum(x2[i], x2[order[1:]])
-        yy2 = np.minimum(y2[i], y2[order[1:]])
-
-        w = np.maximum(0.0, xx2 - xx1 + 1)  # maximum width
-        h = np.maximum(0.0, yy2 - yy1 + 1)  # maxiumum height
-        inter = w * h
-        ovr = inter / (areas[i] + areas[order[1:]] - inter)
+    for i in range(len(order)):
+        if suppressed[i]:
+            continue
+        keep.append(order[i])
 
-        inds = np.where(ovr <= thresh)[0]
-        order = order[inds + 1]
+        w = np.maximum(0.0, np.minimum(x2[i], x2[i + 1 :]) - np.maximum(x1[i], x1[i + 1 :]) + 1)
+        h = np.maximum(0.0, np.minimum(y2[i], y2[i + 1 :]) - np.maximum(y1[i], y1[i + 1 :]) + 1)
+        inter = w * h
+        ovr = inter / (areas[i] + areas[i + 1 :] - inter)
+        suppressed[i + 1 :] |= ovr > thresh
 
     return keep
 
 
-def nms(prediction, nms_thresh=0.45):
+def nms_cv2(dets, scores, thresh):
+    """NMS with cv2.dnn.NMSBoxes. Same interface as nms_fast_rcnn."""
+
+    xywh = np.concatenate([dets[:, :2], dets[:, 2:4] - dets[:, :2]], axis=1)
+    keep = cv2.dnn.NMSBoxes(xywh.astype("float32"), scores.astype("float32"), 0.0, thresh)
+
+    return np.array(keep, dtype=np.int64).reshape(-1)
+
+
+def nms(prediction, nms_thresh=0.45, class_agnostic=True, max_candidates=None, use_cv2=False):
+    """Run NMS per image.
+
+    Args:
+        prediction (List[np.ndarray]): (N, 7) detections per image: x1, y1, x2, y2, obj_conf, pred_score, pred_label.
+        nms_thresh (float): IoU threshold.
+        class_agnostic (bool): If False, boxes of different classes never suppress each other. This is done in a
+            single NMS pass by offsetting each class's boxes so that they cannot overlap other classes.
+        max_candidates (int, optional): Keep only the top scored candidates before NMS.
+        use_cv2 (bool): Use cv2.dnn.NMSBoxes instead of the NumPy implementation.
+    """
+
+    nms_func = nms_cv2 if use_cv2 else nms_fast_rcnn
+
     output = [np.zeros((0, 7)) for _ in range(len(prediction))]
     for i, image_pred in enumerate(prediction):
         # If none are remaining => process next image
         if not image_pred.shape[0]:
             continue
 
-        nms_out_index = nms_fast_rcnn(
-            image_pred[:, :4],
-            image_pred[:, 4] * image_pred[:, 5],
-            nms_thresh,
-        )
+        scores = image_pred[:, 4] * image_pred[:, 5]
+        if max_candidates and image_pred.shape[0] > max_candidates:
+            top_k = np.argpartition(-scores, max_candidates - 1)[:max_candidates]
+            image_pred, scores = image_pred[top_k], scores[top_k]
+
+        boxes = image_pred[:, :4]
+        if not class_agnostic:
+            offsets = image_pred[:, 6:7] * (boxes.max() - boxes.min() + 1)
+            boxes = boxes + offsets
+
+        nms_out_index = nms_func(boxes, scores, nms_thresh)
 
         image_pred = image_pred[nms_out_index]
         output[i] = np.concatenate((output[i], image_pred))
@@ -103,9 +137,20 @@ def nms(prediction, nms_thresh=0.45):
 
 
 class DetectionPostprocessor:
-    def __init__(self, score_thresh, nms_thresh):
-        self.decode_outputs = partial(anchor_free_decoupled_head_decode, score_thresh=score_thresh)
-        self.postprocess = partial(nms, nms_thresh=nms_thresh)
+    def __init__(
+        self, score_thresh, nms_thresh, class_agnostic=True, max_candidates=None, use_cv2_nms=False, layout="nchw"
+    ):
+        self.grid_cache = {}
+        self.decode_outputs = partial(
+            anchor_free_decoupled_head_decode, score_thresh=score_thresh, grid_cache=self.grid_cache, layout=layout
+        )
+        self.postprocess = partial(
+            nms,
+            nms_thresh=nms_thresh,
+            class_agnostic=class_agnostic,
+            max_candidates=max_candidates,
+            use_cv2=use_cv2_nms,
+        )
 
     def __call__(self, outputs, original_shape):
         pred = outputs
@@ -1,56 +1,73 @@
+import cv2
 import numpy as np
 
 
 class SegmentationPostprocessor:
-    def __init__(self):
-        pass
+    def __init__(self, argmax_before_upsample: bool = False, max_channels_per_pass: int = 16, layout: str = "nchw"):
+        """Upsample segmentation logits to the input size and take the per-pixel argmax.
+
+        Memory ceiling per image (H, W = output size, C = number of classes):
+            - argmax_before_upsample=False: H * W * min(C, max_channels_per_pass) * 4 bytes for the
+              upsampled float32 logits, plus H * W * 12 bytes for the running max and labels.
+              e.g. 1080p with the default 16 channels per pass is about 130 MB whatever the class count.
+            - argmax_before_upsample=True: H * W * 8 bytes for the label map only.
+
+        Args:
+            argmax_before_upsample (bool): Take the argmax at the logits' resolution and upsample only the
+                label map with nearest interpolation. Much cheaper, at the cost of blockier class boundaries.
+            max_channels_per_pass (int): Number of class channels upsampled at once. Lower values reduce the
+                memory ceiling. Capped at 128, the lowest channel limit of cv2.resize across OpenCV versions.
+            layout (str): Layout of the logits, "nchw" or "nhwc".
+        """
+
+        self.argmax_before_upsample = argmax_before_upsample
+        self.max_channels_per_pass = min(max_channels_per_pass, 128)
+        self.channel_axis = 1 if layout == "nchw" else -1
 
     def __call__(self, outputs, original_shape):
         pred = outputs["pred"]
         H, W = original_shape[-2:]
 
-        # Upsample logits to the images' original size using bilinear interpolation
-        pred_upsampled = np.zeros((pred.shape[0], pred.shape[1], H, W))
+        if self.argmax_before_upsample:
+            labels = np.argmax(pred, axis=self.channel_axis).astype("int32")
+            pred_classes = np.stack(
+                [cv2.resize(label, dsize=(W, H), interpolation=cv2.INTER_NEAREST) for label in labels]
+            )
+            return pred_classes.astype(np.intp)
 
+        pred_classes = np.empty((pred.shape[0], H, W), dtype=np.intp)
         for i in range(pred.shape[0]):  # Iterate over the batch
-            for j in range(pred.shape[1]):  # Iterate over the channels (classes)
-                pred_upsampled[i, j] = self.bilinear_interpolate(pred[i, j], (H, W))
-
-        # Take the argmax over the channel dimension to get the predicted class for each pixel
-        pred_classes = np.argmax(pred_upsampled, axis=1)
+            pred_classes[i] = self.upsample_argmax(pred[i], (H, W))
 
         return pred_classes
 
-    def bilinear_interpolate(self, img, new_shape):
-        H, W = new_shape
-        h_old, w_old = img.shape
-
-        # Calculate the ratios
-        row_ratio, col_ratio = h_old / H, w_old / W
-
-        # Create a meshgrid of the target image size
-        row_coords = np.arange(H) * row_ratio
-        col_coords = np.arange(W) * col_ratio
-
-        row_floor = np.floor(row_coords).astype(np.int32)
-        col_floor = np.floor(col_coords).astype(np.int32)
+    def upsample_argmax(self, logits, new_shape):
+        """Bilinearly upsample (C, h, w) or (h, w, C) logits and return the (H, W) argmax over C.
 
-        row_ceil = np.ceil(row_coords).clip(max=h_old - 1).astype(np.int32)
-        col_ceil = np.ceil(col_coords).clip(max=w_old - 1).astype(np.int32)
+        Channels are upsampled in chunks while keeping a running maximum, so the full
+        (C, H, W) logits are never materialized.
+        """
 
-        # Get the values of the four surrounding pixels for interpolation
-        top_left = img[row_floor[:, None], col_floor]
-        top_right = img[row_floor[:, None], col_ceil]
-        bottom_left = img[row_ceil[:, None], col_floor]
-        bottom_right = img[row_ceil[:, None], col_ceil]
-
-        # Calculate the fractional part of the coordinates
-        row_frac = row_coords - row_floor
-        col_frac = col_coords - col_floor
-
-        # Perform bilinear interpolation
-        top = top_left * (1 - col_frac) + top_right * col_frac
-        bottom = bottom_left * (1 - col_frac) + bottom_right * col_frac
-        interpolated = top * (1 - row_frac[:, None]) + bottom * row_frac[:, None]
-
-        return interpolated
+        H, W = new_shape
+        logits = logits.astype("float32", copy=False)
+        if self.channel_axis == 1:
+            logits = logits.transpose(1, 2, 0)  # (h, w, C) view
+
+        best_score = None
+        best_class = None
+        for start in range(0, logits.shape[-1], self.max_channels_per_pass):
+            chunk = np.ascontiguousarray(logits[..., start : start + self.max_channels_per_pass])
+            upsampled = cv2.resize(chunk, dsize=(W, H), interpolation=cv2.INTER_LINEAR).reshape(H, W, -1)
+
+            chunk_class = np.argmax(upsampled, axis=-1)
+            chunk_score = np.take_along_axis(upsampled, chunk_class[..., np.newaxis], axis=-1)[..., 0]
+
+            if best_score is None:
+                best_score, best_class = chunk_score, chunk_class
+            else:
+                # Strict comparison keeps the first class on ties, like a single argmax would
+                mask = chunk_score > best_score
+                best_score[mask] = chunk_score[mask]
+                best_class[mask] = chunk_class[mask] + start
+
+        return best_class
@@ -1,4 +1,5 @@
 from functools import partial
+from typing import Optional
 
 import cv2
 import numpy as np
@@ -10,6 +11,10 @@ INVERSE_MODES_MAPPING = {
     "bicubic": cv2.INTER_CUBIC,
 }
 
+# (img / 255 - mean) / std folded into a single img * NORMALIZE_SCALE + NORMALIZE_OFFSET
+NORMALIZE_SCALE = (1.0 / (255.0 * np.array(IMAGENET_DEFAULT_STD))).astype("float32")
+NORMALIZE_OFFSET = (-np.array(IMAGENET_DEFAULT_MEAN) / np.array(IMAGENET_DEFAULT_STD)).astype("float32")
+
 
 def resize_img(img, size, interpolation, max_size, resize_criteria):
     assert isinstance(size, int), "Only support int type ``size`` now."
@@ -30,12 +35,12 @@ def pad_img(img, size, fill):
     return padded
 
 
-def normalize(img):
-    img = img.astype("float32") / 255.0
-    img = img - np.array(IMAGENET_DEFAULT_MEAN).reshape(1, 1, -1).astype("float32")
-    img = img / np.array(IMAGENET_DEFAULT_STD).reshape(1, 1, -1).astype("float32")
-    img = img[np.newaxis, ...]
-    return img
+def normalize(img, out: Optional[np.ndarray] = None):
+    if out is None:
+        out = np.empty(img.shape, dtype="float32")
+    np.multiply(img, NORMALIZE_SCALE, out=out, casting="unsafe")
+    np.add(out, NORMALIZE_OFFSET, out=out)
+    return out
 
 
 class Preprocessor:
@@ -44,8 +49,19 @@ class Preprocessor:
         "pad": pad_img,
     }
 
-    def __init__(self, preprocess_list):
+    def __init__(self, preprocess_list, layout: str = "nhwc"):
+        """Build the transforms of the runtime config.
+
+        Args:
+            preprocess_list: Transform configs from the runtime config.
+            layout (str): Layout of the produced tensor, "nhwc" or "nchw". Emitting the runtime's
+                native layout directly avoids transposing the input on every frame.
+        """
+
+        assert layout in ["nhwc", "nchw"], "Only support ``nhwc`` and ``nchw`` layout."
+        self.layout = layout
         self.transforms = []
+        self.pad_size = None
         for transform in preprocess_list:
             name = transform["name"]
             augment_kwargs = list(transform.keys())
@@ -54,8 +70,63 @@ class Preprocessor:
             transform = partial(self.DEVICE_TRANSFORM_DICT[name], **augment_kwargs)
             self.transforms.append(transform)
 
-    def __call__(self, img):
+        # A trailing pad is fused with normalization: the image is normalized straight into
+        # the padded input tensor and the border is filled with the already normalized fill value.
+        if self.transforms and self.transforms[-1].func is pad_img:
+            pad = self.transforms.pop()
+            self.pad_size = pad.keywords["size"]
+            self.pad_value = normalize(np.full((1, 1, 3), pad.keywords["fill"], dtype="uint8"))[0, 0]
+
+    @property
+    def output_shape(self):
+        """Shape of one preprocessed image in self.layout, or None if it depends on the input image."""
+
+        return self._layout_shape(self.pad_size, self.pad_size) if self.pad_size else None
+
+    def _layout_shape(self, h, w):
+        return (h, w, 3) if self.layout == "nhwc" else (3, h, w)
+
+    def _hwc_view(self, tensor):
+        # (h, w, c) view of a single image tensor in self.layout, so that both layouts are written in one pass
+        return tensor if self.layout == "nhwc" else tensor.transpose(1, 2, 0)
+
+    def spatial_shape(self, tensor):
+        """(h, w) of a preprocessed (b, ...) tensor."""
+
+        return tensor.shape[1:3] if self.layout == "nhwc" else tensor.shape[2:4]
+
+    def allocate(self, batch_size: int = 1) -> Optional[np.ndarray]:
+        """Allocate an input tensor that __call__ can write batch_size images into."""
+
+        if self.output_shape is None:
+            return None
+
+        return np.empty((batch_size, *self.output_shape), dtype="float32")
+
+    def __call__(self, img, out: Optional[np.ndarray] = None):
+        """Preprocess an image into a (1, h, w, c) or (1, c, h, w) float32 tensor, following self.layout.
+
+        Args:
+            img (np.ndarray): RGB image of shape (h, w, c).
+            out (np.ndarray, optional): Preallocated tensor to write into, e.g. a slice of the tensor
+                returned by allocate(). A new tensor is allocated if not given.
+        """
+
         for transform in self.transforms:
             img = transform(img)
-        img = normalize(img)
-        return img
+
+        h, w = img.shape[:2]
+        if self.pad_size is None:
+            if out is None:
+                out = np.empty((1, *self._layout_shape(h, w)), dtype="float32")
+            normalize(img, out=self._hwc_view(out[0]))
+            return out
+
+        assert h <= self.pad_size and w <= self.pad_size, "Image is larger than the ``pad`` size."
+        if out is None:
+            out = self.allocate()
+        padded = self._hwc_view(out[0])
+        normalize(img, out=padded[:h, :w])
+        padded[h:, :] = self.pad_value
+        padded[:h, w:] = self.pad_value
+        return out
@@ -0,0 +1,111 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+_DISABLED = nullcontext()
+
+
+class StageProfiler:
+    def __init__(self, enabled: bool = False, max_samples: int = 10000) -> None:
+        """Per-stage latency recorder of an inferencer.
+
+        Durations are kept in a ring buffer of the last max_samples runs per stage, so memory stays
+        bounded when profiling is left on. When disabled, stage() returns a shared no-op context manager.
+
+        Args:
+            enabled (bool): Whether to record durations. Default is False.
+            max_samples (int): Number of most recent durations kept per stage. Default is 10000.
+        """
+
+        self.enabled = enabled
+        self.samples: Dict[str, deque] = {}
+        self.max_samples = max_samples
+
+    @property
+    def max_samples(self) -> int:
+        return self._max_samples
+
+    @max_samples.setter
+    def max_samples(self, max_samples: int):
+        self._max_samples = max_samples
+        # A deque keeps the maxlen it was created with, so the stages already recorded are rebuilt
+        for name, samples in list(self.samples.items()):
+            if samples.maxlen != max_samples:
+                self.samples[name] = deque(samples, maxlen=max_samples)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.samples = {}
+
+    def stage(self, name: str):
+        """Context manager timing one stage, e.g. ``with profiler.stage("preprocess"):``."""
+
+        if not self.enabled:
+            return _DISABLED
+
+        return self._timer(name)
+
+    @contextmanager
+    def _timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples.setdefault(name, deque(maxlen=self.max_samples))
+        samples.append(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Latency statistics in milliseconds per stage, in the order stages were first seen."""
+
+        summary = {}
+        for name, samples in list(self.samples.items()):
+            latencies = np.array(samples) * 1000
+            if not latencies.size:
+                continue
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            summary[name] = {
+                "count": int(latencies.size),
+                "mean_ms": float(latencies.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "max_ms": float(latencies.max()),
+            }
+
+        return summary
+
+    def export(self, file_path: str) -> str:
+        """Save the summary as .json or .csv, chosen by the file suffix."""
+
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        summary = self.summary()
+
+        if file_path.suffix == ".csv":
+            fields = ["stage", "count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+            with open(file_path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                for name, stats in summary.items():
+                    writer.writerow({"stage": name, **stats})
+        else:
+            with open(file_path, "w") as f:
+                json.dump(summary, f, indent=4)
+
+        return file_path.as_posix()
@@ -0,0 +1,281 @@
+import io
+import json
+import queue
+import threading
+import time
+from argparse import ArgumentParser
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from netspresso.inferencer.inferencer import CustomInferencer
+
+_STOP = object()
+
+
+class InferenceRequest:
+    def __init__(self, data: np.ndarray) -> None:
+        self.data = data
+        self.future = Future()
+
+
+class ModelWorkerPool:
+    def __init__(
+        self, input_model_path: str, num_sessions: int = 1, max_batch_size: int = 8, max_wait_ms: float = 2.0
+    ) -> None:
+        """Keep warm inference sessions of one model and micro-batch the requests sent to them.
+
+        Each session is served by its own worker thread. A worker takes the oldest pending request,
+        waits up to max_wait_ms for more requests with the same input shape, runs them as one batch
+        and splits the outputs back to the callers.
+
+        Args:
+            input_model_path (str): Path to the ONNX or TFLite model.
+            num_sessions (int): Number of sessions (and worker threads) kept loaded. Default is 1.
+            max_batch_size (int): Maximum number of samples run in one batch. Batching is disabled
+                for ONNX models with a fixed batch dimension. Default is 8.
+            max_wait_ms (float): Maximum time to wait for more requests before running a batch. Default is 2.0.
+        """
+
+        self.input_model_path = input_model_path
+        self.max_wait = max_wait_ms / 1000
+        self.requests = queue.Queue()
+        self.sessions = [CustomInferencer(input_model_path=input_model_path) for _ in range(num_sessions)]
+        self.max_batch_size = max_batch_size if self.sessions[0].has_dynamic_batch() else 1
+        self.workers = [
+            threading.Thread(target=self._serve, args=(session,), name=f"np-serve-{i}", daemon=True)
+            for i, session in enumerate(self.sessions)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+        logger.info(f"{num_sessions} session(s) loaded for {input_model_path} (max batch size {self.max_batch_size}).")
+
+    def submit(self, data: np.ndarray) -> Future:
+        """Queue a (b, ...) input and return a future of its {output name: array} results."""
+
+        request = InferenceRequest(data)
+        self.requests.put(request)
+
+        return request.future
+
+    def inference(self, data: np.ndarray, timeout: Optional[float] = None) -> Dict:
+        return self.submit(data).result(timeout=timeout)
+
+    def close(self):
+        for _ in self.workers:
+            self.requests.put(_STOP)
+        for worker in self.workers:
+            worker.join()
+
+    def _collect_batch(self, first: InferenceRequest) -> Tuple[List[InferenceRequest], Optional[InferenceRequest]]:
+        """Batch first with the requests that arrive within max_wait.
+
+        Returns the batch and the request that did not fit in it, if any. That request starts the worker's
+        next batch instead of going back to the queue, where later requests would get ahead of it.
+        """
+
+        batch = [first]
+        size = first.data.shape[0]
+        deadline = time.monotonic() + self.max_wait
+
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            compatible = (
+                request is not _STOP
+                and request.data.shape[1:] == first.data.shape[1:]
+                and request.data.dtype == first.data.dtype
+                and size + request.data.shape[0] <= self.max_batch_size
+            )
+            if not compatible:
+                return batch, request
+
+            batch.append(request)
+            size += request.data.shape[0]
+
+        return batch, None
+
+    def _serve(self, session: CustomInferencer):
+        leftover = None
+        while True:
+            request = leftover if leftover is not None else self.requests.get()
+            if request is _STOP:
+                return
+
+            batch, leftover = self._collect_batch(request)
+            try:
+                data = batch[0].data if len(batch) == 1 else np.concatenate([r.data for r in batch], axis=0)
+                session.set_batch_size(batch_size=data.shape[0])
+                outputs = dict(session.inference(data))
+            except Exception as e:
+                for r in batch:
+                    r.future.set_exception(e)
+                continue
+
+            start = 0
+            for r in batch:
+                end = start + r.data.shape[0]
+                r.future.set_result({key: value[start:end] for key, value in outputs.items()})
+                start = end
+
+
+class InferenceServer:
+    def __init__(
+        self,
+        models: Dict[str, str],
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        num_sessions: int = 1,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        """Local HTTP inference server built on the standard library.
+
+        Endpoints:
+            GET  /health                    -> {"status": "ok"}
+            GET  /v1/models                 -> {name: model path}
+            POST /v1/models/<name>/infer    body: input array saved with np.save,
+                                            response: outputs saved with np.savez, keyed by output name.
+
+        Args:
+            models (Dict[str, str]): Model name to ONNX/TFLite model path. Names sharing a path share one pool.
+            host (str): Address to bind. Default is 127.0.0.1.
+            port (int): Port to bind. 0 picks a free port. Default is 8000.
+            num_sessions (int): Warm sessions (and worker threads) per model. Default is 1.
+            max_batch_size (int): Maximum micro-batch size. Default is 8.
+            max_wait_ms (float): Maximum time a request waits for others to batch with. Default is 2.0.
+        """
+
+        self.models = models
+        pools = {}
+        self.pools = {}
+        for name, model_path in models.items():
+            key = Path(model_path).resolve().as_posix()
+            if key not in pools:
+                pools[key] = ModelWorkerPool(model_path, num_sessions, max_batch_size, max_wait_ms)
+            self.pools[name] = pools[key]
+
+        self.httpd = ThreadingHTTPServer((host, port), self._create_handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_json(self, status: int, data):
+                self._send(status, json.dumps(data).encode(), "application/json")
+
+            def do_GET(self):
+                if self.path == "/health":
+                    self._send_json(200, {"status": "ok"})
+                elif self.path == "/v1/models":
+                    self._send_json(200, server.models)
+                else:
+                    self._send_json(404, {"detail": f"Not found: {self.path}"})
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+                parts = self.path.strip("/").split("/")
+                if len(parts) != 4 or parts[:2] != ["v1", "models"] or parts[3] != "infer":
+                    return self._send_json(404, {"detail": f"Not found: {self.path}"})
+                if parts[2] not in server.pools:
+                    return self._send_json(404, {"detail": f"Unknown model: {parts[2]}"})
+
+                try:
+                    data = np.load(io.BytesIO(body), allow_pickle=False)
+                except Exception as e:
+                    return self._send_json(400, {"detail": f"Invalid .npy body: {e}"})
+
+                try:
+                    outputs = server.pools[parts[2]].inference(data)
+                except Exception as e:
+                    logger.error(f"Inference failed: {e}")
+                    return self._send_json(500, {"detail": str(e)})
+
+                buffer = io.BytesIO()
+                np.savez(buffer, **{str(key): value for key, value in outputs.items()})
+                self._send(200, buffer.getvalue(), "application/octet-stream")
+
+            def log_message(self, format, *args):
+                # Per-request access logs are too noisy at serving rates
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        logger.info(f"Inference server listening on {self.url}")
+        self.httpd.serve_forever()
+
+    def start(self):
+        """Serve on a background thread."""
+
+        self.thread = threading.Thread(target=self.serve_forever, name="np-server", daemon=True)
+        self.thread.start()
+
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+        for pool in set(self.pools.values()):
+            pool.close()
+
+
+def get_args():
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--model",
+        action="append",
+        required=True,
+        help="Model to serve as NAME=PATH. Can be given multiple times.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind. Default is 127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind. Default is 8000")
+    parser.add_argument("--num-sessions", type=int, default=1, help="Warm sessions per model. Default is 1")
+    parser.add_argument("--max-batch-size", type=int, default=8, help="Maximum micro-batch size. Default is 8")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Maximum batching delay. Default is 2.0")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+    models = dict(model.split("=", 1) for model in args.model)
+    server = InferenceServer(
+        models=models,
+        host=args.host,
+        port=args.port,
+        num_sessions=args.num_sessions,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.close()
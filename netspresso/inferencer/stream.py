@@ -0,0 +1,168 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from glob import glob
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+import cv2
+
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+VIDEO_SUFFIXES = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+
+_END = object()
+
+
+def is_video_file(source: str) -> bool:
+    return Path(source).is_file() and Path(source).suffix.lower() in VIDEO_SUFFIXES
+
+
+def get_video_fps(video_path: str, default: float = 30.0) -> float:
+    capture = cv2.VideoCapture(video_path)
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    capture.release()
+
+    return fps if fps > 0 else default
+
+
+def iter_video_frames(video_path: str) -> Iterator[Tuple[str, Any]]:
+    capture = cv2.VideoCapture(video_path)
+    stem = Path(video_path).stem
+    try:
+        index = 0
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            yield f"{stem}_{index:06d}", frame
+            index += 1
+    finally:
+        capture.release()
+
+
+def iter_image_paths(source: str) -> Iterator[Tuple[str, str]]:
+    source_path = Path(source)
+    if source_path.is_dir():
+        image_paths = sorted(p for p in source_path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    elif source_path.is_file():
+        image_paths = [source_path]
+    else:
+        image_paths = sorted(Path(p) for p in glob(source) if Path(p).suffix.lower() in IMAGE_SUFFIXES)
+
+    for image_path in image_paths:
+        yield image_path.name, image_path.as_posix()
+
+
+def iter_source(source: str) -> Iterator[Tuple[str, Any]]:
+    """Yield (name, item) pairs from an image folder, a glob pattern, a single image or a video file.
+
+    Images are yielded as file paths so that decoding can happen in a worker thread,
+    video frames are yielded as BGR arrays because a capture can only be read sequentially.
+    """
+
+    if is_video_file(source):
+        return iter_video_frames(source)
+
+    return iter_image_paths(source)
+
+
+def _failed(exception: BaseException) -> Future:
+    future = Future()
+    future.set_exception(exception)
+
+    return future
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+
+    return False
+
+
+def stream_pipeline(
+    items: Iterable,
+    decode: Callable,
+    run: Callable,
+    encode: Callable,
+    num_workers: int = 4,
+    queue_size: int = 8,
+) -> Iterator:
+    """Run decode -> run -> encode over items with overlapping stages, preserving the input order.
+
+    decode and encode are executed on thread pools of num_workers threads, run is executed on
+    a single dedicated thread so the model session is never called concurrently. Stages are
+    connected by queues of at most queue_size entries, which bounds the number of frames in flight.
+
+    Args:
+        items (Iterable): Source items, consumed on a reader thread.
+        decode (Callable): decode(item) -> data.
+        run (Callable): run(data) -> outputs.
+        encode (Callable): encode(data, outputs) -> result.
+        num_workers (int): Number of threads for each of the decode and encode stages.
+        queue_size (int): Maximum number of pending items between two stages.
+
+    Yields:
+        The encode results, in the order of items.
+    """
+
+    decoded = queue.Queue(maxsize=queue_size)
+    encoded = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    decode_pool = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="np-decode")
+    encode_pool = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="np-encode")
+
+    def read():
+        try:
+            for item in items:
+                if not _put(decoded, decode_pool.submit(decode, item), stop):
+                    return
+        except Exception as e:
+            _put(decoded, _failed(e), stop)
+            return
+        _put(decoded, _END, stop)
+
+    def execute():
+        while not stop.is_set():
+            try:
+                future = decoded.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if future is _END:
+                _put(encoded, _END, stop)
+                return
+
+            try:
+                data = future.result()
+                outputs = run(data)
+            except Exception as e:
+                _put(encoded, _failed(e), stop)
+                return
+
+            if not _put(encoded, encode_pool.submit(encode, data, outputs), stop):
+                return
+
+    threads = [
+        threading.Thread(target=read, name="np-read", daemon=True),
+        threading.Thread(target=execute, name="np-run", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            future = encoded.get()
+            if future is _END:
+                break
+            yield future.result()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        decode_pool.shutdown(wait=True)
+        encode_pool.shutdown(wait=True)
@@ -12,11 +12,11 @@ class DetectionVisualizer:
 
     def draw(self, image, pred, model_input_shape=None, text_scale=0.7, text_thickness=2, bbox_thickness=2):
         resize_factor = max((image.shape[0] / model_input_shape[0]), (image.shape[1] / model_input_shape[1]))
-        pred[0][:, 1::2] *= resize_factor
-        pred[0][:, :4:2] *= resize_factor
+        bboxes = pred[0].copy()
+        bboxes[:, :4] *= resize_factor
 
         visualize_image = image.copy()
-        for bbox_label, class_label in zip(pred[0], pred[1]):
+        for bbox_label, class_label in zip(bboxes, pred[1]):
             # Get bbox coordinates
             x1 = int(bbox_label[0])
             y1 = int(bbox_label[1])
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import cv2
 import numpy as np
 from matplotlib import pyplot as plt
@@ -6,32 +8,39 @@ from netspresso.inferencer.visualizers.utils import voc_color_map
 
 
 class SegmentationVisualizer:
-    def __init__(self, class_map, pallete=None, normalized=False, brightness_factor=1.5):
+    def __init__(
+        self, class_map, pallete=None, normalized=False, brightness_factor=1.5, overlay_alpha: Optional[float] = None
+    ):
         self.cmap = voc_color_map(N=256, normalized=normalized, brightness_factor=brightness_factor)
         self.class_map = class_map
+        self.overlay_alpha = overlay_alpha
+
+        # Palette for a single gather, with the void label (255) drawn white
+        self.palette = self.cmap.astype(np.uint8, copy=True)
+        self.palette[255] = 255
 
     def draw(self, image, pred, model_input_shape=None):
         result_images = []
         for _real_gray_image in pred:
             converted_image = self._convert(image, _real_gray_image)
-            converted_image = np.transpose(converted_image, (1, 2, 0))
+            if self.overlay_alpha is not None:
+                converted_image = self._overlay(image, converted_image, model_input_shape)
             result_images.append(converted_image)
 
         return result_images[0]
 
     def _convert(self, image, gray_image):
         assert len(gray_image.shape) == 2
-        size = gray_image.shape
-        color_image = np.zeros((3, size[0], size[1]), dtype=np.uint8)
 
-        for label in range(0, len(self.cmap)):
-            mask = label == gray_image
-            color_image[0][mask] = self.cmap[label][0]
-            color_image[1][mask] = self.cmap[label][1]
-            color_image[2][mask] = self.cmap[label][2]
+        return self.palette[gray_image]
 
-        # handle void
-        mask = gray_image == 255
-        color_image[0][mask] = color_image[1][mask] = color_image[2][mask] = 255
+    def _overlay(self, image, color_image, model_input_shape=None):
+        # Drop the padded area and bring the color map back to the source image size
+        if model_input_shape is not None:
+            resize_factor = max((image.shape[0] / model_input_shape[0]), (image.shape[1] / model_input_shape[1]))
+            h = min(round(image.shape[0] / resize_factor), color_image.shape[0])
+            w = min(round(image.shape[1] / resize_factor), color_image.shape[1])
+            color_image = color_image[:h, :w]
+        color_image = cv2.resize(color_image, dsize=(image.shape[1], image.shape[0]), interpolation=cv2.INTER_NEAREST)
 
-        return color_image
+        return cv2.addWeighted(image, 1 - self.overlay_alpha, color_image, self.overlay_alpha, 0)
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 import numpy as np
 
 
+@lru_cache(maxsize=None)
 def voc_color_map(N=256, normalized=False, brightness_factor=1.5):
     def bitget(byteval, idx):
         return (byteval & (1 << idx)) != 0
@@ -25,4 +28,7 @@ def voc_color_map(N=256, normalized=False, brightness_factor=1.5):
 
     if normalized:
         cmap = cmap / 255
+
+    # The map is cached and shared between visualizers
+    cmap.flags.writeable = False
     return cmap
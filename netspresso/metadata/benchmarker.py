@@ -46,3 +46,14 @@ class BenchmarkerMetadata(BaseMetadata):
     input_model_path: str = ""
     benchmark_task_info: BenchmarkTaskInfo = field(default_factory=BenchmarkTaskInfo)
     benchmark_result: BenchmarkResult = field(default_factory=BenchmarkResult)
+
+
+@dataclass
+class LocalBenchmarkResult(BenchmarkResult):
+    latency_p50: float = None
+    latency_p95: float = None
+    latency_p99: float = None
+    throughput: float = None
+    batch_size: int = 1
+    num_threads: int = 1
+    iterations: int = 0
@@ -4,7 +4,7 @@ from typing import Optional, Union
 
 from loguru import logger
 
-from netspresso.benchmarker import BenchmarkerV2
+from netspresso.benchmarker import BenchmarkerV2, LocalBenchmarker
 from netspresso.clients.auth import TokenHandler, auth_client
 from netspresso.clients.auth.response_body import UserResponse
 from netspresso.clients.tao import TAOTokenHandler
@@ -15,6 +15,7 @@ from netspresso.inferencer.inferencer import CustomInferencer, NPInferencer
 from netspresso.np_qai.benchmarker import NPQAIBenchmarker
 from netspresso.np_qai.converter import NPQAIConverter
 from netspresso.np_qai.quantizer import NPQAIQuantizer
+from netspresso.pipeline import Pipeline
 from netspresso.quantizer import Quantizer
 from netspresso.tao import TAOTrainer
 from netspresso.trainer import Trainer
@@ -112,6 +113,34 @@ class NetsPresso:
         """
         return BenchmarkerV2(token_handler=self.token_handler, user_info=self.user_info)
 
+    def pipeline(
+        self, work_dir: Optional[str] = None, max_workers: Optional[int] = None, yaml_path: Optional[str] = None
+    ) -> Pipeline:
+        """Initialize and return a Pipeline instance.
+
+        Args:
+            work_dir (str, optional): Folder of the stage outputs and of the pipeline state.
+                Required unless yaml_path defines it.
+            max_workers (int, optional): Maximum number of stages run at the same time.
+                Default is the value of the YAML file, or 4.
+            yaml_path (str, optional): YAML file defining the stages, see Pipeline.from_yaml.
+
+        Returns:
+            Pipeline: Initialized Pipeline instance.
+        """
+        if yaml_path is not None:
+            return Pipeline.from_yaml(netspresso=self, yaml_path=yaml_path, work_dir=work_dir, max_workers=max_workers)
+
+        return Pipeline(netspresso=self, work_dir=work_dir, max_workers=max_workers if max_workers is not None else 4)
+
+    def local_benchmarker(self) -> LocalBenchmarker:
+        """Initialize and return a LocalBenchmarker instance.
+
+        Returns:
+            LocalBenchmarker: Initialized LocalBenchmarker instance.
+        """
+        return LocalBenchmarker()
+
     def np_inferencer(self, config_path: str, input_model_path: str) -> NPInferencer:
         """Initialize and return a Inferencer instance.
 
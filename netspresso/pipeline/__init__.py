@@ -0,0 +1,3 @@
+from netspresso.pipeline.pipeline import Pipeline, Stage, StageResult
+
+__all__ = ["Pipeline", "Stage", "StageResult"]
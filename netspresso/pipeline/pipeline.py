@@ -0,0 +1,312 @@
+import hashlib
+import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from loguru import logger
+from omegaconf import OmegaConf
+
+from netspresso.clients.utils.downloader import compute_hash
+from netspresso.enums import Status, TaskType
+from netspresso.utils import FileHandler
+from netspresso.utils.metadata import MetadataHandler
+
+if TYPE_CHECKING:
+    from netspresso.netspresso import NetsPresso
+
+
+@dataclass
+class Stage:
+    """One step of a Pipeline.
+
+    Attributes:
+        name (str): Unique name of the stage. Its outputs are saved under work_dir/name.
+        task (TaskType): TRAIN, COMPRESS, CONVERT, QUANTIZE or BENCHMARK.
+        params (Dict[str, Any]): Arguments of the stage's method, except input_model_path and output_dir:
+            TRAIN: yaml_path, gpus and project_name of Trainer.train.
+            COMPRESS: CompressorV2.automatic_compression, e.g. input_shapes, framework, compression_ratio.
+            CONVERT: ConverterV2.convert_model, e.g. target_framework, target_device_name.
+            QUANTIZE: Quantizer.uniform_precision_quantization, e.g. dataset_path.
+            BENCHMARK: BenchmarkerV2.benchmark_model, e.g. target_device_name.
+        depends_on (List[str]): Stages run before this one. The output model of the first is its input model.
+        input_model_path (str, optional): Input model of a stage without dependencies.
+    """
+
+    name: str
+    task: Union[str, TaskType]
+    params: Dict[str, Any] = field(default_factory=dict)
+    depends_on: List[str] = field(default_factory=list)
+    input_model_path: Optional[str] = None
+
+    def __post_init__(self):
+        self.task = TaskType(self.task)
+        if isinstance(self.depends_on, str):
+            self.depends_on = [self.depends_on]
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: Status
+    output_model_path: Optional[str] = None
+    cached: bool = False
+    error: Optional[str] = None
+    metadata: Any = None
+
+
+class Pipeline:
+    def __init__(self, netspresso: "NetsPresso", work_dir: str, max_workers: int = 4) -> None:
+        """DAG of train, compress, convert, quantize and benchmark stages, run with caching.
+
+        Stages whose dependencies are done run at the same time, e.g. several conversions followed by
+        their benchmarks. Each completed stage is recorded in work_dir/pipeline.json with a key made of
+        its task, parameters and the SHA-256 of its input model. A later run skips stages whose key did
+        not change and whose output still exists, so a failed run resumes from its last good stages.
+
+        Args:
+            netspresso (NetsPresso): Logged in NetsPresso instance.
+            work_dir (str): Folder of the stage outputs and of pipeline.json.
+            max_workers (int): Maximum number of stages run at the same time. Default is 4.
+        """
+
+        self.netspresso = netspresso
+        self.work_dir = Path(work_dir)
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+        self.state_path = self.work_dir / "pipeline.json"
+        self._state_lock = threading.Lock()
+
+    @classmethod
+    def from_yaml(
+        cls,
+        netspresso: "NetsPresso",
+        yaml_path: str,
+        work_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> "Pipeline":
+        """Create a pipeline from a YAML file with work_dir, optional max_workers, and a list of stages.
+        A work_dir or max_workers given as argument replaces the one of the file.
+
+        Each stage has the fields of Stage, e.g.
+
+            work_dir: ./outputs/pipeline
+            stages:
+              - name: convert_rpi4
+                task: convert
+                input_model_path: ./examples/sample_models/yolo-fastest.onnx
+                params: {target_framework: tensorflow_lite, target_device_name: RaspberryPi4B}
+              - name: benchmark_rpi4
+                task: benchmark
+                depends_on: convert_rpi4
+                params: {target_device_name: RaspberryPi4B}
+        """
+
+        config = OmegaConf.to_container(OmegaConf.load(yaml_path), resolve=True)
+        if max_workers is None:
+            max_workers = config.get("max_workers", 4)
+        pipeline = cls(netspresso, work_dir=work_dir or config["work_dir"], max_workers=max_workers)
+        for stage in config.get("stages", []):
+            pipeline.add_stage(**stage)
+
+        return pipeline
+
+    def add_stage(
+        self,
+        name: str,
+        task: Union[str, TaskType],
+        params: Optional[Dict[str, Any]] = None,
+        depends_on: Optional[Union[str, List[str]]] = None,
+        input_model_path: Optional[str] = None,
+    ) -> "Pipeline":
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already defined.")
+
+        self.stages[name] = Stage(
+            name=name, task=task, params=params or {}, depends_on=depends_on or [], input_model_path=input_model_path
+        )
+
+        return self
+
+    def validate(self):
+        """Check that dependencies exist, that there is no cycle, and that every stage has an input model."""
+
+        for stage in self.stages.values():
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'.")
+            # The first dependency gives the input model, and benchmarks do not produce one
+            if stage.depends_on and self.stages[stage.depends_on[0]].task == TaskType.BENCHMARK:
+                raise ValueError(
+                    f"Stage '{stage.name}' takes its input model from benchmark stage '{stage.depends_on[0]}', "
+                    "which has no output model. List a stage with an output model first in depends_on."
+                )
+            if stage.task != TaskType.TRAIN and not stage.depends_on and not stage.input_model_path:
+                raise ValueError(f"Stage '{stage.name}' needs depends_on or input_model_path.")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Stage '{name}' is part of a dependency cycle.")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            visiting.remove(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _load_state(self) -> Dict[str, Dict]:
+        if not FileHandler.check_exists(self.state_path):
+            return {}
+
+        return FileHandler.load_json(file_path=self.state_path).get("stages", {})
+
+    def _save_stage_state(self, name: str, stage_state: Dict):
+        with self._state_lock:
+            state = self._load_state()
+            state[name] = stage_state
+            MetadataHandler.save_json({"stages": state}, self.work_dir, "pipeline")
+
+    def get_cache_key(self, stage: Stage, input_model_path: Optional[str]) -> str:
+        if stage.task == TaskType.TRAIN:
+            input_hash = compute_hash(stage.params["yaml_path"])
+        else:
+            input_hash = compute_hash(input_model_path)
+        content = json.dumps(
+            {"task": stage.task.value, "params": stage.params, "input": input_hash}, sort_keys=True, default=str
+        )
+
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def run_stage(self, stage: Stage, input_model_path: Optional[str]):
+        """Run the stage's method and return its metadata and output model path."""
+
+        output_dir = (self.work_dir / stage.name).as_posix()
+        params = dict(stage.params)
+
+        if stage.task == TaskType.TRAIN:
+            trainer = self.netspresso.trainer(yaml_path=params.pop("yaml_path"))
+            metadata = trainer.train(
+                gpus=params.get("gpus", "0"),
+                project_name=params.get("project_name", stage.name),
+                output_dir=self.work_dir.as_posix(),
+            )
+            return metadata, metadata.best_onnx_model_path or metadata.best_fx_model_path
+
+        if stage.task == TaskType.COMPRESS:
+            compressor = self.netspresso.compressor_v2()
+            metadata = compressor.automatic_compression(
+                input_model_path=input_model_path, output_dir=output_dir, **params
+            )
+            return metadata, metadata.compressed_onnx_model_path or metadata.compressed_model_path
+
+        if stage.task == TaskType.CONVERT:
+            converter = self.netspresso.converter_v2()
+            metadata = converter.convert_model(input_model_path=input_model_path, output_dir=output_dir, **params)
+            return metadata, metadata.converted_model_path
+
+        if stage.task == TaskType.QUANTIZE:
+            quantizer = self.netspresso.quantizer()
+            metadata = quantizer.uniform_precision_quantization(
+                input_model_path=input_model_path, output_dir=output_dir, **params
+            )
+            return metadata, metadata.quantized_model_path
+
+        benchmarker = self.netspresso.benchmarker_v2()
+        metadata = benchmarker.benchmark_model(input_model_path=input_model_path, **params)
+
+        return metadata, None
+
+    def _run_or_skip(self, stage: Stage, input_model_path: Optional[str], state: Dict, force: bool) -> StageResult:
+        cache_key = self.get_cache_key(stage, input_model_path)
+        previous = state.get(stage.name, {})
+        output_model_path = previous.get("output_model_path")
+        if (
+            not force
+            and previous.get("key") == cache_key
+            and previous.get("status") == Status.COMPLETED
+            and (output_model_path is None or Path(output_model_path).exists())
+        ):
+            logger.info(f"Stage '{stage.name}' is up to date. Skipping it.")
+            return StageResult(name=stage.name, status=Status.COMPLETED, output_model_path=output_model_path, cached=True)
+
+        logger.info(f"Running stage '{stage.name}' ({stage.task.value}).")
+        metadata, output_model_path = self.run_stage(stage, input_model_path)
+        status = Status(metadata.status)
+        error = None
+        if status == Status.COMPLETED and stage.task != TaskType.BENCHMARK and not output_model_path:
+            status, error = Status.ERROR, "The stage did not produce an output model."
+        elif status != Status.COMPLETED:
+            error = getattr(metadata.error_detail, "message", None) or f"Stage ended with status {status.value}."
+
+        self._save_stage_state(
+            stage.name,
+            {"key": cache_key, "status": status.value, "output_model_path": output_model_path or None, "error": error},
+        )
+
+        return StageResult(
+            name=stage.name, status=status, output_model_path=output_model_path or None, error=error, metadata=metadata
+        )
+
+    def run(self, force: bool = False) -> Dict[str, StageResult]:
+        """Run the pipeline.
+
+        Args:
+            force (bool): Run every stage even if it is up to date. Default is False.
+
+        Returns:
+            Dict[str, StageResult]: Result per stage. Stages after a failed stage are STOPPED without running.
+        """
+
+        self.validate()
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        state = self._load_state()
+        results: Dict[str, StageResult] = {}
+        pending = dict(self.stages)
+        running: Dict[Future, Stage] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    if not all(dependency in results for dependency in stage.depends_on):
+                        continue
+                    del pending[name]
+
+                    failed = [d for d in stage.depends_on if results[d].status != Status.COMPLETED]
+                    if failed:
+                        error = f"Not run because stage '{failed[0]}' did not complete."
+                        logger.warning(f"Stage '{name}': {error}")
+                        results[name] = StageResult(name=name, status=Status.STOPPED, error=error)
+                        continue
+
+                    input_model_path = (
+                        results[stage.depends_on[0]].output_model_path if stage.depends_on else stage.input_model_path
+                    )
+                    running[executor.submit(self._run_or_skip, stage, input_model_path, state, force)] = stage
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        results[stage.name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Stage '{stage.name}' failed: {e}")
+                        results[stage.name] = StageResult(name=stage.name, status=Status.ERROR, error=str(e))
+
+        failed = [name for name, result in results.items() if result.status != Status.COMPLETED]
+        if failed:
+            logger.error(f"Pipeline finished with incomplete stages: {failed}. Run it again to resume.")
+        else:
+            logger.info("Pipeline finished successfully.")
+
+        return {name: results[name] for name in self.stages}
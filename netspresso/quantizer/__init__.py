@@ -1,3 +1,4 @@
+from netspresso.quantizer.comparator import QuantizationComparator
 from netspresso.quantizer.quantizer import Quantizer
 
-__all__ = ["Quantizer"]
+__all__ = ["Quantizer", "QuantizationComparator"]
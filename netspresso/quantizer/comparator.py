@@ -0,0 +1,206 @@
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import onnx
+from loguru import logger
+
+from netspresso.enums import SimilarityMetric
+from netspresso.inferencer.inferencer import CustomInferencer
+
+# Tensors created by the quantizer itself, which have no FP32 counterpart
+QDQ_OPERATORS = ["QuantizeLinear", "DequantizeLinear"]
+
+
+class SimilarityAccumulator:
+    def __init__(self) -> None:
+        """Running sums of one tensor pair, from which SNR, cosine similarity and MSE are computed.
+
+        Only five float64 scalars are kept, whatever the number of samples.
+        """
+
+        self.count = 0
+        self.signal = 0.0  # sum(reference ** 2)
+        self.noise = 0.0  # sum((reference - target) ** 2)
+        self.target = 0.0  # sum(target ** 2)
+        self.dot = 0.0  # sum(reference * target)
+
+    def update(self, reference: np.ndarray, target: np.ndarray):
+        reference = reference.astype(np.float64, copy=False).ravel()
+        target = target.astype(np.float64, copy=False).ravel()
+        error = reference - target
+
+        self.count += reference.size
+        self.signal += float(np.dot(reference, reference))
+        self.noise += float(np.dot(error, error))
+        self.target += float(np.dot(target, target))
+        self.dot += float(np.dot(reference, target))
+
+    def result(self) -> Dict[str, float]:
+        if self.noise == 0:
+            snr = float("inf")
+        elif self.signal == 0:
+            snr = float("-inf")
+        else:
+            snr = 10 * np.log10(self.signal / self.noise)
+        norm = np.sqrt(self.signal) * np.sqrt(self.target)
+
+        return {
+            SimilarityMetric.SNR.value: float(snr),
+            "COSINE": float(self.dot / norm) if norm else float(self.signal == self.target),
+            "MSE": self.noise / self.count if self.count else 0.0,
+        }
+
+
+class QuantizationComparator:
+    def __init__(self, fp32_model_path: str, quantized_model_path: str, per_layer: bool = False) -> None:
+        """Compare a quantized ONNX model, e.g. the quantized_qdq.onnx downloaded by Quantizer, with its FP32 model.
+
+        Both models are run on the same batches and only running sums are kept per compared tensor,
+        so memory does not grow with the number of samples.
+
+        Args:
+            fp32_model_path (str): Path to the FP32 model.
+            quantized_model_path (str): Path to the quantized model.
+            per_layer (bool): Also compare the intermediate tensors found in both models. Default is False,
+                which compares the model outputs only.
+        """
+
+        self.fp32_model_path = fp32_model_path
+        self.quantized_model_path = quantized_model_path
+        self.per_layer = per_layer
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+        if per_layer:
+            tensor_names = self.get_common_tensor_names(fp32_model_path, quantized_model_path)
+            fp32_model_path = self.expose_tensors(fp32_model_path, tensor_names, "fp32")
+            quantized_model_path = self.expose_tensors(quantized_model_path, tensor_names, "quantized")
+
+        self.fp32_inferencer = CustomInferencer(input_model_path=fp32_model_path)
+        self.quantized_inferencer = CustomInferencer(input_model_path=quantized_model_path)
+        self.tensor_pairs = self.match_outputs()
+
+    @staticmethod
+    def get_node_outputs(model: onnx.ModelProto) -> List[str]:
+        return [
+            name
+            for node in model.graph.node
+            if node.op_type not in QDQ_OPERATORS
+            for name in node.output
+            if name
+        ]
+
+    def get_common_tensor_names(self, fp32_model_path: str, quantized_model_path: str) -> List[str]:
+        fp32_model = onnx.load(fp32_model_path)
+        quantized_names = set(self.get_node_outputs(onnx.load(quantized_model_path)))
+        tensor_names = [name for name in self.get_node_outputs(fp32_model) if name in quantized_names]
+        logger.info(f"{len(tensor_names)} intermediate tensors found in both models.")
+
+        return tensor_names
+
+    def expose_tensors(self, model_path: str, tensor_names: List[str], prefix: str) -> str:
+        """Save a copy of the model with tensor_names added to the graph outputs."""
+
+        model = onnx.shape_inference.infer_shapes(onnx.load(model_path))
+        value_infos = {value_info.name: value_info for value_info in model.graph.value_info}
+        output_names = {output.name for output in model.graph.output}
+        for name in tensor_names:
+            if name in output_names:
+                continue
+            value_info = value_infos.get(name) or onnx.helper.make_tensor_value_info(name, onnx.TensorProto.FLOAT, None)
+            model.graph.output.append(value_info)
+
+        save_path = Path(self._temp_dir.name) / f"{prefix}_{Path(model_path).name}"
+        onnx.save(model, save_path.as_posix())
+
+        return save_path.as_posix()
+
+    def match_outputs(self) -> List[Tuple[str, str]]:
+        fp32_outputs = list(self.fp32_inferencer.inferencer.outputs)
+        quantized_outputs = list(self.quantized_inferencer.inferencer.outputs)
+
+        common = [name for name in fp32_outputs if name in quantized_outputs]
+        if common:
+            return [(name, name) for name in common]
+
+        # Renamed outputs: pair them by position
+        if len(fp32_outputs) != len(quantized_outputs):
+            raise ValueError(
+                f"Cannot match outputs of the models. FP32: {fp32_outputs}, quantized: {quantized_outputs}"
+            )
+
+        return list(zip(fp32_outputs, quantized_outputs))
+
+    def iter_batches(self, dataset: Union[str, np.ndarray, Dict[str, Union[str, np.ndarray]]], batch_size: int):
+        """Yield input dicts of up to batch_size samples. .npy files are memory-mapped, not loaded."""
+
+        if not isinstance(dataset, dict):
+            dataset = dict.fromkeys(self.fp32_inferencer.inferencer.inputs, dataset)
+        arrays = {
+            name: np.load(data, mmap_mode="r") if isinstance(data, (str, Path)) else data for name, data in dataset.items()
+        }
+
+        num_samples = min(len(array) for array in arrays.values())
+        for start in range(0, num_samples, batch_size):
+            yield {name: np.ascontiguousarray(array[start : start + batch_size]) for name, array in arrays.items()}
+
+    def iter_compare(
+        self, dataset: Union[str, np.ndarray, Dict[str, Union[str, np.ndarray]]], batch_size: int = 32
+    ) -> Iterator[Tuple[int, Dict[str, Dict[str, float]]]]:
+        """Compare the models batch by batch, yielding the number of samples seen and the running results.
+
+        Args:
+            dataset: .npy file or array of (N, ...) samples in the model's input layout and dtype,
+                or a mapping of input name to one of those for models with several inputs.
+            batch_size (int): Number of samples run at once. Models with a fixed batch size are run
+                one sample at a time. Default is 32.
+        """
+
+        if not (self.fp32_inferencer.has_dynamic_batch() and self.quantized_inferencer.has_dynamic_batch()):
+            batch_size = 1
+
+        accumulators = {fp32_name: SimilarityAccumulator() for fp32_name, _ in self.tensor_pairs}
+        num_samples = 0
+        for inputs in self.iter_batches(dataset, batch_size):
+            fp32_outputs = self.fp32_inferencer._run_session(inputs)
+            quantized_outputs = self.quantized_inferencer._run_session(inputs)
+            for fp32_name, quantized_name in self.tensor_pairs:
+                accumulators[fp32_name].update(fp32_outputs[fp32_name], quantized_outputs[quantized_name])
+
+            num_samples += len(next(iter(inputs.values())))
+            yield num_samples, {name: accumulator.result() for name, accumulator in accumulators.items()}
+
+    def compare(
+        self,
+        dataset: Union[str, np.ndarray, Dict[str, Union[str, np.ndarray]]],
+        batch_size: int = 32,
+        save_path: Optional[str] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """Compare the models over the whole dataset.
+
+        Args:
+            dataset: Same as iter_compare.
+            batch_size (int): Same as iter_compare.
+            save_path (str, optional): Path to save the results as JSON.
+
+        Returns:
+            Dict[str, Dict[str, float]]: SNR (dB), COSINE and MSE per compared tensor, keyed by FP32 tensor name.
+        """
+
+        # Each step yields the running totals, so only the last one is kept
+        last = (0, {})
+        for last in self.iter_compare(dataset, batch_size):
+            logger.debug(f"Compared {last[0]} samples.")
+        num_samples, results = last
+
+        logger.info(f"Compared {len(results)} tensors over {num_samples} samples.")
+
+        if save_path is not None:
+            Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(save_path, "w") as f:
+                json.dump(results, f, indent=4)
+            logger.info(f"Comparison result saved at {save_path}")
+
+        return results
@@ -1,8 +1,6 @@
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Union
-from urllib import request
 
 from loguru import logger
 
@@ -17,6 +15,8 @@ from netspresso.clients.launcher.v2.schemas.task.quantize.request_body import (
     RecommendationOption,
 )
 from netspresso.clients.launcher.v2.schemas.task.quantize.response_body import QuantizeTask
+from netspresso.clients.utils.task_waiter import TaskFuture
+from netspresso.clients.utils.upload_cache import upload_cache
 from netspresso.enums import (
     QuantizationMode,
     QuantizationPrecision,
@@ -97,7 +97,7 @@ class Quantizer(NetsPressoBase):
             default_model_path = FileHandler.get_default_model_path(folder_path=output_dir)
             download_model_path = default_model_path.with_suffix(".zip").as_posix()
 
-            request.urlretrieve(download_url, download_model_path)
+            FileHandler.download_file(url=download_url, save_path=download_model_path)
             logger.info(f"Model downloaded at {Path(download_model_path)}")
 
             metadata.quantized_model_path = download_model_path
@@ -136,7 +136,7 @@ class Quantizer(NetsPressoBase):
 
             download_path = (Path(output_dir) / "custom_quantization_suggestion.json").resolve().as_posix()
 
-            request.urlretrieve(download_url, download_path)
+            FileHandler.download_file(url=download_url, save_path=download_path)
             logger.info(f"Model downloaded at {Path(download_path)}")
 
             self.print_remaining_credit(service_task=ServiceTask.MODEL_QUANTIZE)
@@ -151,27 +151,7 @@ class Quantizer(NetsPressoBase):
             raise e
 
     def _upload_model(self, input_model_path: str):
-        # Get presigned_model_upload_url
-        presigned_url_response = launcher_client_v2.quantizer.presigned_model_upload_url(
-            access_token=self.token_handler.tokens.access_token,
-            input_model_path=input_model_path,
-        )
-
-        # Upload model_file
-        launcher_client_v2.quantizer.upload_model_file(
-            access_token=self.token_handler.tokens.access_token,
-            input_model_path=input_model_path,
-            presigned_upload_url=presigned_url_response.data.presigned_upload_url,
-        )
-
-        # Validate model_file
-        validate_model_response = launcher_client_v2.quantizer.validate_model_file(
-            access_token=self.token_handler.tokens.access_token,
-            input_model_path=input_model_path,
-            ai_model_id=presigned_url_response.data.ai_model_id,
-        )
-
-        return validate_model_response
+        return self.upload_model_file(launcher_client_v2.quantizer, input_model_path)
 
     def _quantize_model(
         self,
@@ -183,7 +163,7 @@ class Quantizer(NetsPressoBase):
         input_layers: List[Dict[str, int]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> QuantizerMetadata:
+    ) -> Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]:
         """Quantize a model to the specified framework.
 
         Args:
@@ -193,13 +173,15 @@ class Quantizer(NetsPressoBase):
             quantization_mode (QuantizationMode): Quantization mode
             input_layers (List[InputShape], optional): Target input shape for quantization (e.g., dynamic batch to static batch).
             wait_until_done (bool): If True, wait for the quantization result before returning the function.
-                                If False, request the quantization and return  the function immediately.
+                                If False, request the quantization and return a TaskFuture immediately.
+                                The result is downloaded in the background when the quantization ends.
 
         Raises:
             e: If an error occurs during the model quantization.
 
         Returns:
-            QuantizerMetadata: Quantize metadata.
+            Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]: Quantize metadata,
+                or a future of it if wait_until_done is False.
         """
 
         FileHandler.check_input_model_path(input_model_path)
@@ -214,9 +196,10 @@ class Quantizer(NetsPressoBase):
             activation_precision=QuantizationPrecision.INT8,
         )
 
+        future = None
         try:
             if metadata.status in [Status.ERROR, Status.STOPPED]:
-                return metadata
+                return metadata if wait_until_done else TaskFuture.from_result(metadata)
 
             self.validate_token_and_check_credit(service_task=ServiceTask.MODEL_QUANTIZE)
 
@@ -224,54 +207,68 @@ class Quantizer(NetsPressoBase):
 
             # Start quantize task
             input_layers = input_layers if input_layers else uploaded_model_response.data.detail.input_layers
-            quantize_response = launcher_client_v2.quantizer.start_task(
-                access_token=self.token_handler.tokens.access_token,
-                input_model_id=uploaded_model_response.data.ai_model_id,
-                quantization_mode=quantization_mode,
-                quantization_options=quantization_options,
-                input_layers=input_layers,
-                dataset_path=dataset_path,
-            )
+            try:
+                quantize_response = launcher_client_v2.quantizer.start_task(
+                    access_token=self.token_handler.tokens.access_token,
+                    input_model_id=uploaded_model_response.data.ai_model_id,
+                    quantization_mode=quantization_mode,
+                    quantization_options=quantization_options,
+                    input_layers=input_layers,
+                    dataset_path=dataset_path,
+                )
+            except Exception:
+                # A cached model may have been deleted on the server, so upload it again next time
+                upload_cache.evict(uploaded_model_response.data.ai_model_id)
+                raise
 
             metadata.model_info = uploaded_model_response.data.to()
             metadata.quantize_info = quantize_response.data.to(uploaded_model_response.data.uploaded_file_name)
             MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
 
-            if wait_until_done:
-                while True:
-                    self.token_handler.validate_token()
-                    quantize_response = launcher_client_v2.quantizer.read_task(
-                        access_token=self.token_handler.tokens.access_token,
-                        task_id=quantize_response.data.quantize_task_id,
-                    )
-                    if quantize_response.data.status in [
-                        TaskStatusForDisplay.FINISHED,
-                        TaskStatusForDisplay.ERROR,
-                        TaskStatusForDisplay.TIMEOUT,
-                    ]:
-                        break
-
-                    time.sleep(sleep_interval)
-
-            if quantize_response.data.status == TaskStatusForDisplay.FINISHED:
+            def finish(quantize_response) -> QuantizerMetadata:
+                if quantize_response.data.status != TaskStatusForDisplay.FINISHED:
+                    return self.handle_error(metadata, ServiceTask.MODEL_QUANTIZE, quantize_response.data.error_log)
                 if quantize_response.data.quantization_mode in [
                     "plain_quantization",
                     "custom_quantization",
                     "automatic_quantization",
                 ]:
-                    metadata = self._download_quantized_model(quantize_response.data, output_dir, metadata)
-                elif quantize_response.data.quantization_mode in [QuantizationMode.RECOMMEND_QUANTIZATION]:
-                    metadata = self._download_recommendation_result(quantize_response.data, output_dir, metadata)
+                    return self._download_quantized_model(quantize_response.data, output_dir, metadata)
+                if quantize_response.data.quantization_mode in [QuantizationMode.RECOMMEND_QUANTIZATION]:
+                    return self._download_recommendation_result(quantize_response.data, output_dir, metadata)
+                return metadata
 
+            task_id = quantize_response.data.quantize_task_id
+            eta_key = f"quantize:{quantization_mode}"
+            if wait_until_done:
+                quantize_response = self.wait_for_task(
+                    launcher_client_v2.quantizer, task_id=task_id, sleep_interval=sleep_interval, eta_key=eta_key
+                )
+                metadata = finish(quantize_response)
             else:
-                metadata = self.handle_error(metadata, ServiceTask.MODEL_QUANTIZE, quantize_response.data.error_log)
+                future = self.submit_task(
+                    launcher_client_v2.quantizer,
+                    task_id=task_id,
+                    metadata=metadata,
+                    service_task=ServiceTask.MODEL_QUANTIZE,
+                    finish=finish,
+                    save=lambda result: MetadataHandler.save_metadata(data=result, folder_path=output_dir),
+                    cancel_task=self.cancel_quantization_task,
+                    sleep_interval=sleep_interval,
+                    eta_key=eta_key,
+                )
 
         except Exception as e:
             metadata = self.handle_error(metadata, ServiceTask.MODEL_QUANTIZE, e.args[0])
         except KeyboardInterrupt:
             metadata = self.handle_stop(metadata, ServiceTask.MODEL_QUANTIZE)
         finally:
-            MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
+            # Once submitted, the metadata is saved by the future
+            if future is None:
+                MetadataHandler.save_metadata(data=metadata, folder_path=output_dir)
+
+        if not wait_until_done:
+            return future if future is not None else TaskFuture.from_result(metadata)
 
         return metadata
 
@@ -300,13 +297,15 @@ class Quantizer(NetsPressoBase):
             activation_precision (QuantizationPrecision): Activation precision
             input_layers (List[InputShape], optional): Target input shape for quantization (e.g., dynamic batch to static batch).
             wait_until_done (bool): If True, wait for the quantization result before returning the function.
-                                If False, request the quantization and return  the function immediately.
+                                If False, request the quantization and return a TaskFuture immediately.
+                                The result is downloaded in the background when the quantization ends.
 
         Raises:
             e: If an error occurs during the model quantization.
 
         Returns:
-            QuantizerMetadata: Quantize metadata.
+            Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]: Quantize metadata,
+                or a future of it if wait_until_done is False.
         """
         quantization_options = PlainQuantizationOption(
             metric=metric,
@@ -341,7 +340,7 @@ class Quantizer(NetsPressoBase):
         input_layers: List[Dict[str, int]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> QuantizerMetadata:
+    ) -> Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]:
         """Apply automatic quantization to a model, specifying precision for weight & activation.
 
         This method quantizes layers in the model based on the specified precision levels for weights and activations, while evaluating
@@ -358,13 +357,15 @@ class Quantizer(NetsPressoBase):
             threshold (Union[float, int]): Quality threshold for quantization. Layers that do not meet this threshold based on the metric are not quantized.
             input_layers (List[InputShape], optional): Target input shape for quantization (e.g., dynamic batch to static batch).
             wait_until_done (bool): If True, wait for the quantization result before returning the function.
-                                If False, request the quantization and return  the function immediately.
+                                If False, request the quantization and return a TaskFuture immediately.
+                                The result is downloaded in the background when the quantization ends.
 
         Raises:
             e: If an error occurs during the model quantization.
 
         Returns:
-            QuantizerMetadata: Quantize metadata.
+            Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]: Quantize metadata,
+                or a future of it if wait_until_done is False.
         """
         quantization_options = AutomaticQuantizeOption(
             metric=metric,
@@ -400,7 +401,7 @@ class Quantizer(NetsPressoBase):
         input_layers: List[Dict[str, int]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> QuantizerMetadata:
+    ) -> Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]:
         quantization_options = CustomQuantizeOption(
             metric=metric,
             custom_precision=custom_quantization_dictionary,
@@ -433,7 +434,7 @@ class Quantizer(NetsPressoBase):
         input_layers: List[Dict[str, int]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> QuantizerMetadata:
+    ) -> Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]:
         """
         Apply custom precision quantization to a model, specifying precision for each layer name.
 
@@ -462,14 +463,15 @@ class Quantizer(NetsPressoBase):
             input_layers (List[InputShape], optional):
                 Target input shape for quantization (e.g., dynamic batch to static batch).
             wait_until_done (bool): If True, wait for the quantization result before returning
-                the function. If False, request the quantization and return immediately.
-            sleep_interval (int): Interval in seconds between checks when `wait_until_done` is True.
+                the function. If False, request the quantization and return a TaskFuture immediately.
+            sleep_interval (int): Longest interval in seconds between checks when `wait_until_done` is True.
 
         Raises:
             e: If an error occurs during the model quantization.
 
         Returns:
-            QuantizerMetadata: Quantization metadata containing status, paths, etc.
+            Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]: Quantization metadata containing status,
+                paths, etc., or a future of it if wait_until_done is False.
         """
         layers = {layer.name: layer.precision for layer in precision_by_layer_name}
 
@@ -504,7 +506,7 @@ class Quantizer(NetsPressoBase):
         input_layers: List[Dict[str, int]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> QuantizerMetadata:
+    ) -> Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]:
         """
         Apply custom quantization to a model, specifying precision for each operator type.
 
@@ -533,14 +535,15 @@ class Quantizer(NetsPressoBase):
             input_layers (List[InputShape], optional):
                 Target input shape for quantization (e.g., dynamic batch to static batch).
             wait_until_done (bool): If True, wait for the quantization result before returning
-                the function. If False, request the quantization and return immediately.
-            sleep_interval (int): Interval in seconds between checks when `wait_until_done` is True.
+                the function. If False, request the quantization and return a TaskFuture immediately.
+            sleep_interval (int): Longest interval in seconds between checks when `wait_until_done` is True.
 
         Raises:
             e: If an error occurs during the model quantization.
 
         Returns:
-            QuantizerMetadata: Quantization metadata containing status, paths, etc.
+            Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]: Quantization metadata containing status,
+                paths, etc., or a future of it if wait_until_done is False.
         """
         operators = {layer.type: layer.precision for layer in precision_by_operator_type}
         custom_quantization_dictionary = {"layers": {}, "operators": operators}
@@ -574,7 +577,7 @@ class Quantizer(NetsPressoBase):
         input_layers: List[Dict[str, int]] = None,
         wait_until_done: bool = True,
         sleep_interval: int = 30,
-    ) -> QuantizerMetadata:
+    ) -> Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]:
         """Get recommended precision for a model based on a specified quality threshold.
 
         This function analyzes each layer of the given model and recommends precision settings
@@ -593,15 +596,16 @@ class Quantizer(NetsPressoBase):
             input_layers (List[Dict[str, int]], optional): Specifications for input shapes
                             (e.g., to convert from dynamic to static batch size).
             wait_until_done (bool): If True, waits for the quantization process to finish
-                            before returning. If False, starts the process and returns immediately.
-            sleep_interval (int): Interval, in seconds, between checks when `wait_until_done`
+                            before returning. If False, starts the process and returns a TaskFuture immediately.
+            sleep_interval (int): Longest interval, in seconds, between checks when `wait_until_done`
                             is True.
 
         Raises:
             e: If an error occurs during the model quantization.
 
         Returns:
-            QuantizerMetadata: Quantize metadata.
+            Union[QuantizerMetadata, TaskFuture[QuantizerMetadata]]: Quantize metadata,
+                or a future of it if wait_until_done is False.
 
         """
         quantization_options = RecommendationOption(
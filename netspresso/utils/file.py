@@ -4,10 +4,10 @@ import sys
 import zipfile
 from pathlib import Path
 from typing import Dict, List, Tuple, Union
-from urllib import request
 
 from loguru import logger
 
+from netspresso.clients.utils.downloader import DEFAULT_NUM_CONNECTIONS, download_file
 from netspresso.exceptions.common import NotSupportedFrameworkException, NotValidInputModelPath
 
 FRAMEWORK_EXTENSION_MAP = {
@@ -108,14 +108,21 @@ class FileHandler:
         return Path(folder_path) / (name + extension)
 
     @staticmethod
-    def download_file(url: str, save_path: Union[str, Path]) -> None:
+    def download_file(
+        url: str, save_path: Union[str, Path], num_connections: int = DEFAULT_NUM_CONNECTIONS, expected_sha256: str = None
+    ) -> None:
         """Download a file from the given URL and save it to the specified path.
 
+        The file is fetched with parallel Range requests when the server supports them, resumes after
+        an interruption, and is checked against the server's size (and expected_sha256 if given).
+
         Args:
             url (str): The URL of the file to be downloaded.
             save_path (Union[str, Path]): The path where the downloaded file will be saved.
+            num_connections (int): Number of parallel connections.
+            expected_sha256 (str, optional): Expected SHA-256 hex digest of the file.
         """
-        request.urlretrieve(url, save_path)
+        download_file(url, save_path, num_connections=num_connections, expected_sha256=expected_sha256)
 
     @staticmethod
     def get_extension_by_framework(framework: str) -> str:
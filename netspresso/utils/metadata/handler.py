@@ -1,4 +1,6 @@
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
@@ -59,9 +61,13 @@ class MetadataHandler:
             The data is written to a JSON file with indentation for readability. The file is saved in the specified directory with the given name.
         """
         file_path = Path(folder_path) / f"{file_name}.json"
+        # One temporary file per writer, so concurrent writers do not write into the same one
+        temp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
-        with open(file_path, "w") as json_file:
+        with open(temp_path, "w") as json_file:
             json.dump(data, json_file, indent=4)
+        # Replaced in one step, so readers never see a partly written file
+        os.replace(temp_path, file_path)
         logger.info(f"JSON file saved at {file_path.resolve()}")
 
     @staticmethod
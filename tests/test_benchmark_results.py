@@ -0,0 +1,34 @@
+import json
+import threading
+
+from netspresso.benchmarker.results import append_results, replace_result
+from netspresso.enums import Status
+from netspresso.metadata.benchmarker import BenchmarkerMetadata
+
+
+def test_updates_and_appends_are_not_lost(tmp_path):
+    (index,) = append_results([BenchmarkerMetadata(input_model_path="cloud")], tmp_path)
+
+    def update():
+        for _ in range(20):
+            replace_result(BenchmarkerMetadata(status=Status.COMPLETED, input_model_path="cloud"), tmp_path, index)
+
+    def append():
+        for _ in range(20):
+            append_results([BenchmarkerMetadata(input_model_path="local")], tmp_path)
+
+    threads = [threading.Thread(target=update), threading.Thread(target=append)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    results = json.loads((tmp_path / "benchmark.json").read_text())
+    assert len(results) == 21
+    assert results[index]["status"] == Status.COMPLETED
+    assert [result["input_model_path"] for result in results[1:]] == ["local"] * 20
+
+
+def test_append_returns_indexes(tmp_path):
+    assert append_results([BenchmarkerMetadata(), BenchmarkerMetadata()], tmp_path) == [0, 1]
+    assert append_results([BenchmarkerMetadata()], tmp_path) == [2]
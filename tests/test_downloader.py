@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from netspresso.clients.utils.downloader import ParallelDownloader
+from netspresso.clients.utils.requester import Requester, RetryPolicy
+from netspresso.exceptions.common import FailedDownloadException
+
+DATA = os.urandom(100 * 1024 + 123)
+SHA256 = hashlib.sha256(DATA).hexdigest()
+PART_SIZE = 16 * 1024
+
+
+class FileServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FileHandler)
+        self.ranged = True
+        self.failing_offsets = set()
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/model.onnx"
+
+    def range_requests(self, start: int) -> int:
+        return sum(1 for request in self.requests if request == start)
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        with self.server.lock:
+            self.server.requests.append(int(match.group(1)) if match and self.server.ranged else None)
+
+        if not match or not self.server.ranged:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(DATA)))
+            self.end_headers()
+            self.wfile.write(DATA)
+            return
+
+        start, end = int(match.group(1)), min(int(match.group(2)), len(DATA) - 1)
+        if start in self.server.failing_offsets:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(DATA)}")
+        self.send_header("ETag", f'"{hashlib.md5(DATA).hexdigest()}"')
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(DATA[start : end + 1])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    server = FileServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries():
+    retry_policy = Requester.retry_policy
+    Requester.configure(retry_policy=RetryPolicy(backoff_factor=0.001, max_retries=2))
+    yield
+    Requester.configure(retry_policy=retry_policy)
+
+
+def test_ranged_parallel_download(server, tmp_path):
+    save_path = tmp_path / "model.onnx"
+    downloader = ParallelDownloader(num_connections=4, part_size=PART_SIZE, verify_etag=True)
+
+    downloader.download(server.url, save_path, expected_size=len(DATA), expected_sha256=SHA256)
+
+    assert save_path.read_bytes() == DATA
+    num_parts = len(downloader.get_parts(len(DATA)))
+    # The probe plus one request per part
+    assert len(server.requests) == num_parts + 1
+    assert not (tmp_path / "model.onnx.part").exists()
+    assert not (tmp_path / "model.onnx.part.json").exists()
+
+
+def test_resume_from_state_file(server, tmp_path):
+    save_path = tmp_path / "model.onnx"
+    failing_offset = 2 * PART_SIZE
+    server.failing_offsets.add(failing_offset)
+    downloader = ParallelDownloader(num_connections=1, part_size=PART_SIZE)
+
+    with pytest.raises(FailedDownloadException):
+        downloader.download(server.url, save_path)
+
+    # Retried by the downloader only, not again by Requester
+    assert server.range_requests(failing_offset) == Requester.retry_policy.max_retries + 1
+    completed = json.loads((tmp_path / "model.onnx.part.json").read_text())["completed"]
+    assert completed and failing_offset // PART_SIZE not in completed
+    assert not save_path.exists()
+
+    server.failing_offsets.clear()
+    server.requests.clear()
+    downloader.download(server.url, save_path, expected_sha256=SHA256)
+
+    assert save_path.read_bytes() == DATA
+    # The probe (offset 0) and the missing parts only
+    missing = [start for i, (start, _) in enumerate(downloader.get_parts(len(DATA))) if i not in completed]
+    assert sorted(server.requests) == [0] + missing
+
+
+def test_server_without_range_support(server, tmp_path):
+    server.ranged = False
+    save_path = tmp_path / "model.onnx"
+
+    ParallelDownloader(num_connections=4, part_size=PART_SIZE).download(server.url, save_path, expected_sha256=SHA256)
+
+    assert save_path.read_bytes() == DATA
+    # The probe and a single full download
+    assert server.requests == [None, None]
+
+
+def test_size_mismatch(server, tmp_path):
+    save_path = tmp_path / "model.onnx"
+
+    with pytest.raises(FailedDownloadException):
+        ParallelDownloader(part_size=PART_SIZE).download(server.url, save_path, expected_size=len(DATA) + 1)
+
+    assert not save_path.exists()
+
+
+def test_hash_mismatch(server, tmp_path):
+    save_path = tmp_path / "model.onnx"
+
+    with pytest.raises(FailedDownloadException):
+        ParallelDownloader(part_size=PART_SIZE).download(server.url, save_path, expected_sha256="0" * 64)
+
+    assert not save_path.exists()
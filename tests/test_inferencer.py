@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from netspresso.inferencer.inferencer import NPInferencer
+
+# Input [1, 3, 128, 128]: the batch dimension is fixed
+STATIC_BATCH_MODEL = Path(__file__).parents[1] / "examples" / "sample_models" / "yolo-fastest.onnx"
+CONFIG = """
+runtime:
+  task: detection
+  preprocess:
+    - name: resize
+      size: 128
+      interpolation: bilinear
+      max_size: null
+      resize_criteria: long
+    - name: pad
+      size: 128
+      fill: 114
+  postprocess:
+    params:
+      class_agnostic: false
+      score_thresh: 0.01
+      nms_thresh: 0.65
+  visualize:
+    params:
+      class_map: {0: a, 1: b, 2: c, 3: d}
+      normalized: false
+      brightness_factor: 1.5
+"""
+
+
+@pytest.fixture()
+def image_paths(tmp_path):
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"image_{i}.jpg"
+        cv2.imwrite(str(path), rng.integers(0, 255, (100, 140, 3), dtype=np.uint8))
+        paths.append(path.as_posix())
+
+    return paths
+
+
+def test_inference_batch_with_static_batch_model(tmp_path, image_paths):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(CONFIG)
+    inferencer = NPInferencer(config_path=config_path.as_posix(), input_model_path=STATIC_BATCH_MODEL.as_posix())
+
+    assert not inferencer.has_dynamic_batch()
+    preds = inferencer.inference_batch(image_paths, batch_size=8)
+
+    assert len(preds) == len(image_paths)
@@ -0,0 +1,51 @@
+import pytest
+
+from netspresso.pipeline import Pipeline
+
+YAML = """
+work_dir: ./outputs/pipeline
+max_workers: 2
+stages:
+  - name: convert
+    task: convert
+    input_model_path: model.onnx
+    params: {target_framework: tensorflow_lite, target_device_name: RaspberryPi4B}
+"""
+
+
+@pytest.fixture()
+def yaml_path(tmp_path):
+    path = tmp_path / "pipeline.yaml"
+    path.write_text(YAML)
+
+    return path.as_posix()
+
+
+def test_from_yaml_uses_file_max_workers(yaml_path):
+    assert Pipeline.from_yaml(None, yaml_path).max_workers == 2
+
+
+def test_from_yaml_max_workers_argument_overrides_file(yaml_path, tmp_path):
+    pipeline = Pipeline.from_yaml(None, yaml_path, work_dir=tmp_path.as_posix(), max_workers=8)
+
+    assert pipeline.max_workers == 8
+    assert pipeline.work_dir == tmp_path
+
+
+def test_validate_rejects_benchmark_as_input_stage(tmp_path):
+    pipeline = Pipeline(None, work_dir=tmp_path.as_posix())
+    pipeline.add_stage("convert", "convert", input_model_path="model.onnx")
+    pipeline.add_stage("benchmark", "benchmark", depends_on="convert")
+    pipeline.add_stage("quantize", "quantize", depends_on=["benchmark", "convert"])
+
+    with pytest.raises(ValueError, match="benchmark stage 'benchmark'"):
+        pipeline.validate()
+
+
+def test_validate_accepts_benchmark_as_later_dependency(tmp_path):
+    pipeline = Pipeline(None, work_dir=tmp_path.as_posix())
+    pipeline.add_stage("convert", "convert", input_model_path="model.onnx")
+    pipeline.add_stage("benchmark", "benchmark", depends_on="convert")
+    pipeline.add_stage("quantize", "quantize", depends_on=["convert", "benchmark"])
+
+    pipeline.validate()
@@ -0,0 +1,19 @@
+from netspresso.inferencer.profiler import StageProfiler
+
+
+def test_max_samples_applies_to_recorded_stages():
+    profiler = StageProfiler(enabled=True, max_samples=10)
+    for i in range(10):
+        profiler.record("inference", i / 1000)
+
+    profiler.max_samples = 3
+    assert list(profiler.samples["inference"]) == [0.007, 0.008, 0.009]
+
+    profiler.max_samples = 5
+    for i in range(10, 14):
+        profiler.record("inference", i / 1000)
+    profiler.record("preprocess", 0.001)
+
+    assert list(profiler.samples["inference"]) == [0.009, 0.01, 0.011, 0.012, 0.013]
+    assert profiler.samples["preprocess"].maxlen == 5
+    assert profiler.summary()["inference"]["count"] == 5
@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, CancelledError, as_completed, wait
+from types import SimpleNamespace
+
+import pytest
+
+from netspresso.clients.utils import task_waiter
+from netspresso.clients.utils.task_waiter import TaskFuture, TaskNotifier, TaskWaiter
+from netspresso.exceptions.common import TaskTimeoutException
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(task_waiter, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def clear_durations():
+    TaskWaiter.durations.clear()
+    yield
+    TaskWaiter.durations.clear()
+
+
+def done_after(num_reads: int):
+    reads = []
+
+    def read_task():
+        reads.append(len(reads))
+        return len(reads)
+
+    return read_task, lambda task: task >= num_reads
+
+
+def test_interval_grows_up_to_max_interval():
+    waiter = TaskWaiter(read_task=lambda: None, is_done=bool, initial_interval=1, max_interval=5, multiplier=2)
+
+    assert [waiter.get_interval(retry, None) for retry in range(5)] == [1, 2, 4, 5, 5]
+    # Shortened to the expected end, but never below initial_interval
+    assert waiter.get_interval(3, 2.5) == 2.5
+    assert waiter.get_interval(3, 0.5) == 1
+
+
+def test_wait_sleeps_with_backoff(clock):
+    read_task, is_done = done_after(6)
+    waiter = TaskWaiter(read_task=read_task, is_done=is_done, initial_interval=1, max_interval=5, multiplier=2)
+
+    assert waiter.wait() == 6
+    assert clock.sleeps == [1, 2, 4, 5, 5]
+    assert waiter.reads == 6
+
+
+def test_wait_rearms_from_expected_end(clock):
+    TaskWaiter.durations["benchmark"] = deque([10.0])
+    read_task, is_done = done_after(7)
+    waiter = TaskWaiter(
+        read_task=read_task, is_done=is_done, initial_interval=1, max_interval=30, multiplier=2, eta_key="benchmark"
+    )
+
+    waiter.wait()
+
+    # Wakes up at the expected end (10s), then backs off again from initial_interval
+    assert clock.sleeps == [1, 2, 4, 3, 1, 2]
+    # Done between the last two reads, at 11s and 13s
+    assert list(TaskWaiter.durations["benchmark"]) == [10.0, 12.0]
+
+
+def test_wait_raises_on_timeout(clock):
+    waiter = TaskWaiter(read_task=lambda: None, is_done=lambda task: False, initial_interval=1, multiplier=2, timeout=5)
+
+    with pytest.raises(TaskTimeoutException):
+        waiter.wait()
+
+    # The last interval is cut to end at the timeout
+    assert clock.sleeps == [1, 2, 2]
+
+
+def test_notifier_wakes_up_waiter():
+    notifier = TaskNotifier()
+    read_task, is_done = done_after(2)
+
+    def read_and_notify():
+        task = read_task()
+        threading.Timer(0.05, notifier.notify).start()
+        return task
+
+    waiter = TaskWaiter(read_task=read_and_notify, is_done=is_done, initial_interval=30, notifier=notifier)
+    start = time.monotonic()
+
+    assert waiter.wait() == 2
+    assert time.monotonic() - start < 5
+
+
+def test_notifier_cancel_stops_waiter():
+    notifier = TaskNotifier()
+    waiter = TaskWaiter(read_task=lambda: None, is_done=lambda task: False, initial_interval=30, notifier=notifier)
+    threading.Timer(0.05, notifier.cancel).start()
+
+    with pytest.raises(CancelledError):
+        waiter.wait()
+
+    assert waiter.reads == 1
+
+
+def test_task_future_with_as_completed_and_wait():
+    release = threading.Event()
+    slow = TaskFuture(lambda notifier: release.wait(5) and "slow")
+    fast = TaskFuture(lambda notifier: "fast")
+
+    done, not_done = wait([slow, fast], timeout=5, return_when=FIRST_COMPLETED)
+    assert done == {fast}
+    assert not_done == {slow}
+
+    release.set()
+    assert [future.result() for future in as_completed([slow, fast], timeout=5)] == ["fast", "slow"]
+    assert TaskFuture.from_result("done").result() == "done"
+
+
+def test_task_future_exception():
+    def run(notifier):
+        raise ValueError("failed")
+
+    future = TaskFuture(run)
+
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+
+
+def test_task_future_cancel():
+    cancelled_tasks = []
+    stopped = threading.Event()
+
+    def run(notifier):
+        waiter = TaskWaiter(read_task=lambda: None, is_done=lambda task: False, initial_interval=30, notifier=notifier)
+        try:
+            waiter.wait()
+        finally:
+            stopped.set()
+
+    future = TaskFuture(run, task_id="task-1", cancel_task=cancelled_tasks.append)
+
+    assert future.cancel()
+    assert cancelled_tasks == ["task-1"]
+    assert future.cancelled()
+    assert wait([future], timeout=5).done == {future}
+    # The waiter thread stops instead of reading the task again
+    assert stopped.wait(5)
+
+
+def test_task_future_without_cancel_task():
+    release = threading.Event()
+    future = TaskFuture(lambda notifier: release.wait(5))
+
+    assert not future.cancel()
+    release.set()
+    assert future.result(timeout=5)
@@ -0,0 +1,91 @@
+import time
+from argparse import ArgumentParser
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from netspresso.inferencer import CustomInferencer
+from netspresso.inferencer.preprocessors.base import Preprocessor
+
+
+def measure(func, iterations: int, warmup: int):
+    for _ in range(warmup):
+        func()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return np.array(latencies)
+
+
+def report(name: str, latencies):
+    logger.info(
+        f"{name:<12} mean: {latencies.mean():.3f} ms, p50: {np.percentile(latencies, 50):.3f} ms, "
+        f"p95: {np.percentile(latencies, 95):.3f} ms"
+    )
+
+
+def benchmark_inference_path(inferencer: CustomInferencer, data: np.ndarray, iterations: int, warmup: int):
+    def file_path_inference():
+        dataset_path = inferencer.save_numpy_data(data=data)
+        inferencer.inference(dataset_path)
+        Path(dataset_path).unlink()
+
+    def in_memory_inference():
+        inferencer.inference(data)
+
+    report("npy file", measure(file_path_inference, iterations, warmup))
+    report("in-memory", measure(in_memory_inference, iterations, warmup))
+
+
+def benchmark_preprocessor(sizes, image_shape, iterations: int, warmup: int):
+    image = np.random.randint(0, 256, size=image_shape, dtype="uint8")
+    for size in sizes:
+        preprocessor = Preprocessor(
+            [
+                {"name": "resize", "size": size, "interpolation": "bilinear", "max_size": None, "resize_criteria": "long"},
+                {"name": "pad", "size": size, "fill": 114},
+            ]
+        )
+
+        for name, out in [("allocating", None), ("preallocated", preprocessor.allocate())]:
+            latencies = measure(partial(preprocessor, image, out=out), iterations, warmup)
+            logger.info(f"preprocess {size}x{size} {name:<12} {1000 / latencies.mean():.1f} images/sec")
+
+
+def get_args():
+    parser = ArgumentParser()
+    parser.add_argument("--model", help="Path to the ONNX or TFLite model")
+    parser.add_argument(
+        "--input-shape",
+        help="Input shape in the runtime's layout, e.g. 1,3,224,224 for ONNX or 1,224,224,3 for TFLite",
+    )
+    parser.add_argument("--dtype", default="float32", help="Input data type. Default is float32")
+    parser.add_argument("--iterations", type=int, default=100, help="Number of measured iterations")
+    parser.add_argument("--warmup", type=int, default=10, help="Number of warmup iterations")
+    parser.add_argument(
+        "--preprocess-sizes",
+        default="224,416,640",
+        help="Comma separated resize/pad sizes for the preprocessor benchmark. Used when --model is not given",
+    )
+    parser.add_argument("--image-shape", default="1080,1920,3", help="Source image shape for the preprocessor benchmark")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+    if args.model:
+        input_shape = [int(dim) for dim in args.input_shape.split(",")]
+        data = np.random.rand(*input_shape).astype(args.dtype)
+
+        inferencer = CustomInferencer(input_model_path=args.model)
+        benchmark_inference_path(inferencer, data, args.iterations, args.warmup)
+    else:
+        sizes = [int(size) for size in args.preprocess_sizes.split(",")]
+        image_shape = [int(dim) for dim in args.image_shape.split(",")]
+        benchmark_preprocessor(sizes, image_shape, args.iterations, args.warmup)